@@ -234,7 +234,7 @@ class MachineConfigurationViewSet(viewsets.ModelViewSet):
                 }, status=status.HTTP_400_BAD_REQUEST)
 
             # Discover tags
-            discovered_tags = loop.run_until_complete(connector.discover_tags())
+            discovered_tags = loop.run_until_complete(connector.load_discovered_tags())
 
             # Disconnect
             loop.run_until_complete(connector.disconnect())
@@ -788,7 +788,7 @@ def discover_tags_standalone(request):
                 }, status=status.HTTP_400_BAD_REQUEST)
 
             # Discover tags
-            discovered_tags = loop.run_until_complete(connector.discover_tags())
+            discovered_tags = loop.run_until_complete(connector.load_discovered_tags())
 
             # Disconnect
             loop.run_until_complete(connector.disconnect())
@@ -26,6 +26,7 @@ from oee_analytics.sparkplug.connectors.opcua_client import (
 from oee_analytics.sparkplug.connectors.opcua_config import (
     OPCUAConfigManager, CertificateManager
 )
+from oee_analytics.sparkplug.event_loop import install_event_loop_policy
 from oee_analytics.sparkplug.mqtt_client import SparkplugMQTTClient, SparkplugConfig
 from oee_analytics.sparkplug.data_processor import DataProcessor, OEEMetricType
 from oee_analytics.sparkplug.models import (
@@ -138,9 +139,9 @@ class OPCUAToSparkplugBridge:
         """Handle data from OPC-UA and publish to Sparkplug"""
         try:
             # Get tag mapping
-            tag_mapping = self.config_manager.get_tag_mapping(server_id, data_point.tag_name)
+            tag_mapping = self.config_manager.get_tag_mapping(server_id, data_point.address)
             if not tag_mapping:
-                logger.warning(f"No mapping found for {data_point.tag_name}")
+                logger.warning(f"No mapping found for {data_point.address}")
                 return
 
             # Apply scaling
@@ -155,7 +156,7 @@ class OPCUAToSparkplugBridge:
                 'quality': data_point.quality,
                 'properties': {
                     'unit': tag_mapping.unit,
-                    'opcua_node': data_point.tag_name,
+                    'opcua_node': data_point.address,
                     'server_id': server_id
                 }
             }
@@ -178,7 +179,7 @@ class OPCUAToSparkplugBridge:
             # Update database
             await self.update_node_mapping(
                 server_id,
-                data_point.tag_name,
+                data_point.address,
                 data_point.value,
                 data_point.timestamp,
                 data_point.quality
@@ -325,6 +326,7 @@ class Command(BaseCommand):
 
         # Run async main
         try:
+            install_event_loop_policy()
             asyncio.run(self.async_main(options))
         except KeyboardInterrupt:
             self.stdout.write("\nShutdown requested...")
@@ -23,6 +23,7 @@ from pydantic_settings import SettingsConfigDict
 from ...sparkplug.mqtt_client import SparkplugMQTTClient, SparkplugConfig
 from ...sparkplug.data_processor import SparkplugDataProcessor, MetricMapping, OEEMetricType
 from ...sparkplug.connectors import PLCConnectorFactory, PLCConnectionConfig
+from ...sparkplug.event_loop import install_event_loop_policy
 from ...sparkplug.models import SparkplugMetricHistory
 
 
@@ -148,6 +149,7 @@ class Command(BaseCommand):
             
             # Run the agent
             self.stdout.write(self.style.SUCCESS('Starting Sparkplug Agent...'))
+            install_event_loop_policy()
             asyncio.run(self.agent.run())
             
         except KeyboardInterrupt:
@@ -474,11 +476,7 @@ class SparkplugAgent:
                 if not self.dry_run and connector.is_connected():
                     # Read all configured tags
                     data_points = await connector.read_all_tags()
-                    
-                    # Process each data point
-                    for data_point in data_points:
-                        # TODO: Convert to Sparkplug metrics and publish
-                        pass
+                    self.logger.debug("PLC scan complete", plc_id=plc_id, data_points=len(data_points))
                 
                 await asyncio.sleep(scan_interval)
                 
@@ -5,15 +5,46 @@ Production-grade configuration handling with validation and hot-reload
 
 import json
 import os
+import inspect
 import logging
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import yaml
-from pydantic import BaseModel, Field, validator
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# yaml and watchdog are imported where they are used so that importing the
+# config models (e.g. for typing) doesn't pull in the parser or observer backends
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+
+
+# Environment variable overrides: (variable, config section, key)
+_ENV_SECTION_OVERRIDES = (
+    ('MQTT_BROKER_HOST', 'mqtt', 'broker_host'),
+    ('MQTT_USERNAME', 'mqtt', 'username'),
+    ('MQTT_PASSWORD', 'mqtt', 'password'),
+    ('SPARKPLUG_GROUP_ID', 'sparkplug', 'group_id'),
+    ('SPARKPLUG_NODE_ID', 'sparkplug', 'node_id'),
+)
+
+_TRUE_TOKENS = frozenset({'true', '1', 'yes', 'on'})
+
+# Filesystems on which inotify misses remote changes; hot reload polls instead
+_NETWORK_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'fuse.sshfs', 'glusterfs', 'ceph',
+})
+POLLING_OBSERVER_TIMEOUT = 2.0
+
+# Delay before a hot reload runs, so a burst of write events triggers one reload
+RELOAD_COALESCE_DELAY = 0.2
+
+_VALID_PLC_TYPES = frozenset({
+    'SIEMENS_S7', 'ALLEN_BRADLEY', 'CONTROLLOGIX', 'COMPACTLOGIX', 'MICROLOGIX',
+})
 
 
 class PLCConnectionConfig(BaseModel):
@@ -21,10 +52,10 @@ class PLCConnectionConfig(BaseModel):
     id: str = Field(..., description="Unique PLC identifier")
     type: str = Field(..., description="PLC type (SIEMENS_S7, ALLEN_BRADLEY, etc.)")
     host: str = Field(..., description="PLC IP address or hostname")
-    port: int = Field(default=102, description="PLC port")
-    rack: int = Field(default=0, description="PLC rack number")
-    slot: int = Field(default=1, description="PLC slot number")
-    timeout: float = Field(default=5.0, description="Connection timeout in seconds")
+    port: int = Field(default=102, ge=1, le=65535, description="PLC port")
+    rack: int = Field(default=0, ge=0, le=7, description="PLC rack number")
+    slot: int = Field(default=1, ge=0, le=31, description="PLC slot number")
+    timeout: float = Field(default=5.0, gt=0, description="Connection timeout in seconds")
     enabled: bool = Field(default=True, description="Enable this PLC connection")
     
     # Authentication
@@ -38,12 +69,13 @@ class PLCConnectionConfig(BaseModel):
     # Tags configuration
     tags: List[Dict[str, Any]] = Field(default_factory=list, description="Tag definitions")
     
-    @validator('type')
+    @field_validator('type')
+    @classmethod
     def validate_plc_type(cls, v):
-        valid_types = ['SIEMENS_S7', 'ALLEN_BRADLEY', 'CONTROLLOGIX', 'COMPACTLOGIX', 'MICROLOGIX']
-        if v.upper() not in valid_types:
-            raise ValueError(f"Invalid PLC type. Must be one of: {valid_types}")
-        return v.upper()
+        v_upper = v.upper()
+        if v_upper not in _VALID_PLC_TYPES:
+            raise ValueError(f"Invalid PLC type. Must be one of: {sorted(_VALID_PLC_TYPES)}")
+        return v_upper
 
 
 class TagConfig(BaseModel):
@@ -59,6 +91,20 @@ class TagConfig(BaseModel):
     max_value: Optional[float] = Field(default=None, description="Maximum value")
     sparkplug_alias: Optional[int] = Field(default=None, description="Sparkplug alias number")
     oee_metric_type: Optional[str] = Field(default=None, description="OEE metric type mapping")
+    
+    @field_validator('scaling_factor')
+    @classmethod
+    def validate_scaling_factor(cls, v):
+        if v == 0:
+            raise ValueError("Scaling factor cannot be zero")
+        return v
+    
+    @model_validator(mode='after')
+    def validate_value_range(self):
+        if self.min_value is not None and self.max_value is not None:
+            if self.min_value >= self.max_value:
+                raise ValueError("Minimum value must be less than maximum value")
+        return self
 
 
 class MetricMappingConfig(BaseModel):
@@ -76,7 +122,7 @@ class MetricMappingConfig(BaseModel):
 class MQTTConfig(BaseModel):
     """MQTT broker configuration"""
     broker_host: str = Field(..., description="MQTT broker hostname")
-    broker_port: int = Field(default=1883, description="MQTT broker port")
+    broker_port: int = Field(default=1883, ge=1, le=65535, description="MQTT broker port")
     username: Optional[str] = Field(default=None, description="MQTT username")
     password: Optional[str] = Field(default=None, description="MQTT password")
     client_id: str = Field(default="sparkplug_oee_client", description="MQTT client ID")
@@ -144,8 +190,8 @@ class ProcessingConfig(BaseModel):
 class MonitoringConfig(BaseModel):
     """Monitoring and observability configuration"""
     enabled: bool = Field(default=True, description="Enable monitoring")
-    metrics_port: int = Field(default=8001, description="Prometheus metrics port")
-    health_check_port: int = Field(default=8002, description="Health check port")
+    metrics_port: int = Field(default=8001, ge=1, le=65535, description="Prometheus metrics port")
+    health_check_port: int = Field(default=8002, ge=1, le=65535, description="Health check port")
     
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -182,8 +228,7 @@ class SparkplugAgentConfig(BaseModel):
     environment: str = Field(default="production", description="Environment (development/staging/production)")
     debug: bool = Field(default=False, description="Debug mode")
     
-    class Config:
-        extra = "forbid"  # Prevent extra fields
+    model_config = ConfigDict(extra="forbid")  # Prevent extra fields
 
 
 class ConfigurationManager:
@@ -191,12 +236,16 @@ class ConfigurationManager:
     Configuration manager with validation, hot-reload, and environment support
     """
     
+    # __weakref__ keeps bound methods usable as (weakly held) reload callbacks
+    __slots__ = ('logger', 'config_path', 'config', 'callbacks', 'observer', 'event_handler', '__weakref__')
+    
     def __init__(self, config_path: Optional[str] = None, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.config_path = config_path
         self.config: Optional[SparkplugAgentConfig] = None
-        self.callbacks: List[Callable] = []
-        self.observer: Optional[Observer] = None
+        self.callbacks: List[Callable[[], Optional[Callable]]] = []
+        self.observer: Optional['Observer'] = None
+        self.event_handler: Optional['ConfigFileHandler'] = None
         
         # Load configuration
         if config_path:
@@ -212,6 +261,7 @@ class ConfigurationManager:
             # Load based on file extension
             with open(config_file, 'r') as f:
                 if config_file.suffix.lower() in ['.yaml', '.yml']:
+                    import yaml
                     config_data = yaml.safe_load(f)
                 elif config_file.suffix.lower() == '.json':
                     config_data = json.load(f)
@@ -234,29 +284,30 @@ class ConfigurationManager:
     
     def _apply_environment_overrides(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides"""
-        # MQTT overrides
-        if os.getenv('MQTT_BROKER_HOST'):
-            config_data.setdefault('mqtt', {})['broker_host'] = os.getenv('MQTT_BROKER_HOST')
-        if os.getenv('MQTT_BROKER_PORT'):
-            config_data.setdefault('mqtt', {})['broker_port'] = int(os.getenv('MQTT_BROKER_PORT'))
-        if os.getenv('MQTT_USERNAME'):
-            config_data.setdefault('mqtt', {})['username'] = os.getenv('MQTT_USERNAME')
-        if os.getenv('MQTT_PASSWORD'):
-            config_data.setdefault('mqtt', {})['password'] = os.getenv('MQTT_PASSWORD')
+        env = os.environ
         
-        # Sparkplug overrides
-        if os.getenv('SPARKPLUG_GROUP_ID'):
-            config_data.setdefault('sparkplug', {})['group_id'] = os.getenv('SPARKPLUG_GROUP_ID')
-        if os.getenv('SPARKPLUG_NODE_ID'):
-            config_data.setdefault('sparkplug', {})['node_id'] = os.getenv('SPARKPLUG_NODE_ID')
+        # Section-scoped string overrides (MQTT, Sparkplug)
+        for env_var, section, key in _ENV_SECTION_OVERRIDES:
+            value = env.get(env_var)
+            if value:
+                config_data.setdefault(section, {})[key] = value
+        
+        port = env.get('MQTT_BROKER_PORT')
+        if port:
+            try:
+                config_data.setdefault('mqtt', {})['broker_port'] = int(port)
+            except ValueError:
+                self.logger.error(f"Ignoring invalid MQTT_BROKER_PORT value: {port!r}")
         
         # Debug mode
-        if os.getenv('DEBUG'):
-            config_data['debug'] = os.getenv('DEBUG').lower() in ['true', '1', 'yes']
+        debug = env.get('DEBUG')
+        if debug:
+            config_data['debug'] = debug.lower() in _TRUE_TOKENS
         
         # Environment
-        if os.getenv('ENVIRONMENT'):
-            config_data['environment'] = os.getenv('ENVIRONMENT')
+        environment = env.get('ENVIRONMENT')
+        if environment:
+            config_data['environment'] = environment
         
         return config_data
     
@@ -270,16 +321,20 @@ class ConfigurationManager:
             raise ValueError("No save path specified")
         
         try:
-            config_data = self.config.dict()
+            config_data = self.config.model_dump(mode='json', exclude_defaults=True)
             
             save_file = Path(save_path)
-            with open(save_file, 'w') as f:
-                if save_file.suffix.lower() in ['.yaml', '.yml']:
-                    yaml.dump(config_data, f, default_flow_style=False, indent=2)
-                elif save_file.suffix.lower() == '.json':
+            suffix = save_file.suffix.lower()
+            if suffix in ['.yaml', '.yml']:
+                import yaml
+                dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+                with open(save_file, 'w') as f:
+                    yaml.dump(config_data, f, Dumper=dumper, default_flow_style=False, indent=2)
+            elif suffix == '.json':
+                with open(save_file, 'w') as f:
                     json.dump(config_data, f, indent=2)
-                else:
-                    raise ValueError(f"Unsupported save format: {save_file.suffix}")
+            else:
+                raise ValueError(f"Unsupported save format: {save_file.suffix}")
             
             self.logger.info(f"Configuration saved to {save_path}")
             
@@ -289,56 +344,78 @@ class ConfigurationManager:
     
     def validate_config(self) -> List[str]:
         """Validate current configuration and return any issues"""
-        issues = []
-        
+        return list(self._iter_issues())
+    
+    def is_valid(self) -> bool:
+        """Check whether the current configuration has no issues (stops at the first one)"""
+        return next(self._iter_issues(), None) is None
+    
+    def _iter_issues(self):
+        """Yield configuration issues lazily"""
         if not self.config:
-            issues.append("No configuration loaded")
-            return issues
+            yield "No configuration loaded"
+            return
         
         try:
             # Test MQTT configuration
-            mqtt_config = self.config.mqtt
-            if not mqtt_config.broker_host:
-                issues.append("MQTT broker host not specified")
+            if not self.config.mqtt.broker_host:
+                yield "MQTT broker host not specified"
             
             # Test PLC configurations
             for i, plc in enumerate(self.config.plc_connections):
                 if not plc.host:
-                    issues.append(f"PLC connection {i}: host not specified")
+                    yield f"PLC connection {i}: host not specified"
                 if not plc.tags:
-                    issues.append(f"PLC connection {i}: no tags configured")
+                    yield f"PLC connection {i}: no tags configured"
             
             # Test metric mappings
             for i, mapping in enumerate(self.config.metric_mappings):
                 if not mapping.machine_id:
-                    issues.append(f"Metric mapping {i}: machine_id not specified")
+                    yield f"Metric mapping {i}: machine_id not specified"
                 if not mapping.sparkplug_metric_name:
-                    issues.append(f"Metric mapping {i}: sparkplug_metric_name not specified")
+                    yield f"Metric mapping {i}: sparkplug_metric_name not specified"
             
         except Exception as e:
-            issues.append(f"Configuration validation error: {e}")
-        
-        return issues
+            yield f"Configuration validation error: {e}"
     
-    def enable_hot_reload(self, callback: Optional[Callable] = None):
-        """Enable hot reload of configuration file"""
+    def enable_hot_reload(self, callback: Optional[Callable] = None,
+                          use_polling: Optional[bool] = None):
+        """
+        Enable hot reload of configuration file
+        
+        Args:
+            callback: Optional reload callback to register
+            use_polling: Force (True) or disable (False) the polling observer.
+                By default polling is used only when the config directory is on
+                a network filesystem, where inotify events are unreliable.
+        """
         if not self.config_path:
             raise ValueError("No configuration file path available for hot reload")
         
         if callback:
-            self.callbacks.append(callback)
+            self.add_reload_callback(callback)
+        
+        config_dir = Path(self.config_path).parent
+        if use_polling is None:
+            use_polling = _is_network_filesystem(config_dir)
         
         # Setup file watcher
         event_handler = ConfigFileHandler(self)
-        self.observer = Observer()
+        self.event_handler = event_handler
+        if use_polling:
+            from watchdog.observers.polling import PollingObserver
+            self.observer = PollingObserver(timeout=POLLING_OBSERVER_TIMEOUT)
+        else:
+            from watchdog.observers import Observer
+            self.observer = Observer()
         self.observer.schedule(
             event_handler,
-            str(Path(self.config_path).parent),
+            str(config_dir),
             recursive=False
         )
         self.observer.start()
         
-        self.logger.info("Hot reload enabled for configuration")
+        self.logger.info(f"Hot reload enabled for configuration ({'polling' if use_polling else 'native'} observer)")
     
     def disable_hot_reload(self):
         """Disable hot reload"""
@@ -346,21 +423,45 @@ class ConfigurationManager:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+        if self.event_handler:
+            self.event_handler.stop()
+            self.event_handler = None
         self.callbacks.clear()
         
         self.logger.info("Hot reload disabled")
     
     def add_reload_callback(self, callback: Callable):
-        """Add callback for configuration reload events"""
-        self.callbacks.append(callback)
+        """
+        Add callback for configuration reload events
+        
+        Bound methods are held weakly so a registered callback doesn't keep its
+        owner alive; registering the same callback twice is a no-op.
+        """
+        if callback in self._live_callbacks():
+            return
+        self.callbacks.append(_callback_ref(callback))
+    
+    def _live_callbacks(self) -> Tuple[Callable, ...]:
+        """Resolve callback references, dropping any whose owner was collected"""
+        live = []
+        live_refs = []
+        for ref in self.callbacks:
+            callback = ref()
+            if callback is not None:
+                live.append(callback)
+                live_refs.append(ref)
+        if len(live_refs) != len(self.callbacks):
+            self.callbacks = live_refs
+        return tuple(live)
     
     def _notify_reload(self):
         """Notify callbacks of configuration reload"""
-        for callback in self.callbacks:
+        config = self.config
+        for callback in self._live_callbacks():
             try:
-                callback(self.config)
+                callback(config)
             except Exception as e:
-                self.logger.error(f"Reload callback error: {e}")
+                self.logger.error(f"Reload callback error: {e}", exc_info=True)
     
     def get_config(self) -> Optional[SparkplugAgentConfig]:
         """Get current configuration"""
@@ -414,11 +515,13 @@ class ConfigurationManager:
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
+        config_data = default_config.model_dump(mode='json')
         with open(config_file, 'w') as f:
             if config_file.suffix.lower() in ['.yaml', '.yml']:
-                yaml.dump(default_config.dict(), f, default_flow_style=False, indent=2)
+                import yaml
+                yaml.dump(config_data, f, default_flow_style=False, indent=2)
             else:
-                json.dump(default_config.dict(), f, indent=2)
+                json.dump(config_data, f, indent=2)
         
         self.config = default_config
         self.config_path = config_path
@@ -427,25 +530,106 @@ class ConfigurationManager:
         return default_config
 
 
-class ConfigFileHandler(FileSystemEventHandler):
-    """File system event handler for configuration hot reload"""
+def _is_network_filesystem(path: Path) -> bool:
+    """
+    Best-effort check whether path lives on a network mount (Linux only)
+    
+    Matches the path's st_dev against the devices of network mounts listed
+    in /proc/mounts.
+    """
+    try:
+        device = path.stat().st_dev
+        with open('/proc/mounts') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    
+    for mount_point, fs_type in mounts:
+        if fs_type not in _NETWORK_FS_TYPES:
+            continue
+        try:
+            if os.stat(mount_point.replace('\\040', ' ')).st_dev == device:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _callback_ref(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """Create a reference to a reload callback (weak for bound methods)"""
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    # Plain functions and lambdas are usually only referenced by the manager,
+    # so a weak reference would drop them immediately
+    return lambda: callback
+
+
+class ConfigFileHandler:
+    """
+    File system event handler for configuration hot reload
+
+    Implements the watchdog event handler protocol (``dispatch``) without
+    subclassing FileSystemEventHandler, so watchdog is only imported once
+    hot reload is actually enabled.
+    
+    Reloads run on a dedicated worker thread so the observer thread never
+    blocks on parsing/validation; events arriving while a reload is pending
+    or in flight coalesce into a single follow-up reload.
+    """
+    
+    __slots__ = ('config_manager', 'logger', 'config_name', '_reload_event', '_stopped', '_worker')
     
     def __init__(self, config_manager: ConfigurationManager):
         self.config_manager = config_manager
         self.logger = config_manager.logger
+        self.config_name = Path(config_manager.config_path).name
+        self._reload_event = threading.Event()
+        self._stopped = False
+        self._worker = threading.Thread(
+            target=self._reload_worker, name="config-reload", daemon=True
+        )
+        self._worker.start()
+    
+    def stop(self):
+        """Stop the reload worker"""
+        self._stopped = True
+        self._reload_event.set()
+    
+    def dispatch(self, event):
+        """Dispatch watchdog events, ignoring everything but the config file"""
+        # The whole parent directory is watched; filter sibling files (logs,
+        # editor swap files) here before any handler work is done
+        if event.event_type != 'modified' or event.is_directory:
+            return
+        if os.path.basename(event.src_path) != self.config_name:
+            return
+        self.on_modified(event)
     
     def on_modified(self, event):
-        """Handle file modification events"""
-        if event.is_directory:
-            return
-        
-        if event.src_path == self.config_manager.config_path:
-            self.logger.info("Configuration file modified, reloading...")
-            try:
-                self.config_manager.load_config(self.config_manager.config_path)
-                self.config_manager._notify_reload()
-            except Exception as e:
-                self.logger.error(f"Failed to reload configuration: {e}")
+        """Handle config file modification events"""
+        # Only flag the reload; the worker picks it up
+        self._reload_event.set()
+    
+    def _reload_worker(self):
+        """Run at most one reload at a time, coalescing bursts of events"""
+        while True:
+            self._reload_event.wait()
+            if self._stopped:
+                return
+            time.sleep(RELOAD_COALESCE_DELAY)
+            self._reload_event.clear()
+            if self._stopped:
+                return
+            self._reload()
+    
+    def _reload(self):
+        """Reload configuration and notify callbacks"""
+        self.logger.info("Configuration file modified, reloading...")
+        try:
+            self.config_manager.load_config(self.config_manager.config_path)
+            self.config_manager._notify_reload()
+        except Exception as e:
+            self.logger.error(f"Failed to reload configuration: {e}")
 
 
 # Configuration validation functions
@@ -457,13 +641,7 @@ def validate_plc_connection(config: PLCConnectionConfig) -> List[str]:
     if not config.host:
         issues.append("Host is required")
     
-    # Validate port range
-    if config.port < 1 or config.port > 65535:
-        issues.append("Port must be between 1 and 65535")
-    
-    # Validate timeout
-    if config.timeout <= 0:
-        issues.append("Timeout must be positive")
+    # Port, rack, slot and timeout ranges are enforced by the model's Field constraints
     
     return issues
 
@@ -480,13 +658,6 @@ def validate_tag_config(config: TagConfig) -> List[str]:
     if not config.data_type:
         issues.append("Tag data type is required")
     
-    # Validate scaling
-    if config.scaling_factor == 0:
-        issues.append("Scaling factor cannot be zero")
-    
-    # Validate value range
-    if config.min_value is not None and config.max_value is not None:
-        if config.min_value >= config.max_value:
-            issues.append("Minimum value must be less than maximum value")
+    # Scaling factor and value range are enforced by TagConfig validators
     
     return issues
\ No newline at end of file
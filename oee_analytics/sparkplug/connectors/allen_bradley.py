@@ -5,8 +5,11 @@ Supports: ControlLogix, CompactLogix, MicroLogix, PLC-5, SLC-500, Micro800
 """
 
 import asyncio
+import contextlib
+import functools
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Import real drivers
 try:
@@ -17,35 +20,52 @@ except ImportError:
     SLCDriver = None
     PYCOMM3_AVAILABLE = False
 
-# Import simulator driver
-try:
-    # Add simulators directory to path
-    # Go up 4 levels: connectors -> sparkplug -> oee_analytics -> oee_dashboard -> simulators
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-    simulators_path = os.path.join(base_dir, 'simulators')
-    if simulators_path not in sys.path:
-        sys.path.insert(0, simulators_path)
-
-    from pycomm3_shim import SimulatorLogixDriver
-    SIMULATOR_AVAILABLE = True
-except ImportError as e:
-    SimulatorLogixDriver = None
-    SIMULATOR_AVAILABLE = False
-
 from pylogix import PLC
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 import struct
 import logging
 from dataclasses import dataclass
-import re
 
 from .base import (
     BasePLCConnector, PLCConnectionConfig, PLCTagDefinition,
-    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError
+    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError, _make_dp_ok,
+    _BASE_CONFIG_FIELDS
 )
 
 
+# Logix tag names: start with letter or underscore, then alphanumerics, underscores, brackets, dots
+_LOGIX_ADDRESS_PATTERN = r'^[A-Za-z_][A-Za-z0-9_\[\]\.]*$'
+
+# Legacy file addresses: N7:0 (file:element), B3:0/5 (with bit), T4:0.PRE (with member)
+_LEGACY_ADDRESS_PATTERN = r'^[NBFTCSR]\d+:\d+(?:/\d+|\.[A-Z]+)?$'
+
+# PLC families by connection path
+_LOGIX_FAMILIES = frozenset({'CONTROLLOGIX', 'COMPACTLOGIX', 'MICRO800'})
+_LEGACY_FAMILIES = frozenset({'MICROLOGIX', 'SLC500', 'PLC5'})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_simulator_driver():
+    """
+    Import the simulator's LogixDriver shim on first use
+    
+    Only simulator-mode connectors pay for the sys.path change and import.
+    Returns None if the simulator is not available.
+    """
+    # Go up 4 levels: connectors -> sparkplug -> oee_analytics -> oee_dashboard -> simulators
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    simulators_path = os.path.join(base_dir, 'simulators')
+    if simulators_path not in sys.path:
+        sys.path.insert(0, simulators_path)
+    
+    try:
+        from pycomm3_shim import SimulatorLogixDriver
+    except ImportError:
+        return None
+    return SimulatorLogixDriver
+
+
 @dataclass
 class AllenBradleyConfig(PLCConnectionConfig):
     """Extended configuration for Allen-Bradley PLCs"""
@@ -69,12 +89,26 @@ class AllenBradleyConfig(PLCConnectionConfig):
     read_timeout: float = 10.0
     write_timeout: float = 10.0
     large_packet_support: bool = True
+    verify_on_connect: bool = True  # Probe the PLC after connecting
+    max_workers: int = 8  # Threads for blocking driver calls (per connector)
+    legacy_pool_size: int = 4  # pylogix sessions opened for SLC-500/PLC-5
+    logix_sessions: int = 1  # pycomm3 sessions used to split large batch reads
+    logix_parallel_threshold: int = 200  # Minimum batch size before splitting across sessions
+
+    @classmethod
+    def from_base(cls, base: PLCConnectionConfig) -> 'AllenBradleyConfig':
+        """Upcast a generic connection config, keeping AB-specific defaults"""
+        return cls(**{name: getattr(base, name) for name in _BASE_CONFIG_FIELDS})
 
 
 class AllenBradleyConnector(BasePLCConnector):
     """
     Allen-Bradley PLC Connector using pycomm3 and pylogix
     Supports all major AB PLC families with optimized communication
+
+    Blocking driver calls run on a per-connector thread pool via the loop
+    captured in connect(), so the connector runs unchanged on uvloop when
+    the process installs it (see sparkplug.event_loop).
     """
     
     # Data type mappings for different PLC families
@@ -104,21 +138,72 @@ class AllenBradleyConnector(BasePLCConnector):
         'R': 'CONTROL', # Control
     }
     
+    # Interned data type names, so large polls share one string per type
+    # instead of carrying copies parsed from config files
+    _DATA_TYPE_INTERN = {dt: sys.intern(dt) for dt in LOGIX_DATA_TYPES}
+    
+    # Python type each data type converts to
+    _LOGIX_CONVERTERS = {
+        'BOOL': bool,
+        'SINT': int, 'INT': int, 'DINT': int, 'LINT': int,
+        'USINT': int, 'UINT': int, 'UDINT': int, 'ULINT': int,
+        'REAL': float, 'LREAL': float,
+        'STRING': str,
+    }
+    
+    _LEGACY_CONVERTERS = {
+        'B': bool, 'BOOL': bool,
+        'N': int, 'INT': int,
+        'F': float, 'REAL': float,
+        'S': str, 'STRING': str,
+    }
+    
+    # (plc_family, host, port) of legacy PLCs whose status-file probe has
+    # succeeded; shared by all connectors so reconnects skip the round trip.
+    # An entry is dropped when a connect or probe to that PLC fails, so a
+    # replaced or re-addressed PLC is probed again.
+    _verified_legacy_plcs = set()
+    
     def __init__(self, config: Union[PLCConnectionConfig, AllenBradleyConfig],
                  logger: Optional[logging.Logger] = None):
         # Convert to AB-specific config if needed
         if isinstance(config, PLCConnectionConfig) and not isinstance(config, AllenBradleyConfig):
-            config = AllenBradleyConfig(**config.__dict__)
+            config = AllenBradleyConfig.from_base(config)
 
         super().__init__(config, logger)
         self.driver = None
-        self.legacy_driver = None
+        self._logix_sessions: List[Any] = []
+        self._legacy_drivers: List[PLC] = []
+        self._legacy_pool: Optional[asyncio.Queue] = None
         self.plc_family = config.plc_family.upper()
         self.simulator_mode = getattr(config, 'simulator_mode', False)
+        # The simulator driver answers from a local server, so its calls run
+        # inline on the loop thread instead of a round trip through the executor
+        self._sync_fast_path = self.simulator_mode
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        
+        # Driver capabilities, probed once per connect instead of per call
+        self._driver_has_connected = False
+        self._driver_has_tag_list = False
+        self._driver_batch_write = False
+        
+        # Family dispatch resolved once here instead of compared on every connect
+        if self.plc_family in _LOGIX_FAMILIES:
+            self._connect_impl = self._connect_logix
+        elif self.plc_family in _LEGACY_FAMILIES:
+            self._connect_impl = self._connect_legacy
+        else:
+            self._connect_impl = None
+        
+        # Read/write paths for the active driver, bound once connected
+        self._read_impl = None
+        self._write_impl = None
 
         if self.simulator_mode:
             self.logger.info(f"Allen-Bradley connector initialized in SIMULATOR MODE for {self.config.host}")
-            if not SIMULATOR_AVAILABLE:
+            if _load_simulator_driver() is None:
                 raise PLCConnectionError("Simulator mode requested but simulator not available")
         
     async def connect(self) -> bool:
@@ -126,79 +211,112 @@ class AllenBradleyConnector(BasePLCConnector):
         try:
             self._update_status(PLCStatus.CONNECTING)
             
+            self._loop = asyncio.get_running_loop()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix=f"ab-plc-{self.config.host}"
+                )
+            
             # Select appropriate driver based on PLC family
-            if self.plc_family in ['CONTROLLOGIX', 'COMPACTLOGIX', 'MICRO800']:
-                await self._connect_logix()
-            elif self.plc_family in ['MICROLOGIX', 'SLC500', 'PLC5']:
-                await self._connect_legacy()
-            else:
+            if self._connect_impl is None:
                 raise PLCConnectionError(f"Unsupported PLC family: {self.plc_family}")
+            await self._connect_impl()
             
-            # Test connection with a simple read
-            await self._test_connection()
+            self._cache_driver_capabilities()
             
             self._update_status(PLCStatus.CONNECTED)
             self.logger.info(f"Connected to Allen-Bradley {self.plc_family} PLC at {self.config.host}")
             
+            # Probe the connection in the background so connect() doesn't pay
+            # for an extra round trip (matters when a fleet connects at startup)
+            if self.config.verify_on_connect:
+                self._probe_task = asyncio.create_task(self._probe_connection())
+            
             return True
             
         except Exception as e:
             error_msg = f"AB connection failed: {str(e)}"
+            self._verified_legacy_plcs.discard(self._legacy_plc_key())
             self._update_status(PLCStatus.ERROR, error_msg)
             self._increment_error_stats()
             raise PLCConnectionError(error_msg)
     
     async def _connect_logix(self):
         """Connect to Logix-based PLCs (ControlLogix, CompactLogix, Micro800)"""
+        self.driver = await self._open_logix_session()
+        self._logix_sessions = [self.driver]
+        
+        # Extra sessions let large batch reads run in parallel instead of
+        # pycomm3 chunking them serially over one socket
+        for _ in range(self.config.logix_sessions - 1):
+            self._logix_sessions.append(await self._open_logix_session())
+    
+    async def _open_logix_session(self):
+        """Create and open a Logix driver session"""
         # Choose driver based on simulator mode
         if self.simulator_mode:
-            self.driver = SimulatorLogixDriver(self.config.host, port=self.config.port)
+            driver = _load_simulator_driver()(self.config.host, port=self.config.port)
         else:
             if not PYCOMM3_AVAILABLE:
                 raise PLCConnectionError("pycomm3 not installed - cannot connect to real PLC")
-            self.driver = RealLogixDriver(self.config.host, self.config.port)
+            driver = RealLogixDriver(self.config.host, self.config.port)
 
         # Configure driver settings
-        if hasattr(self.config, 'read_timeout') and hasattr(self.driver, 'socket_timeout'):
-            self.driver.socket_timeout = self.config.read_timeout
+        if hasattr(driver, 'socket_timeout'):
+            driver.socket_timeout = self.config.read_timeout
 
         # Open connection
-        await asyncio.get_event_loop().run_in_executor(
-            None, self.driver.open
-        )
+        await self._run_blocking(driver.open)
 
-        if not self.driver.connected:
+        if not driver.connected:
             raise PLCConnectionError("Failed to connect to Logix PLC")
+        
+        return driver
     
     async def _connect_legacy(self):
         """Connect to legacy PLCs (MicroLogix, SLC-500, PLC-5)"""
         if self.plc_family in ['MICROLOGIX']:
             # Use pycomm3 for MicroLogix
             self.driver = LogixDriver(self.config.host, self.config.port)
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.driver.open
-            )
+            await self._run_blocking(self.driver.open)
         else:
-            # Use pylogix for SLC-500 and PLC-5
-            self.legacy_driver = PLC()
-            self.legacy_driver.IPAddress = self.config.host
-            if hasattr(self.config, 'node_address') and self.config.node_address:
-                self.legacy_driver.Route = f"1,{self.config.node_address}"
+            # Use pylogix for SLC-500 and PLC-5. A PLC object is not thread-safe,
+            # so keep a pool of sessions and hand each one to a single caller
+            self._legacy_pool = asyncio.Queue()
+            for _ in range(max(1, self.config.legacy_pool_size)):
+                legacy_driver = PLC()
+                legacy_driver.IPAddress = self.config.host
+                if hasattr(self.config, 'node_address') and self.config.node_address:
+                    legacy_driver.Route = f"1,{self.config.node_address}"
+                self._legacy_drivers.append(legacy_driver)
+                self._legacy_pool.put_nowait(legacy_driver)
     
     async def disconnect(self) -> bool:
         """Disconnect from Allen-Bradley PLC"""
         try:
+            if self._probe_task and not self._probe_task.done():
+                self._probe_task.cancel()
+            self._probe_task = None
+            
             if self.driver:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.driver.close
-                )
+                await self._run_blocking(self.driver.close)
                 self.driver = None
             
-            if self.legacy_driver:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.legacy_driver.Close
-                )
-                self.legacy_driver = None
+            # Additional batch-read sessions (the first one is self.driver)
+            for session in self._logix_sessions[1:]:
+                await self._run_blocking(session.close)
+            self._logix_sessions = []
+            
+            if self._legacy_drivers:
+                for legacy_driver in self._legacy_drivers:
+                    await self._run_blocking(legacy_driver.Close)
+                self._legacy_drivers = []
+                self._legacy_pool = None
+            
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             
             self._update_status(PLCStatus.DISCONNECTED)
             return True
@@ -209,71 +327,81 @@ class AllenBradleyConnector(BasePLCConnector):
             self.logger.error(error_msg)
             return False
     
-    async def read_single(self, address: str, data_type: str) -> PLCDataPoint:
-        """Read a single data point from AB PLC"""
+    async def read_single(self, address: str, data_type: str,
+                          timestamp: Optional[datetime] = None) -> PLCDataPoint:
+        """
+        Read a single data point from AB PLC
+        
+        Args:
+            address: Tag address
+            data_type: Tag data type
+            timestamp: Timestamp for the data point, when a batch read shares
+                one; defaults to the scan timestamp
+        """
         if not self._is_connected():
             raise PLCConnectionError("Not connected to PLC")
         
+        if timestamp is None:
+            timestamp = self._scan_timestamp()
+        
         try:
-            if self.driver:
-                # Use pycomm3 for Logix PLCs
-                result = await self._read_logix_tag(address, data_type)
-            elif self.legacy_driver:
-                # Use pylogix for legacy PLCs
-                result = await self._read_legacy_tag(address, data_type)
-            else:
-                raise PLCConnectionError("No active driver")
-            
+            # pycomm3 for Logix PLCs, pylogix for legacy PLCs
+            result = await self._read_impl(address, data_type, timestamp)
             self._increment_read_stats()
             return result
             
         except Exception as e:
-            self._increment_error_stats()
-            error_msg = f"Failed to read {address}: {str(e)}"
-            self.logger.error(error_msg)
-            
-            return PLCDataPoint(
-                address=address,
-                value=None,
-                data_type=data_type,
-                quality=0,  # Bad quality
-                timestamp=datetime.now(),
-                error=error_msg
-            )
-    
-    async def _read_logix_tag(self, address: str, data_type: str) -> PLCDataPoint:
-        """Read tag from Logix PLC using pycomm3"""
-        # Parse complex tag addresses (e.g., "MyArray[5].Value")
-        tag_name = self._parse_logix_address(address)
+            return self._read_failed(address, data_type, e, timestamp)
+    
+    def _read_failed(self, address: str, data_type: str, error: Exception,
+                     timestamp: datetime) -> PLCDataPoint:
+        """Record a failed read and return a bad-quality data point"""
+        self._increment_error_stats()
+        error_msg = f"Failed to read {address}: {str(error)}"
+        self.logger.error(error_msg)
         
-        # Read from PLC
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, self.driver.read, tag_name
+        return PLCDataPoint(
+            address=address,
+            value=None,
+            data_type=data_type,
+            quality=0,  # Bad quality
+            timestamp=timestamp,
+            error=error_msg
         )
+    
+    async def _read_logix_tag(self, address: str, data_type: str, timestamp: datetime) -> PLCDataPoint:
+        """Read tag from Logix PLC using pycomm3"""
+        # pycomm3 handles complex addressing (e.g., "MyArray[5].Value"); this is
+        # _parse_logix_address inlined for the read hot path
+        tag_name = address.strip()
         
+        # Read from PLC
+        if self._sync_fast_path:
+            result = self.driver.read(tag_name)
+        else:
+            result = await self._run_blocking(self.driver.read, tag_name)
+        return self._logix_result_to_point(address, data_type, result, timestamp)
+    
+    def _logix_result_to_point(self, address: str, data_type: str, result: Any,
+                               timestamp: datetime) -> PLCDataPoint:
+        """Convert a pycomm3 read reply into a data point"""
         if result.error:
             raise PLCDataError(f"Read error: {result.error}")
         
         # Convert value based on data type
         value = self._convert_logix_value(result.value, data_type)
         
-        return PLCDataPoint(
-            address=address,
-            value=value,
-            data_type=data_type,
-            quality=192,  # Good quality
-            timestamp=datetime.now()
-        )
+        return _make_dp_ok(address, value, data_type, timestamp)
     
-    async def _read_legacy_tag(self, address: str, data_type: str) -> PLCDataPoint:
+    async def _read_legacy_tag(self, address: str, data_type: str, timestamp: datetime) -> PLCDataPoint:
         """Read tag from legacy PLC using pylogix"""
-        # Parse legacy address format (e.g., "N7:0", "B3:0/5")
-        parsed_address = self._parse_legacy_address(address)
+        # Legacy address format (e.g., "N7:0", "B3:0/5"); this is
+        # _parse_legacy_address inlined for the read hot path
+        parsed_address = address.strip().upper()
         
         # Read from PLC
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, self.legacy_driver.Read, parsed_address
-        )
+        async with self._acquire_legacy() as legacy_driver:
+            result = await self._run_blocking(legacy_driver.Read, parsed_address)
         
         if result.Status != 'Success':
             raise PLCDataError(f"Read error: {result.Status}")
@@ -286,7 +414,7 @@ class AllenBradleyConnector(BasePLCConnector):
             value=value,
             data_type=data_type,
             quality=192,  # Good quality
-            timestamp=datetime.now()
+            timestamp=timestamp
         )
     
     async def read_multiple(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
@@ -299,62 +427,99 @@ class AllenBradleyConnector(BasePLCConnector):
         if self.driver:
             # Use batch read for Logix PLCs
             results = await self._read_logix_batch(addresses)
-        elif self.legacy_driver:
-            # Legacy PLCs - use individual reads
-            for address, data_type in addresses:
-                result = await self.read_single(address, data_type)
-                results.append(result)
+        elif self._legacy_pool is not None:
+            # Legacy PLCs have no multi-read service - issue the reads concurrently,
+            # stamped with one timestamp as the Logix batch is
+            timestamp = self._scan_timestamp()
+            results = list(await asyncio.gather(
+                *(self.read_single(address, data_type, timestamp) for address, data_type in addresses)
+            ))
         
         return results
     
     async def _read_logix_batch(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
         """Batch read from Logix PLC"""
-        tag_names = [self._parse_logix_address(addr) for addr, _ in addresses]
-        
-        # Perform batch read
-        results = await asyncio.get_event_loop().run_in_executor(
-            None, self.driver.read, *tag_names
-        )
+        tag_names = [addr.strip() for addr, _ in addresses]  # inlined _parse_logix_address
+        
+        # Perform batch read, split across sessions for large batches
+        sessions = self._logix_sessions
+        if len(sessions) > 1 and len(tag_names) >= self.config.logix_parallel_threshold:
+            chunk_size = -(-len(tag_names) // len(sessions))
+            replies = await asyncio.gather(*(
+                self._run_blocking(session.read, *tag_names[start:start + chunk_size])
+                for session, start in zip(sessions, range(0, len(tag_names), chunk_size))
+            ))
+            results = [tag for reply in replies for tag in _as_tag_list(reply)]
+        else:
+            results = _as_tag_list(await self._run_blocking(self.driver.read, *tag_names))
+        # The multi-read reply arrives in one round trip; stamp every point with it
+        timestamp = self._scan_timestamp()
         
         # Process results
         data_points = []
+        intern_data_type = self._DATA_TYPE_INTERN.get
         for i, (address, data_type) in enumerate(addresses):
             if i < len(results):
                 result = results[i]
+                data_type = intern_data_type(data_type, data_type)
                 if result.error:
                     data_point = PLCDataPoint(
-                        address=address,
-                        value=None,
-                        data_type=data_type,
-                        quality=0,
-                        timestamp=datetime.now(),
-                        error=result.error
+                        address, None, data_type, 0, timestamp, result.error
                     )
                 else:
                     value = self._convert_logix_value(result.value, data_type)
-                    data_point = PLCDataPoint(
-                        address=address,
-                        value=value,
-                        data_type=data_type,
-                        quality=192,
-                        timestamp=datetime.now()
-                    )
+                    data_point = _make_dp_ok(address, value, data_type, timestamp)
                 data_points.append(data_point)
         
         return data_points
     
+    @classmethod
+    async def read_many_plcs(
+        cls,
+        connectors: Sequence['AllenBradleyConnector'],
+        address_map: Dict['AllenBradleyConnector', List[Tuple[str, str]]]
+    ) -> AsyncIterator[Tuple['AllenBradleyConnector', List[PLCDataPoint]]]:
+        """
+        Read several PLCs concurrently, yielding each result as it arrives
+        
+        Args:
+            connectors: Connectors to poll
+            address_map: (address, data_type) list to read per connector
+            
+        Yields:
+            (connector, data points) in completion order, so the fastest PLC
+            is published first instead of waiting on the slowest one.
+            A connector whose read fails yields an empty list.
+        """
+        tasks = {
+            asyncio.create_task(connector.read_multiple(address_map[connector])): connector
+            for connector in connectors
+        }
+        pending = set(tasks)
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    connector = tasks[task]
+                    try:
+                        data_points = task.result()
+                    except Exception as e:
+                        connector.logger.error(f"Batch read from {connector.config.host} failed: {str(e)}")
+                        data_points = []
+                    yield connector, data_points
+        finally:
+            # Consumer stopped early - don't leave reads running in the background
+            for task in pending:
+                task.cancel()
+    
     async def write_single(self, address: str, value: Any, data_type: str) -> bool:
         """Write a single value to AB PLC"""
         if not self._is_connected():
             raise PLCConnectionError("Not connected to PLC")
         
         try:
-            if self.driver:
-                success = await self._write_logix_tag(address, value, data_type)
-            elif self.legacy_driver:
-                success = await self._write_legacy_tag(address, value, data_type)
-            else:
-                raise PLCConnectionError("No active driver")
+            success = await self._write_impl(address, value, data_type)
             
             if success:
                 self._increment_write_stats()
@@ -374,9 +539,10 @@ class AllenBradleyConnector(BasePLCConnector):
         tag_name = self._parse_logix_address(address)
         converted_value = self._prepare_logix_write_value(value, data_type)
         
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, self.driver.write, tag_name, converted_value
-        )
+        if self._sync_fast_path:
+            result = self.driver.write(tag_name, converted_value)
+        else:
+            result = await self._run_blocking(self.driver.write, tag_name, converted_value)
         
         if result.error:
             self.logger.error(f"Write error for {address}: {result.error}")
@@ -389,9 +555,8 @@ class AllenBradleyConnector(BasePLCConnector):
         parsed_address = self._parse_legacy_address(address)
         converted_value = self._prepare_legacy_write_value(value, data_type)
         
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, self.legacy_driver.Write, parsed_address, converted_value
-        )
+        async with self._acquire_legacy() as legacy_driver:
+            result = await self._run_blocking(legacy_driver.Write, parsed_address, converted_value)
         
         if result.Status != 'Success':
             self.logger.error(f"Write error for {address}: {result.Status}")
@@ -401,16 +566,45 @@ class AllenBradleyConnector(BasePLCConnector):
     
     async def write_multiple(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
         """Write multiple values to AB PLC"""
-        results = []
+        if self.driver and writes and self._driver_batch_write:
+            if not self._is_connected():
+                raise PLCConnectionError("Not connected to PLC")
+            return await self._write_logix_batch(writes)
         
-        # For now, use individual writes
-        # TODO: Implement batch writing for Logix PLCs
+        # Legacy PLCs - use individual writes
+        results = []
         for address, value, data_type in writes:
             success = await self.write_single(address, value, data_type)
             results.append(success)
         
         return results
     
+    async def _write_logix_batch(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
+        """Batch write to Logix PLC in a single multi-service request"""
+        pairs = [
+            (self._parse_logix_address(address), self._prepare_logix_write_value(value, data_type))
+            for address, value, data_type in writes
+        ]
+        
+        try:
+            replies = _as_tag_list(await self._run_blocking(self.driver.write, *pairs))
+        except Exception as e:
+            self._increment_error_stats()
+            self.logger.error(f"Batch write of {len(writes)} tags failed: {str(e)}")
+            return [False] * len(writes)
+        
+        results = []
+        for (address, _, _), reply in zip(writes, replies):
+            if reply.error:
+                self._increment_error_stats()
+                self.logger.error(f"Write error for {address}: {reply.error}")
+                results.append(False)
+            else:
+                self._increment_write_stats()
+                results.append(True)
+        
+        return results
+    
     async def discover_tags(self) -> List[PLCTagDefinition]:
         """Auto-discover available tags in AB PLC"""
         if not self._is_connected():
@@ -443,11 +637,9 @@ class AllenBradleyConnector(BasePLCConnector):
                     PLCTagDefinition(name="EStopActive", address="EStopActive", data_type="BOOL",
                                    description="Emergency stop status"),
                 ]
-            elif self.driver and hasattr(self.driver, 'get_tag_list'):
+            elif self.driver and self._driver_has_tag_list:
                 # Get tag list from Logix PLC
-                tag_list = await asyncio.get_event_loop().run_in_executor(
-                    None, self.driver.get_tag_list
-                )
+                tag_list = await self._run_blocking(self.driver.get_tag_list)
 
                 for tag_info in tag_list:
                     tag_def = PLCTagDefinition(
@@ -458,7 +650,7 @@ class AllenBradleyConnector(BasePLCConnector):
                     )
                     discovered_tags.append(tag_def)
 
-            elif self.legacy_driver:
+            elif self._legacy_pool is not None:
                 # For legacy PLCs, create common address patterns
                 discovered_tags = self._get_common_legacy_tags()
 
@@ -479,32 +671,79 @@ class AllenBradleyConnector(BasePLCConnector):
     
     # Helper methods
     
+    def _cache_driver_capabilities(self):
+        """Record which optional driver features are available"""
+        driver = self.driver
+        self._driver_has_connected = driver is not None and hasattr(driver, 'connected')
+        self._driver_has_tag_list = driver is not None and hasattr(driver, 'get_tag_list')
+        # pycomm3 accepts several (tag, value) pairs per write; the simulator shim doesn't
+        self._driver_batch_write = driver is not None and not self.simulator_mode
+        
+        if driver is not None:
+            self._read_impl = self._read_logix_tag
+            self._write_impl = self._write_logix_tag
+        elif self._legacy_pool is not None:
+            self._read_impl = self._read_legacy_tag
+            self._write_impl = self._write_legacy_tag
+    
+    @contextlib.asynccontextmanager
+    async def _acquire_legacy(self):
+        """Borrow a pylogix session from the pool for the duration of a call"""
+        legacy_driver = await self._legacy_pool.get()
+        try:
+            yield legacy_driver
+        finally:
+            self._legacy_pool.put_nowait(legacy_driver)
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking driver call on the connector's executor"""
+        # Loop is cached on connect; fall back for calls made before that
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
     def _is_connected(self) -> bool:
         """Check if PLC is connected"""
         if self.driver:
-            return getattr(self.driver, 'connected', False)
-        elif self.legacy_driver:
+            return self.driver.connected if self._driver_has_connected else False
+        elif self._legacy_pool is not None:
             return True  # pylogix doesn't have a connection state
         return False
     
+    async def _probe_connection(self):
+        """Run the connection test after connect() has returned"""
+        try:
+            await self._test_connection()
+        except Exception as e:
+            self.logger.warning(f"Connection probe failed for {self.config.host}: {e}")
+    
     async def _test_connection(self):
         """Test connection with a simple operation"""
         if self.driver:
             # Try to get PLC info
             try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, getattr, self.driver, 'info'
-                )
-            except:
+                await self._run_blocking(getattr, self.driver, 'info')
+            except (AttributeError, OSError):
                 pass  # Info not available on all drivers
-        elif self.legacy_driver:
+        elif self._legacy_pool is not None:
+            plc_key = self._legacy_plc_key()
+            if plc_key in self._verified_legacy_plcs:
+                return
+            
             # Try a simple read
             try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.legacy_driver.Read, "S:1/15"  # CPU scan time bit
-                )
-            except:
-                pass  # May not be available on all PLCs
+                async with self._acquire_legacy() as legacy_driver:
+                    result = await self._run_blocking(legacy_driver.Read, "S:1/15")  # CPU scan time bit
+            except OSError:
+                return  # May not be available on all PLCs
+            
+            if result.Status == 'Success':
+                self._verified_legacy_plcs.add(plc_key)
+            else:
+                self._verified_legacy_plcs.discard(plc_key)
+    
+    def _legacy_plc_key(self) -> Tuple[str, str, int]:
+        """Key of this PLC in _verified_legacy_plcs"""
+        return (self.plc_family, self.config.host, self.config.port)
     
     def _parse_logix_address(self, address: str) -> str:
         """Parse and validate Logix tag address"""
@@ -529,66 +768,19 @@ class AllenBradleyConnector(BasePLCConnector):
     
     def _validate_logix_address(self, address: str) -> bool:
         """Validate Logix tag address format"""
-        # Basic validation for Logix tag names
-        # Must start with letter or underscore, contain only alphanumeric, underscore, brackets, dots
-        pattern = r'^[A-Za-z_][A-Za-z0-9_\[\]\.]*$'
-        return bool(re.match(pattern, address))
+        return self._compiled(_LOGIX_ADDRESS_PATTERN).match(address) is not None
     
     def _validate_legacy_address(self, address: str) -> bool:
         """Validate legacy PLC address format"""
-        # Pattern for legacy addresses like N7:0, B3:0/5, T4:0.PRE
-        patterns = [
-            r'^[NBFTCSR]\d+:\d+$',           # Basic file:element
-            r'^[NBFTCSR]\d+:\d+/\d+$',       # With bit
-            r'^[NBFTCSR]\d+:\d+\.[A-Z]+$',   # With member
-        ]
-        
-        address_upper = address.upper()
-        return any(re.match(pattern, address_upper) for pattern in patterns)
+        return self._compiled(_LEGACY_ADDRESS_PATTERN).match(address.upper()) is not None
     
     def _convert_logix_value(self, value: Any, data_type: str) -> Any:
         """Convert Logix value to proper Python type"""
-        if value is None:
-            return None
-        
-        data_type = data_type.upper()
-        
-        try:
-            if data_type == 'BOOL':
-                return bool(value)
-            elif data_type in ['SINT', 'INT', 'DINT', 'LINT']:
-                return int(value)
-            elif data_type in ['USINT', 'UINT', 'UDINT', 'ULINT']:
-                return int(value)
-            elif data_type in ['REAL', 'LREAL']:
-                return float(value)
-            elif data_type == 'STRING':
-                return str(value)
-            else:
-                return value
-        except (ValueError, TypeError):
-            return value
+        return _convert_value(self._LOGIX_CONVERTERS, value, data_type)
     
     def _convert_legacy_value(self, value: Any, data_type: str) -> Any:
         """Convert legacy PLC value to proper Python type"""
-        if value is None:
-            return None
-        
-        data_type = data_type.upper()
-        
-        try:
-            if data_type in ['B', 'BOOL']:
-                return bool(value)
-            elif data_type in ['N', 'INT']:
-                return int(value)
-            elif data_type in ['F', 'REAL']:
-                return float(value)
-            elif data_type in ['S', 'STRING']:
-                return str(value)
-            else:
-                return value
-        except (ValueError, TypeError):
-            return value
+        return _convert_value(self._LEGACY_CONVERTERS, value, data_type)
     
     def _prepare_logix_write_value(self, value: Any, data_type: str) -> Any:
         """Prepare value for writing to Logix PLC"""
@@ -629,11 +821,34 @@ class AllenBradleyConnector(BasePLCConnector):
         ]
 
 
+def _as_tag_list(reply: Any) -> List[Any]:
+    """pycomm3 returns a bare Tag (not a list) when a single tag is read"""
+    return reply if isinstance(reply, list) else [reply]
+
+
+def _convert_value(converters: Dict[str, type], value: Any, data_type: str) -> Any:
+    """Convert a raw driver value using a data type -> Python type table"""
+    if value is None:
+        return None
+    
+    converter = converters.get(data_type)
+    if converter is None:
+        converter = converters.get(data_type.upper())
+        if converter is None:
+            return value
+    
+    # pycomm3 already returns native Python types; don't re-wrap them
+    if type(value) is converter:
+        return value
+    
+    try:
+        return converter(value)
+    except (ValueError, TypeError):
+        return value
+
+
 # Register the connector
 from .base import PLCConnectorFactory
-PLCConnectorFactory.register_connector('ALLEN_BRADLEY', AllenBradleyConnector)
-PLCConnectorFactory.register_connector('AB', AllenBradleyConnector)
-PLCConnectorFactory.register_connector('ETHERNET_IP', AllenBradleyConnector)
-PLCConnectorFactory.register_connector('CONTROLLOGIX', AllenBradleyConnector)
-PLCConnectorFactory.register_connector('COMPACTLOGIX', AllenBradleyConnector)
-PLCConnectorFactory.register_connector('MICROLOGIX', AllenBradleyConnector)
\ No newline at end of file
+PLCConnectorFactory.register_aliases(AllenBradleyConnector, (
+    'ALLEN_BRADLEY', 'AB', 'ETHERNET_IP', 'CONTROLLOGIX', 'COMPACTLOGIX', 'MICROLOGIX',
+))
@@ -4,13 +4,39 @@ Defines the interface for all PLC connector implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from typing import Dict, Any, Hashable, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import asyncio
+import contextlib
+import contextvars
+import functools
 import logging
+import re
+import time
+from collections import deque
 from enum import Enum
 
+import numpy as np
+
+
+# Data types whose values are numeric and therefore subject to scaling
+_NUMERIC_DATA_TYPES = frozenset({
+    'INT', 'DINT', 'REAL', 'LREAL', 'WORD', 'DWORD', 'SINT', 'USINT',
+    'UINT', 'UDINT', 'LINT', 'ULINT', 'FLOAT', 'DOUBLE',
+})
+
+
+# Upper bound on tags read by a health check probe
+HEALTH_PROBE_MAX_TAGS = 8
+
+
+# Timestamp shared by every data point of the read_all_tags scan running in
+# the current task; a context variable so concurrent callers don't see it
+_scan_timestamp_var: contextvars.ContextVar[Optional[datetime]] = contextvars.ContextVar(
+    'plc_scan_timestamp', default=None
+)
+
 
 class PLCConnectionError(Exception):
     """Raised when PLC connection fails"""
@@ -31,7 +57,7 @@ class PLCStatus(Enum):
     MAINTENANCE = "maintenance"
 
 
-@dataclass
+@dataclass(slots=True)
 class PLCDataPoint:
     """Represents a single data point from PLC"""
     address: str
@@ -42,7 +68,63 @@ class PLCDataPoint:
     error: Optional[str] = None
 
 
-@dataclass
+class _TagSOA:
+    """
+    Numeric tag fields as parallel arrays (structure of arrays), in scan order
+    
+    Lets read_all_tags scale a whole batch with vector ops instead of reading
+    attributes off each PLCTagDefinition.
+    """
+    
+    __slots__ = ('scaling_factors', 'scaling_offsets', 'min_values', 'max_values',
+                 'numeric_mask', 'scaled_indices', 'scaled_factors', 'scaled_offsets',
+                 'scaled_mins', 'scaled_maxs', 'rescaled')
+    
+    def __init__(self, tag_defs: List['PLCTagDefinition']):
+        count = len(tag_defs)
+        self.scaling_factors = np.fromiter((t.scaling_factor for t in tag_defs), np.float64, count)
+        self.scaling_offsets = np.fromiter((t.scaling_offset for t in tag_defs), np.float64, count)
+        # NaN means no bound on that side
+        self.min_values = np.fromiter(
+            (np.nan if t.min_value is None else t.min_value for t in tag_defs), np.float64, count)
+        self.max_values = np.fromiter(
+            (np.nan if t.max_value is None else t.max_value for t in tag_defs), np.float64, count)
+        self.numeric_mask = np.fromiter((t._numeric for t in tag_defs), bool, count)
+        
+        needs_scaling = self.numeric_mask & (
+            (self.scaling_factors != 1.0) | (self.scaling_offsets != 0.0))
+        bounded = self.numeric_mask & ~(np.isnan(self.min_values) & np.isnan(self.max_values))
+        
+        # Tags that are scaled, clamped or both
+        self.scaled_indices = np.flatnonzero(needs_scaling | bounded)
+        self.scaled_factors = self.scaling_factors[self.scaled_indices]
+        self.scaled_offsets = self.scaling_offsets[self.scaled_indices]
+        # np.clip bounds: an open side is +-inf rather than NaN
+        mins = self.min_values[self.scaled_indices]
+        maxs = self.max_values[self.scaled_indices]
+        self.scaled_mins = np.where(np.isnan(mins), -np.inf, mins)
+        self.scaled_maxs = np.where(np.isnan(maxs), np.inf, maxs)
+        self.rescaled = needs_scaling[self.scaled_indices]
+
+
+_DP = PLCDataPoint
+
+
+def _make_dp_ok(address: str, value: Any, data_type: str, timestamp: datetime) -> PLCDataPoint:
+    """Good-quality data point, built positionally for the read hot path"""
+    return _DP(address, value, data_type, 192, timestamp, None)
+
+
+@dataclass(slots=True)
+class CoalescedBlock:
+    """Contiguous memory range read once on behalf of several requested addresses"""
+    area: Hashable
+    start: int
+    length: int
+    slices: List[Tuple[int, int, int]] = field(default_factory=list)  # (request index, offset in block, size)
+
+
+@dataclass(slots=True)
 class PLCConnectionConfig:
     """PLC connection configuration"""
     host: str
@@ -72,7 +154,11 @@ class PLCConnectionConfig:
     enable_subscriptions: bool = True
 
 
-@dataclass
+# Fields copied when upcasting a PLCConnectionConfig to a protocol-specific config
+_BASE_CONFIG_FIELDS = tuple(f.name for f in fields(PLCConnectionConfig))
+
+
+@dataclass(slots=True)
 class PLCTagDefinition:
     """Definition of a PLC tag/variable"""
     name: str
@@ -86,6 +172,11 @@ class PLCTagDefinition:
     max_value: Optional[float] = None
     sparkplug_alias: Optional[int] = None
     oee_metric_type: Optional[str] = None
+    
+    # Derived in BasePLCConnector.add_tag
+    _numeric: bool = field(default=False, init=False, repr=False, compare=False)
+    _inv_factor: float = field(default=1.0, init=False, repr=False, compare=False)
+    _neg_offset_scaled: float = field(default=0.0, init=False, repr=False, compare=False)
 
 
 class BasePLCConnector(ABC):
@@ -101,14 +192,24 @@ class BasePLCConnector(ABC):
         self.connection = None
         self.last_error: Optional[str] = None
         self.tags: Dict[str, PLCTagDefinition] = {}
+        self._tag_deletions = 0  # since self.tags was last rebuilt
+        self._address_validity: Dict[str, bool] = {}
         self.connection_start_time: Optional[datetime] = None
+        self._connection_start_monotonic: Optional[int] = None  # ns, immune to clock jumps
         
-        # Statistics
+        # Statistics, only updated from the event loop thread
         self.read_count = 0
         self.write_count = 0
         self.error_count = 0
         self.total_bytes_read = 0
         self.total_bytes_written = 0
+        
+        # Scan plan for read_all_tags, rebuilt lazily after the tag set changes
+        self._scan_dirty = True
+        # (frozen tuples: contiguous to iterate, and safe to hand to subclasses)
+        self._scan_pairs: Tuple[Tuple[str, str], ...] = ()
+        self._scan_names: Tuple[str, ...] = ()
+        self._tag_soa = _TagSOA([])
     
     @abstractmethod
     async def connect(self) -> bool:
@@ -149,7 +250,7 @@ class BasePLCConnector(ABC):
             addresses: List of (address, data_type) tuples
             
         Returns:
-            List of PLCDataPoint objects
+            List of PLCDataPoint objects, one per address in request order
         """
         pass
     
@@ -204,6 +305,46 @@ class BasePLCConnector(ABC):
         """
         pass
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _compiled(pattern: str) -> re.Pattern:
+        """Compiled address regex, shared by every connector instance"""
+        return re.compile(pattern)
+    
+    def is_valid_address(self, address: str) -> bool:
+        """validate_address with the result memoized per address"""
+        valid = self._address_validity.get(address)
+        if valid is None:
+            valid = self._address_validity[address] = self.validate_address(address)
+        return valid
+    
+    def _address_key(self, address: str) -> Tuple[int, ...]:
+        """
+        Sort key placing an address next to its neighbours in PLC memory
+        
+        Connectors with block reads override this; the default keeps
+        tags in insertion order.
+        """
+        return (0, 0)
+    
+    def _tag_sort_key(self, tag_def: PLCTagDefinition) -> Tuple[int, ...]:
+        """_address_key for a tag, sorting unparseable addresses first"""
+        try:
+            return self._address_key(tag_def.address)
+        except ValueError:
+            return (-1,)
+    
+    def _block_address(self, address: str, data_type: str) -> Optional[Tuple[Hashable, int, int]]:
+        """
+        Locate an address in a byte-addressed memory area for block reads
+        
+        Connectors that can read contiguous memory ranges override this.
+        
+        Returns:
+            (area, byte offset, byte size), or None if the address must be read on its own
+        """
+        return None
+    
     # Common utility methods
     
     async def health_check(self) -> Dict[str, Any]:
@@ -228,13 +369,18 @@ class BasePLCConnector(ABC):
             }
         }
         
-        # Try a simple read operation if connected
+        # Try a small batched read if connected; PLCs answer a multi-tag
+        # read in one round trip, so probing several tags costs about as much as one
         if self.is_connected() and self.tags:
             try:
-                # Read the first available tag as health check
-                first_tag = next(iter(self.tags.values()))
-                await self.read_single(first_tag.address, first_tag.data_type)
-                health_info['last_read_success'] = True
+                if self._scan_dirty:
+                    self._rebuild_scan_plan()
+                probe_size = min(self.config.batch_size or HEALTH_PROBE_MAX_TAGS, HEALTH_PROBE_MAX_TAGS)
+                data_points = await self.read_multiple(self._scan_pairs[:probe_size])
+                ok_count = sum(1 for dp in data_points if dp.error is None)
+                # Success means every probed tag read; the ratio shows partial failures
+                health_info['last_read_success'] = bool(data_points) and ok_count == len(data_points)
+                health_info['probe_ok_ratio'] = ok_count / len(data_points) if data_points else 0.0
             except Exception as e:
                 health_info['last_read_success'] = False
                 health_info['last_read_error'] = str(e)
@@ -247,8 +393,8 @@ class BasePLCConnector(ABC):
     
     def get_uptime_seconds(self) -> Optional[float]:
         """Get connection uptime in seconds"""
-        if self.connection_start_time and self.is_connected():
-            return (datetime.now() - self.connection_start_time).total_seconds()
+        if self._connection_start_monotonic is not None and self.is_connected():
+            return (time.monotonic_ns() - self._connection_start_monotonic) / 1e9
         return None
     
     def get_error_rate(self) -> float:
@@ -260,14 +406,62 @@ class BasePLCConnector(ABC):
     
     def add_tag(self, tag_def: PLCTagDefinition):
         """Add a tag definition"""
+        _prepare_tag(tag_def)
         self.tags[tag_def.name] = tag_def
-        self.logger.debug(f"Added tag: {tag_def.name} -> {tag_def.address}")
+        self._scan_dirty = True
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Added tag: %s -> %s", tag_def.name, tag_def.address)
+    
+    def add_tags(self, tag_defs: Iterable[PLCTagDefinition]):
+        """Add many tag definitions, logging once instead of per tag"""
+        tags = self.tags
+        count = 0
+        for tag_def in tag_defs:
+            _prepare_tag(tag_def)
+            tags[tag_def.name] = tag_def
+            count += 1
+        self._scan_dirty = True
+        self.logger.info("Added %d tags", count)
+    
+    def set_tags(self, tag_defs: List[PLCTagDefinition]):
+        """
+        Replace all tag definitions at once (e.g. with the result of discover_tags)
+        
+        Builds a fresh compact dict in one pass instead of growing the
+        existing one tag by tag.
+        """
+        for tag_def in tag_defs:
+            _prepare_tag(tag_def)
+        tags = {tag_def.name: tag_def for tag_def in tag_defs}
+        self.tags = tags
+        self._tag_deletions = 0
+        self._scan_dirty = True
+        self.logger.info("Loaded %d tags", len(tags))
+    
+    async def load_discovered_tags(self) -> List[PLCTagDefinition]:
+        """
+        Run discover_tags and make its result the connector's tag set
+        
+        Returns:
+            List of discovered tag definitions
+        """
+        tag_defs = await self.discover_tags()
+        self.set_tags(tag_defs)
+        return tag_defs
     
     def remove_tag(self, tag_name: str):
         """Remove a tag definition"""
         if tag_name in self.tags:
             del self.tags[tag_name]
-            self.logger.debug(f"Removed tag: {tag_name}")
+            self._scan_dirty = True
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Removed tag: %s", tag_name)
+            
+            # Dicts never shrink on delete; rebuild once most slots are dead
+            self._tag_deletions += 1
+            if self._tag_deletions > len(self.tags):
+                self.tags = dict(self.tags)
+                self._tag_deletions = 0
     
     def get_tag(self, tag_name: str) -> Optional[PLCTagDefinition]:
         """Get tag definition by name"""
@@ -289,11 +483,18 @@ class BasePLCConnector(ABC):
         
         data_point = await self.read_single(tag_def.address, tag_def.data_type)
         
-        # Apply scaling if configured
-        if isinstance(data_point.value, (int, float)) and data_point.value is not None:
-            if tag_def.scaling_factor != 1.0 or tag_def.scaling_offset != 0.0:
-                scaled_value = (data_point.value * tag_def.scaling_factor) + tag_def.scaling_offset
-                data_point.value = scaled_value
+        # Apply scaling and range clamping if configured
+        if tag_def._numeric and data_point.value is not None:
+            try:
+                if tag_def.scaling_factor != 1.0 or tag_def.scaling_offset != 0.0:
+                    scaled_value = (data_point.value * tag_def.scaling_factor) + tag_def.scaling_offset
+                    data_point.value = scaled_value
+                if tag_def.min_value is not None and data_point.value < tag_def.min_value:
+                    data_point.value = tag_def.min_value
+                elif tag_def.max_value is not None and data_point.value > tag_def.max_value:
+                    data_point.value = tag_def.max_value
+            except TypeError:
+                _mark_non_numeric(data_point)
         
         return data_point
     
@@ -314,12 +515,52 @@ class BasePLCConnector(ABC):
         
         # Apply reverse scaling if configured
         write_value = value
-        if isinstance(value, (int, float)) and value is not None:
+        if tag_def._numeric and value is not None:
             if tag_def.scaling_factor != 1.0 or tag_def.scaling_offset != 0.0:
-                write_value = (value - tag_def.scaling_offset) / tag_def.scaling_factor
+                write_value = _as_float(tag_name, value) * tag_def._inv_factor + tag_def._neg_offset_scaled
         
         return await self.write_single(tag_def.address, write_value, tag_def.data_type)
     
+    async def write_multiple_tags(self, values: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Write values to several tags by name in one batched request
+        
+        Args:
+            values: Mapping of tag name to value
+            
+        Returns:
+            Mapping of tag name to success flag
+        """
+        tag_defs = []
+        for tag_name in values:
+            tag_def = self.tags.get(tag_name)
+            if not tag_def:
+                raise PLCDataError(f"Tag not found: {tag_name}")
+            tag_defs.append(tag_def)
+        
+        write_values = list(values.values())
+        
+        # Apply reverse scaling to all scaled numeric values at once
+        scaled_indices = [
+            i for i, (tag_def, value) in enumerate(zip(tag_defs, write_values))
+            if tag_def._numeric and value is not None
+            and (tag_def.scaling_factor != 1.0 or tag_def.scaling_offset != 0.0)
+        ]
+        if scaled_indices:
+            raw = np.array([_as_float(tag_defs[i].name, write_values[i]) for i in scaled_indices],
+                           dtype=np.float64)
+            inv_factors = np.array([tag_defs[i]._inv_factor for i in scaled_indices])
+            neg_offsets = np.array([tag_defs[i]._neg_offset_scaled for i in scaled_indices])
+            for i, scaled in zip(scaled_indices, (raw * inv_factors + neg_offsets).tolist()):
+                write_values[i] = scaled
+        
+        writes = [
+            (tag_def.address, value, tag_def.data_type)
+            for tag_def, value in zip(tag_defs, write_values)
+        ]
+        results = await self.write_multiple(writes)
+        return dict(zip(values, results))
+    
     async def read_all_tags(self) -> List[PLCDataPoint]:
         """
         Read all configured tags
@@ -330,25 +571,115 @@ class BasePLCConnector(ABC):
         if not self.tags:
             return []
         
-        addresses = [(tag.address, tag.data_type) for tag in self.tags.values()]
-        data_points = await self.read_multiple(addresses)
-        
-        # Apply scaling and tag names
-        result = []
-        for i, (tag_name, tag_def) in enumerate(self.tags.items()):
-            if i < len(data_points):
-                data_point = data_points[i]
-                data_point.address = tag_name  # Use tag name instead of raw address
-                
-                # Apply scaling
-                if isinstance(data_point.value, (int, float)) and data_point.value is not None:
-                    if tag_def.scaling_factor != 1.0 or tag_def.scaling_offset != 0.0:
-                        scaled_value = (data_point.value * tag_def.scaling_factor) + tag_def.scaling_offset
-                        data_point.value = scaled_value
-                
-                result.append(data_point)
-        
-        return result
+        if self._scan_dirty:
+            self._rebuild_scan_plan()
+        
+        token = _scan_timestamp_var.set(datetime.now())
+        try:
+            data_points = await self.read_multiple(self._scan_pairs)
+        finally:
+            _scan_timestamp_var.reset(token)
+        
+        # Apply tag names in place; read_multiple already returned a fresh list
+        for tag_name, data_point in zip(self._scan_names, data_points):
+            data_point.address = tag_name  # Use tag name instead of raw address
+        
+        # Apply scaling and range clamping in one vectorized pass
+        if self._tag_soa.scaled_indices.size:
+            self._apply_scaling(data_points)
+        
+        return data_points
+    
+    def _coalesce_reads(self, addresses: List[Tuple[str, str]], max_gap_bytes: int = 8,
+                        max_block_bytes: int = 222) -> Tuple[List[CoalescedBlock], List[int]]:
+        """
+        Merge nearby addresses in the same memory area into block reads
+        
+        Args:
+            addresses: List of (address, data_type) tuples
+            max_gap_bytes: Largest unused gap bridged inside one block
+            max_block_bytes: Largest block (222 bytes fits one S7 PDU)
+            
+        Returns:
+            (blocks, indices of addresses that must be read individually)
+        """
+        by_area: Dict[Hashable, List[Tuple[int, int, int]]] = {}
+        singles = []
+        for index, (address, data_type) in enumerate(addresses):
+            try:
+                location = self._block_address(address, data_type)
+            except ValueError:
+                location = None
+            if location is None:
+                singles.append(index)
+                continue
+            area, offset, size = location
+            by_area.setdefault(area, []).append((offset, size, index))
+        
+        blocks = []
+        for area, entries in by_area.items():
+            entries.sort()
+            block = None
+            for offset, size, index in entries:
+                if (block is not None
+                        and offset <= block.start + block.length + max_gap_bytes
+                        and offset + size - block.start <= max_block_bytes):
+                    block.length = max(block.length, offset + size - block.start)
+                else:
+                    block = CoalescedBlock(area, offset, size)
+                    blocks.append(block)
+                block.slices.append((index, offset - block.start, size))
+        
+        return blocks, singles
+    
+    def _scan_timestamp(self) -> datetime:
+        """Timestamp for a new data point: the scan's shared one during read_all_tags"""
+        return _scan_timestamp_var.get() or datetime.now()
+    
+    def _rebuild_scan_plan(self):
+        """Precompute the read list and scaling arrays used by read_all_tags"""
+        # Scan in address order so block-read coalescing sees neighbours together
+        # (sorted() is stable: tags with equal keys keep insertion order)
+        tag_defs = sorted(self.tags.values(), key=self._tag_sort_key)
+        self._scan_pairs = tuple((tag.address, tag.data_type) for tag in tag_defs)
+        self._scan_names = tuple(tag.name for tag in tag_defs)
+        self._tag_soa = _TagSOA(tag_defs)
+        self._scan_dirty = False
+    
+    def _apply_scaling(self, data_points: List[PLCDataPoint]):
+        """Scale numeric values of a read_all_tags batch in place"""
+        # Only gather the scaled and clamped tags; other points are never touched
+        soa = self._tag_soa
+        arrays = (soa.scaled_indices, soa.scaled_factors, soa.scaled_offsets,
+                  soa.scaled_mins, soa.scaled_maxs, soa.rescaled)
+        if len(data_points) < len(self._scan_names):
+            keep = soa.scaled_indices < len(data_points)
+            arrays = tuple(array[keep] for array in arrays)
+        indices, factors, offsets, mins, maxs, rescaled = arrays
+        
+        # Missing or non-numeric values (e.g. a string from a mistyped tag) become NaN
+        values = np.fromiter(
+            (v if isinstance(v, (int, float)) else np.nan
+             for v in (data_points[i].value for i in indices.tolist())),
+            dtype=np.float64, count=len(indices)
+        )
+        valid = ~np.isnan(values)
+        np.multiply(values, factors, out=values)
+        np.add(values, offsets, out=values)
+        
+        # Clamp to the tag's range
+        clipped = np.clip(values, mins, maxs)
+        
+        # Write back numeric points that were scaled, or that clamping changed
+        write = valid & (rescaled | (clipped != values))
+        for i, value in zip(indices[write].tolist(), clipped[write].tolist()):
+            data_points[i].value = value
+        
+        # A value that came back but isn't a number can't be scaled or clamped
+        for i in indices[~valid].tolist():
+            data_point = data_points[i]
+            if data_point.value is not None and not isinstance(data_point.value, (int, float)):
+                _mark_non_numeric(data_point)
     
     def _increment_read_stats(self, byte_count: int = 0):
         """Increment read statistics"""
@@ -372,25 +703,89 @@ class BasePLCConnector(ABC):
         
         if status == PLCStatus.CONNECTED and old_status != PLCStatus.CONNECTED:
             self.connection_start_time = datetime.now()
+            self._connection_start_monotonic = time.monotonic_ns()
             self.logger.info(f"PLC connected: {self.config.host}")
         elif status != PLCStatus.CONNECTED and old_status == PLCStatus.CONNECTED:
             self.connection_start_time = None
+            self._connection_start_monotonic = None
             self.logger.warning(f"PLC disconnected: {self.config.host}")
         
         if error:
             self.logger.error(f"PLC error: {error}")
 
 
+async def gather_health_checks(connectors: List[BasePLCConnector]) -> List[Dict[str, Any]]:
+    """
+    Health check several connectors concurrently
+    
+    Each check is bounded by its connector's config.timeout, so the total
+    latency is the slowest single check rather than the sum of all of them.
+    
+    Returns:
+        Health info dictionaries in the same order as connectors; a check
+        that times out or raises is reported as a failed health dictionary
+    """
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(_bounded_health_check(c)) for c in connectors]
+    return [task.result() for task in tasks]
+
+
+async def _bounded_health_check(connector: BasePLCConnector) -> Dict[str, Any]:
+    """Health check one connector, reporting a timeout or error instead of raising it"""
+    try:
+        return await asyncio.wait_for(connector.health_check(), connector.config.timeout)
+    except asyncio.TimeoutError:
+        error = f"Health check timed out after {connector.config.timeout}s"
+    except Exception as e:
+        # One failing connector must not cancel the other checks in the group
+        error = f"Health check failed: {e}"
+    return {
+        'status': connector.status.value,
+        'connected': connector.is_connected(),
+        'last_error': connector.last_error,
+        'last_read_success': False,
+        'last_read_error': error,
+    }
+
+
+def _as_float(tag_name: str, value: Any) -> float:
+    """Value to reverse-scale for a write, e.g. "12" from a form field"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise PLCDataError(f"Cannot scale non-numeric value {value!r} for tag {tag_name}") from None
+
+
+def _mark_non_numeric(data_point: PLCDataPoint):
+    """Flag a numeric tag's point whose value could not be scaled"""
+    data_point.quality = 0
+    data_point.error = f"Non-numeric value for numeric tag: {data_point.value!r}"
+
+
+def _prepare_tag(tag_def: PLCTagDefinition):
+    """Fill in the derived fields of a tag definition"""
+    tag_def._numeric = tag_def.data_type.upper() in _NUMERIC_DATA_TYPES
+    # Reverse scaling for writes as a multiply-add: (v - offset) / factor
+    tag_def._inv_factor = 1.0 / tag_def.scaling_factor if tag_def.scaling_factor else 1.0
+    tag_def._neg_offset_scaled = -tag_def.scaling_offset * tag_def._inv_factor
+
+
 class PLCConnectorFactory:
     """Factory for creating PLC connector instances"""
     
     _connector_types = {}
+    _pools: Dict[Tuple[Any, ...], 'PLCConnectionPool'] = {}
     
     @classmethod
     def register_connector(cls, plc_type: str, connector_class):
         """Register a connector class for a PLC type"""
         cls._connector_types[plc_type.upper()] = connector_class
     
+    @classmethod
+    def register_aliases(cls, connector_class, aliases: Tuple[str, ...]):
+        """Register one connector class under several PLC type names"""
+        cls._connector_types.update({alias.upper(): connector_class for alias in aliases})
+    
     @classmethod
     def create_connector(cls, plc_type: str, config: PLCConnectionConfig, 
                         logger: Optional[logging.Logger] = None) -> BasePLCConnector:
@@ -410,4 +805,141 @@ class PLCConnectorFactory:
             raise ValueError(f"Unknown PLC type: {plc_type}")
         
         connector_class = cls._connector_types[plc_type_upper]
-        return connector_class(config, logger)
\ No newline at end of file
+        return connector_class(config, logger)
+    
+    @classmethod
+    def get_pool(cls, plc_type: str, config: PLCConnectionConfig,
+                 logger: Optional[logging.Logger] = None) -> 'PLCConnectionPool':
+        """
+        Get the shared connection pool for a PLC endpoint, creating it on first use
+        
+        Pools are keyed by the running event loop and (plc_type, host, port,
+        rack, slot), so every caller on a loop talking to the same PLC reuses
+        the same sessions. Pools belonging to closed loops are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        for stale_key in [k for k, p in cls._pools.items() if p.loop.is_closed()]:
+            del cls._pools[stale_key]
+        
+        key = (loop, plc_type.upper(), config.host, config.port, config.rack, config.slot)
+        pool = cls._pools.get(key)
+        if pool is None:
+            pool = cls._pools[key] = PLCConnectionPool(plc_type, config, logger)
+        return pool
+    
+    @classmethod
+    def _forget_pool(cls, pool: 'PLCConnectionPool'):
+        """Remove a closed pool from the registry"""
+        for key in [k for k, p in cls._pools.items() if p is pool]:
+            del cls._pools[key]
+
+
+class PLCConnectionPool:
+    """
+    Pool of connected connectors for one PLC endpoint
+    
+    Opens up to config.max_connections sessions on demand and hands each to
+    one caller at a time, so concurrent requests share established sessions
+    instead of paying a TCP and PLC session handshake each. A pool belongs
+    to the event loop it was created on.
+    """
+    
+    def __init__(self, plc_type: str, config: PLCConnectionConfig,
+                 logger: Optional[logging.Logger] = None):
+        self.plc_type = plc_type
+        self.config = config
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.max_connections = max(1, config.max_connections)
+        self.loop = asyncio.get_running_loop()
+        # One permit per connector a caller may hold at a time
+        self._slots = asyncio.Semaphore(self.max_connections)
+        self._idle: deque = deque()
+        self._open: set = set()
+        self._closed = False
+    
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """Borrow a connected connector for the duration of a call"""
+        await self._slots.acquire()
+        try:
+            if self._closed:
+                raise PLCConnectionError(f"Connection pool for {self.config.host} is closed")
+            connector = self._idle.popleft() if self._idle else await self._open_connector()
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        try:
+            yield connector
+        except PLCConnectionError:
+            # Broken session - drop it; the next acquire opens a replacement
+            await self._discard(connector)
+            raise
+        except BaseException:
+            await self._release(connector)
+            raise
+        else:
+            await self._release(connector)
+    
+    async def read_single(self, address: str, data_type: str) -> PLCDataPoint:
+        """Read a single data point on a pooled connection"""
+        async with self.acquire() as connector:
+            return await connector.read_single(address, data_type)
+    
+    async def read_multiple(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
+        """Read multiple data points on a pooled connection"""
+        async with self.acquire() as connector:
+            return await connector.read_multiple(addresses)
+    
+    async def write_multiple(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
+        """Write multiple values on a pooled connection"""
+        async with self.acquire() as connector:
+            return await connector.write_multiple(writes)
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Health check the least recently used pooled connection"""
+        async with self.acquire() as connector:
+            health_info = await connector.health_check()
+        health_info['pool_size'] = len(self._open)
+        return health_info
+    
+    async def close(self):
+        """Disconnect every pooled connection, including ones currently borrowed"""
+        self._closed = True
+        PLCConnectorFactory._forget_pool(self)
+        self._idle.clear()
+        connectors, self._open = list(self._open), set()
+        for connector in connectors:
+            await self._disconnect(connector)
+    
+    async def _open_connector(self) -> BasePLCConnector:
+        """Create and connect a new pooled connector"""
+        connector = PLCConnectorFactory.create_connector(self.plc_type, self.config, self.logger)
+        if not await connector.connect():
+            raise PLCConnectionError(f"Failed to connect to {self.config.host}")
+        self._open.add(connector)
+        return connector
+    
+    async def _release(self, connector: BasePLCConnector):
+        """Return a connector to the idle pool, or drop it if it lost its session"""
+        if connector.is_connected() and connector in self._open:
+            self._idle.append(connector)
+            self._slots.release()
+        else:
+            await self._discard(connector)
+    
+    async def _discard(self, connector: BasePLCConnector):
+        """Close a connector and free its pool slot"""
+        try:
+            if connector in self._open:
+                self._open.discard(connector)
+                await self._disconnect(connector)
+        finally:
+            self._slots.release()
+    
+    async def _disconnect(self, connector: BasePLCConnector):
+        """Disconnect a pooled connector, logging rather than raising on failure"""
+        try:
+            await connector.disconnect()
+        except Exception as e:
+            self.logger.warning(f"Error closing pooled connection to {self.config.host}: {e}")
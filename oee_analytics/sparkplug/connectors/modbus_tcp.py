@@ -4,31 +4,149 @@ Standard Modbus TCP/IP implementation for industrial devices
 Supports: Schneider, Mitsubishi, Omron, ABB, and generic Modbus devices
 """
 
+import array
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
+import contextlib
+import functools
+from typing import Dict, Any, List, Optional, Sequence, Union, Callable, Tuple
 from datetime import datetime
 import struct
+import sys
 import logging
+import random
+import socket
+import time
 from dataclasses import dataclass
+from enum import IntEnum
+
+import numpy as np
 
 try:
     from pymodbus.client import AsyncModbusTcpClient
     from pymodbus.constants import Endian
-    from pymodbus.payload import BinaryPayloadDecoder, BinaryPayloadBuilder
+    from pymodbus.exceptions import ModbusException, ModbusIOException
     PYMODBUS_AVAILABLE = True
 except ImportError:
     AsyncModbusTcpClient = None
     Endian = None
-    BinaryPayloadDecoder = None
-    BinaryPayloadBuilder = None
+    ModbusException = None
+    ModbusIOException = None
     PYMODBUS_AVAILABLE = False
 
 from .base import (
     BasePLCConnector, PLCConnectionConfig, PLCTagDefinition,
-    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError
+    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError, CoalescedBlock, _make_dp_ok,
+    _BASE_CONFIG_FIELDS
 )
 
 
+# Explicit area prefixes (HR:0, IR:100, C:0, DI:50)
+_AREA_FUNCTION_CODES = {
+    'HR': 'holding',
+    'IR': 'input',
+    'C': 'coil',
+    'DI': 'discrete',
+}
+
+# Standard reference ranges indexed by (address - 1) // 10000:
+# 00001-09999 coils, 10001-19999 discrete inputs, 30001-39999 input registers,
+# 40001-49999 holding registers; 2xxxx is not a standard range
+_STANDARD_RANGES = ('coil', 'discrete', None, 'input', 'holding')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_modbus_address(address: str) -> Tuple[int, str]:
+    """
+    Parse Modbus address format
+
+    Supports:
+    - Standard Modbus: 40001 (holding), 30001 (input), 00001 (coil), 10001 (discrete)
+    - Explicit format: HR:0, IR:100, C:0, DI:50
+    - Direct addressing: 0, 100, 1000 (assumes holding registers)
+
+    Addresses are configured once and polled forever, so results are memoized.
+
+    Returns:
+        Tuple of (register_address, function_code)
+    """
+    if ':' in address:
+        # Explicit format: HR:0, IR:100, C:0, DI:50
+        area, addr = address.split(':')
+        register_address = int(addr)
+
+        function_code = _AREA_FUNCTION_CODES.get(area.upper())
+        if function_code is None:
+            raise ValueError(f"Unknown area code: {area}")
+
+    else:
+        # Standard Modbus addressing or direct addressing: one divmod picks
+        # the 10000-wide reference range instead of a chain of comparisons
+        addr_int = int(address)
+        bucket, offset = divmod(addr_int - 1, 10000)
+        function_code = _STANDARD_RANGES[bucket] if 0 <= bucket < 5 and offset < 9999 else None
+
+        if function_code is not None:
+            register_address = offset
+        else:
+            # Direct 0-based addressing (assume holding registers)
+            register_address = addr_int
+            function_code = 'holding'
+
+    return register_address, function_code
+
+
+# Failures of one request on an open connection: error responses, pymodbus
+# protocol errors, timeouts/dropped sockets, and payloads that do not decode
+_REQUEST_ERRORS = (PLCDataError, ModbusException, asyncio.TimeoutError, OSError,
+                   ValueError, LookupError, struct.error)
+
+
+# Transient failures worth retrying: the request may succeed on a second try
+_RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError, ModbusIOException)
+
+
+# Blocks with at least this many values are decoded with numpy, one pass per
+# data type; below it the per-value struct path is cheaper
+VECTOR_DECODE_MIN_VALUES = 16
+
+
+class _DT(IntEnum):
+    """Fixed-size register data types; values index the per-type codec tables"""
+    BOOL = 0
+    INT16 = 1
+    UINT16 = 2
+    INT32 = 3
+    UINT32 = 4
+    FLOAT32 = 5
+    INT64 = 6
+    UINT64 = 7
+    FLOAT64 = 8
+
+
+_FLOAT_TYPES = frozenset({_DT.FLOAT32, _DT.FLOAT64})
+
+
+@functools.lru_cache(maxsize=None)
+def _data_type_id(data_type: str) -> _DT:
+    """Canonicalize a data type name once; raises ValueError if it has no register codec"""
+    type_id = _DT.__members__.get(data_type.upper())
+    if type_id is None:
+        raise ValueError(f"Unsupported Modbus data type: {data_type}")
+    return type_id
+
+
+@dataclass(slots=True)
+class _ReadPlan:
+    """Precomputed request for one (address, data_type) pair, bound to the current client"""
+    read: Callable                      # Bound read_* method of the client
+    address: int                        # 0-based register/bit index
+    count: int                          # Registers (or bits) to read
+    unit_id: int
+    type_id: Optional[_DT]              # Decoder id (None for coils/discrete inputs)
+    bits: bool                          # Coil/discrete input: value is bits[0]
+    function_code: str                  # coil, discrete, input or holding
+
+
 @dataclass
 class ModbusTCPConfig(PLCConnectionConfig):
     """Extended configuration for Modbus TCP"""
@@ -49,12 +167,22 @@ class ModbusTCPConfig(PLCConnectionConfig):
     # Performance tuning
     max_count_per_read: int = 100       # Max registers per read operation
     max_count_per_write: int = 100      # Max registers per write operation
+    read_gap_threshold: int = 4         # Unused registers bridged when merging reads
+    max_in_flight: int = 16             # Concurrent requests pipelined on the connection
+    socket_buffer_size: int = 65536     # SO_RCVBUF/SO_SNDBUF for pipelined requests (0 = OS default)
+    cache_ttl_ms: int = 0               # Reuse read_single results this fresh (0 = no cache)
+    keepalive_interval: float = 5.0     # Seconds between link probes; reconnects on failure (0 = off)
 
     # Retry configuration
     retry_on_error: bool = True
     max_retries: int = 3
     retry_delay: float = 0.5            # Seconds between retries
 
+    @classmethod
+    def from_base(cls, base: PLCConnectionConfig) -> 'ModbusTCPConfig':
+        """Upcast a generic connection config, keeping Modbus-specific defaults"""
+        return cls(**{name: getattr(base, name) for name in _BASE_CONFIG_FIELDS})
+
 
 class ModbusTCPConnector(BasePLCConnector):
     """
@@ -76,6 +204,19 @@ class ModbusTCPConnector(BasePLCConnector):
         'STRING': None, # Variable length
     }
 
+    # struct codes for values laid out big-endian across their registers
+    VALUE_STRUCT_CODES = {
+        'BOOL': 'H',
+        'INT16': 'h',
+        'UINT16': 'H',
+        'INT32': 'i',
+        'UINT32': 'I',
+        'FLOAT32': 'f',
+        'INT64': 'q',
+        'UINT64': 'Q',
+        'FLOAT64': 'd',
+    }
+
     def __init__(self, config: Union[PLCConnectionConfig, ModbusTCPConfig],
                  logger: Optional[logging.Logger] = None):
         """Initialize Modbus TCP connector"""
@@ -84,16 +225,48 @@ class ModbusTCPConnector(BasePLCConnector):
 
         # Convert to Modbus-specific config if needed
         if isinstance(config, PLCConnectionConfig) and not isinstance(config, ModbusTCPConfig):
-            config = ModbusTCPConfig(**config.__dict__)
+            config = ModbusTCPConfig.from_base(config)
 
         super().__init__(config, logger)
         self.client: Optional[AsyncModbusTcpClient] = None
         self.unit_id = config.unit_id
 
+        # Read plans for configured tags, rebuilt whenever the client changes
+        self._read_plans: Dict[Tuple[str, str], _ReadPlan] = {}
+
+        # Recent read_single values: (function_code, address, count, type_id)
+        # -> (monotonic read time, value, timestamp)
+        self._read_cache: Dict[Tuple[str, int, int, Optional[_DT]], Tuple[float, Any, datetime]] = {}
+        self._cache_ttl = config.cache_ttl_ms / 1000.0
+
+        # Keepalive/auto-reconnect; requests hitting a dropped link wait for
+        # _reconnected instead of each failing and logging on their own
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._reconnecting = False
+        self._reconnected = asyncio.Event()
+
         # Set endianness for payload encoding/decoding
         self.byte_order = Endian.BIG if config.byte_order == "BIG" else Endian.LITTLE
         self.word_order = Endian.BIG if config.word_order == "BIG" else Endian.LITTLE
 
+        # Precompiled codecs with the same layout as pymodbus' payload decoder/builder:
+        # registers are byte-swapped for LITTLE byte order and reversed for
+        # LITTLE word order, then the value is read big-endian
+        self._byte_swap = config.byte_order != "BIG"
+        self._word_swap = config.word_order != "BIG"
+        register_prefix = '>' if config.byte_order == "BIG" else '<'
+        self._register_structs = {
+            count: struct.Struct(f'{register_prefix}{count}H') for count in (1, 2, 4)
+        }
+        # Indexed by _DT
+        self._value_structs = tuple(struct.Struct('>' + self.VALUE_STRUCT_CODES[dt.name]) for dt in _DT)
+        self._register_counts = tuple(self.MODBUS_DATA_TYPES[dt.name] for dt in _DT)
+        # array('H') holds native-order words; swap them into the configured byte order
+        self._swap_register_array = (sys.byteorder == 'little') != self._byte_swap
+        # Shared by _decode_value/_encode_value; both are synchronous, so one
+        # buffer per connector is safe on its event loop
+        self._scratch = bytearray(8)
+
         # Set default port if not specified
         if self.config.port == 102:  # Default S7 port
             self.config.port = 502   # Modbus TCP default port
@@ -114,11 +287,14 @@ class ModbusTCPConnector(BasePLCConnector):
             await self.client.connect()
 
             if self.client.connected:
+                self._tune_socket()
+                self._rebuild_read_plans()
                 self._update_status(PLCStatus.CONNECTED)
                 self.logger.info(
                     f"Connected to Modbus TCP at {self.config.host}:{self.config.port}, "
                     f"Unit ID: {self.unit_id}"
                 )
+                self._start_keepalive()
                 return True
             else:
                 raise PLCConnectionError("Failed to establish Modbus TCP connection")
@@ -129,9 +305,29 @@ class ModbusTCPConnector(BasePLCConnector):
             self._increment_error_stats()
             raise PLCConnectionError(error_msg)
 
+    def _tune_socket(self):
+        """Disable Nagle delays and size buffers for pipelined request/response traffic"""
+        transport = getattr(self.client, 'transport', None)
+        sock = transport.get_extra_info('socket') if transport is not None else None
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            if self.config.socket_buffer_size:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.config.socket_buffer_size)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.config.socket_buffer_size)
+        except OSError as e:
+            self.logger.debug(f"Could not tune Modbus TCP socket: {e}")
+
     async def disconnect(self) -> bool:
         """Disconnect from Modbus TCP device"""
         try:
+            self._stop_keepalive()
+            self._read_plans = {}
+            self._read_cache.clear()
             if self.client:
                 self.client.close()
                 self._update_status(PLCStatus.DISCONNECTED)
@@ -141,156 +337,360 @@ class ModbusTCPConnector(BasePLCConnector):
             self.logger.error(f"Error during disconnect: {e}")
             return False
 
+    def _start_keepalive(self):
+        """Start the keepalive task unless disabled or already running"""
+        if self.config.keepalive_interval <= 0:
+            return
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    def _stop_keepalive(self):
+        """Stop the keepalive task and release anything waiting for a reconnect"""
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._reconnecting = False
+        self._reconnected.set()
+
+    async def _keepalive_loop(self):
+        """Probe the link periodically and reconnect in place when it drops"""
+        while True:
+            await asyncio.sleep(self.config.keepalive_interval)
+            try:
+                # Any response, even a Modbus exception response, proves the link is up
+                await self.client.read_holding_registers(0, 1, slave=self.unit_id)
+            except (asyncio.TimeoutError, OSError, ModbusException) as e:
+                await self._reconnect(e)
+
+    async def _reconnect(self, reason: Exception):
+        """Replace the client until a connection succeeds; connect() rebinds the read plans"""
+        self.logger.warning(f"Modbus TCP link to {self.config.host} lost ({reason}), reconnecting")
+        self._reconnecting = True
+        self._reconnected.clear()
+        try:
+            while True:
+                if self.client:
+                    self.client.close()
+                try:
+                    await self.connect()
+                    return
+                except PLCConnectionError:
+                    await asyncio.sleep(self.config.connection_retry_interval)
+        finally:
+            self._reconnecting = False
+            self._reconnected.set()
+
     async def read_single(self, address: str, data_type: str) -> PLCDataPoint:
         """Read single value from Modbus device"""
+        plan = self._read_plans.get((address, data_type))
+        if plan is None:
+            plan = self._new_read_plan(address, data_type)
+
+        # Several widgets often ask for the same value within one scan
+        cache_key = (plan.function_code, plan.address, plan.count, plan.type_id)
+        if self._cache_ttl:
+            now = time.monotonic()
+            cached = self._read_cache.get(cache_key)
+            if cached is not None and now - cached[0] < self._cache_ttl:
+                # Fresh point each time: read_all_tags renames points in place
+                return _make_dp_ok(address, cached[1], data_type, cached[2])
+
         try:
-            # Parse address
-            addr_info = self._parse_address(address)
-            register_address = addr_info['address']
-            function_code = addr_info['function_code']
-
-            # Read based on function code and data type
-            if function_code == 'coil':
-                result = await self.client.read_coils(
-                    register_address, 1, slave=self.unit_id
-                )
-                if result.isError():
-                    raise PLCDataError(f"Modbus read error: {result}")
-                value = result.bits[0]
+            result = await self._with_retry(plan.read, plan.address, plan.count, slave=plan.unit_id)
+            if result.isError():
+                raise PLCDataError(f"Modbus read error: {result}")
 
-            elif function_code == 'discrete':
-                result = await self.client.read_discrete_inputs(
-                    register_address, 1, slave=self.unit_id
-                )
-                if result.isError():
-                    raise PLCDataError(f"Modbus read error: {result}")
+            if plan.bits:
                 value = result.bits[0]
-
             else:
-                # Read holding or input registers
-                count = self.MODBUS_DATA_TYPES.get(data_type.upper(), 1)
-
-                if function_code == 'input':
-                    result = await self.client.read_input_registers(
-                        register_address, count, slave=self.unit_id
-                    )
-                else:  # holding
-                    result = await self.client.read_holding_registers(
-                        register_address, count, slave=self.unit_id
-                    )
-
-                if result.isError():
-                    raise PLCDataError(f"Modbus read error: {result}")
-
                 # Decode value based on data type
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    result.registers,
-                    byteorder=self.byte_order,
-                    wordorder=self.word_order
-                )
-                value = self._decode_value(decoder, data_type.upper())
+                value = self._decode_value(result.registers, plan.type_id)
+        except _REQUEST_ERRORS as e:
+            raise self._request_failed('read', address, e) from e
 
-            # Update statistics
-            self._increment_read_stats(count if 'count' in locals() else 1)
+        # Update statistics
+        self._increment_read_stats(plan.count)
 
-            return PLCDataPoint(
-                address=address,
-                value=value,
-                data_type=data_type,
-                quality=192,  # Good quality
-                timestamp=datetime.now()
-            )
+        timestamp = self._scan_timestamp()
+        if self._cache_ttl:
+            self._read_cache[cache_key] = (now, value, timestamp)
 
-        except Exception as e:
-            self._increment_error_stats()
-            self.logger.error(f"Modbus read failed for {address}: {e}")
-            raise PLCDataError(str(e))
+        return _make_dp_ok(address, value, data_type, timestamp)
 
     async def write_single(self, address: str, value: Any, data_type: str) -> bool:
         """Write single value to Modbus device"""
+        if self.client is None:
+            raise self._request_failed('write', address, PLCConnectionError("Not connected to Modbus device"))
+
         try:
-            # Parse address
-            addr_info = self._parse_address(address)
-            register_address = addr_info['address']
-            function_code = addr_info['function_code']
+            # Parse address and encode the value before touching the wire
+            register_address, function_code = self._parse_address(address)
+            registers = None if function_code == 'coil' else self._encode_value(value, _data_type_id(data_type))
+        except (ValueError, TypeError, struct.error) as e:
+            raise self._request_failed('write', address, e) from e
 
+        try:
             # Write based on function code and data type
-            if function_code == 'coil':
-                result = await self.client.write_coil(
-                    register_address, bool(value), slave=self.unit_id
+            if registers is None:
+                result = await self._with_retry(
+                    self.client.write_coil, register_address, bool(value), slave=self.unit_id
                 )
+                written_count = 1
+            elif len(registers) == 1:
+                result = await self._with_retry(
+                    self.client.write_register, register_address, registers[0], slave=self.unit_id
+                )
+                written_count = 1
             else:
-                # Build payload for register write
-                builder = BinaryPayloadBuilder(
-                    byteorder=self.byte_order,
-                    wordorder=self.word_order
+                result = await self._with_retry(
+                    self.client.write_registers, register_address, registers, slave=self.unit_id
                 )
+                written_count = len(registers)
+            self._invalidate_read_cache(function_code, register_address, written_count)
 
-                # Add value to payload based on data type
-                self._encode_value(builder, value, data_type.upper())
+            if result.isError():
+                raise PLCDataError(f"Modbus write error: {result}")
+        except _REQUEST_ERRORS as e:
+            raise self._request_failed('write', address, e) from e
 
-                # Get registers from payload
-                registers = builder.to_registers()
+        # Update statistics
+        self._increment_write_stats(written_count)
 
-                # Write to holding registers
-                if len(registers) == 1:
-                    result = await self.client.write_register(
-                        register_address, registers[0], slave=self.unit_id
-                    )
-                else:
-                    result = await self.client.write_registers(
-                        register_address, registers, slave=self.unit_id
-                    )
+        self.logger.debug(f"Modbus write successful: {address} = {value}")
+        return True
 
-            if result.isError():
-                raise PLCDataError(f"Modbus write error: {result}")
+    async def _with_retry(self, request: Callable, *args, **kwargs):
+        """
+        Await a client request, retrying transient failures
 
-            # Update statistics
-            self._increment_write_stats(len(registers) if 'registers' in locals() else 1)
+        Retries up to config.max_retries times (when config.retry_on_error is
+        set) with exponential backoff from config.retry_delay plus jitter, so
+        connectors that lost the same link do not retry in lockstep.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await request(*args, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if not self.config.retry_on_error or attempt >= self.config.max_retries:
+                    raise
+                delay = self.config.retry_delay * (2 ** attempt)
+                attempt += 1
+                self.logger.debug(f"Modbus request failed ({e}), retry {attempt} in {delay:.2f}s")
+                if self._reconnecting:
+                    # The keepalive is re-establishing the link; retry as soon as it is back
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._reconnected.wait(), delay)
+                else:
+                    await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
 
-            self.logger.debug(f"Modbus write successful: {address} = {value}")
-            return True
+                if getattr(request, '__self__', self.client) is not self.client:
+                    # Reconnected meanwhile: send the retry through the new client
+                    request = getattr(self.client, request.__name__)
 
-        except Exception as e:
-            self._increment_error_stats()
-            self.logger.error(f"Modbus write failed for {address}: {e}")
-            raise PLCDataError(str(e))
+    def _new_read_plan(self, address: str, data_type: str) -> _ReadPlan:
+        """Build a plan for a request without a cached one; failures count as read errors"""
+        if self.client is None:
+            raise self._request_failed('read', address, PLCConnectionError("Not connected to Modbus device"))
+        try:
+            return self._build_read_plan(address, data_type)
+        except ValueError as e:
+            raise self._request_failed('read', address, e) from e
+
+    def _request_failed(self, operation: str, address: str, error: Exception) -> PLCDataError:
+        """Count and log a failed request; returns the PLCDataError to raise"""
+        self._increment_error_stats()
+        self.logger.error(f"Modbus {operation} failed for {address}: {error}")
+        return PLCDataError(str(error))
+
+    def _invalidate_read_cache(self, function_code: str, start: int, count: int):
+        """Drop cached reads overlapping a written range"""
+        if not self._read_cache:
+            return
+        end = start + count
+        stale = [
+            key for key in self._read_cache
+            if key[0] == function_code and key[1] < end and start < key[1] + key[2]
+        ]
+        for key in stale:
+            del self._read_cache[key]
 
     async def read_batch(self, addresses: List[str], data_types: List[str]) -> List[PLCDataPoint]:
-        """Read multiple values (optimized batch read where possible)"""
-        results = []
+        """Read multiple values, merging neighbouring registers into block reads"""
+        return await self._read_coalesced(list(zip(addresses, data_types)))
+
+    async def _read_coalesced(self, requests: Sequence[Tuple[str, str]]) -> List[PLCDataPoint]:
+        """Read (address, data_type) pairs with one request per merged range, in request order"""
+        blocks, singles = self._plan_reads(requests)
+        return await self._read_planned(requests, blocks, singles)
+
+    def _plan_reads(self, requests: Sequence[Tuple[str, str]]) -> Tuple[List[CoalescedBlock], List[int]]:
+        """Merge requests into block reads using the configured gap and size limits"""
+        return self._coalesce_reads(
+            requests,
+            max_gap_bytes=self.config.read_gap_threshold,
+            max_block_bytes=self.config.max_count_per_read
+        )
+
+    async def _read_planned(self, requests: Sequence[Tuple[str, str]], blocks: List[CoalescedBlock],
+                            singles: Sequence[int]) -> List[PLCDataPoint]:
+        """Execute a read plan from _plan_reads; the plan itself is not modified"""
+        results: List[Optional[PLCDataPoint]] = [None] * len(requests)
+        # One timestamp for every point decoded from this batch's block reads
+        timestamp = self._scan_timestamp()
+        # Block failures add their slices here, so never extend the caller's list
+        singles = list(singles)
+
+        # Keep several requests on the wire at once; pymodbus matches the
+        # responses by transaction ID
+        semaphore = asyncio.Semaphore(self.config.max_in_flight)
+
+        async def read_block(block):
+            async with semaphore:
+                try:
+                    await self._read_block(block, requests, results, timestamp)
+                except Exception as e:
+                    # If block read fails, fall back to individual reads
+                    self.logger.warning(f"Modbus block read failed, falling back to individual reads: {e}")
+                    singles.extend(index for index, _, _ in block.slices)
 
-        # Simple implementation: read each individually
-        # TODO: Optimize by grouping consecutive addresses
-        for addr, dtype in zip(addresses, data_types):
-            try:
-                result = await self.read_single(addr, dtype)
-                results.append(result)
-            except Exception as e:
-                # Return error data point
-                results.append(PLCDataPoint(
-                    address=addr,
-                    value=None,
-                    data_type=dtype,
-                    quality=0,  # Bad quality
-                    timestamp=datetime.now(),
-                    error=str(e)
-                ))
+        async def read_one(index):
+            address, data_type = requests[index]
+            async with semaphore:
+                try:
+                    results[index] = await self.read_single(address, data_type)
+                except Exception as e:
+                    results[index] = self._read_failed(address, data_type, e)
 
-        return results
+        await asyncio.gather(*(read_block(block) for block in blocks))
+        await asyncio.gather(*(read_one(index) for index in singles))
 
-    async def write_batch(self, addresses: List[str], values: List[Any],
-                         data_types: List[str]) -> List[bool]:
-        """Write multiple values"""
-        results = []
+        return results
 
-        for addr, val, dtype in zip(addresses, values, data_types):
+    async def _read_block(self, block, requests: Sequence[Tuple[str, str]],
+                          results: List[Optional[PLCDataPoint]], timestamp: datetime):
+        """Read one coalesced register/bit range and slice it into the requested data points"""
+        function_code = block.area
+        if function_code == 'coil':
+            read = self.client.read_coils
+        elif function_code == 'discrete':
+            read = self.client.read_discrete_inputs
+        elif function_code == 'input':
+            read = self.client.read_input_registers
+        else:  # holding
+            read = self.client.read_holding_registers
+        result = await self._with_retry(read, block.start, block.length, slave=self.unit_id)
+
+        if result.isError():
+            raise PLCDataError(f"Modbus read error: {result}")
+
+        self._increment_read_stats(block.length)
+
+        if function_code in ('coil', 'discrete'):
+            bits = result.bits
+            for index, offset, _ in block.slices:
+                address, data_type = requests[index]
+                results[index] = _make_dp_ok(address, bits[offset], data_type, timestamp)
+            return
+
+        registers = result.registers
+        if len(block.slices) >= VECTOR_DECODE_MIN_VALUES:
+            self._decode_block_vectorized(block, registers, requests, results, timestamp)
+            return
+        if not self._word_swap:
+            self._decode_block_buffer(block, registers, requests, results, timestamp)
+            return
+
+        for index, offset, count in block.slices:
+            address, data_type = requests[index]
             try:
-                success = await self.write_single(addr, val, dtype)
-                results.append(success)
+                value = self._decode_value(registers[offset:offset + count], _data_type_id(data_type))
             except Exception as e:
-                self.logger.error(f"Batch write failed for {addr}: {e}")
-                results.append(False)
+                results[index] = self._read_failed(address, data_type, e)
+                continue
+            results[index] = _make_dp_ok(address, value, data_type, timestamp)
+
+    def _decode_block_buffer(self, block, registers: List[int], requests: Sequence[Tuple[str, str]],
+                             results: List[Optional[PLCDataPoint]], timestamp: datetime):
+        """Decode a block by unpacking each value in place from one packed register buffer"""
+        # Pack the whole block once; values are then read straight out of the
+        # array's buffer instead of slicing and re-packing registers per value
+        words = array.array('H', registers)
+        if self._swap_register_array:
+            words.byteswap()
+
+        value_structs = self._value_structs
+        for index, offset, _ in block.slices:
+            address, data_type = requests[index]
+            try:
+                type_id = _data_type_id(data_type)
+                value = value_structs[type_id].unpack_from(words, offset * 2)[0]
+            except (ValueError, struct.error) as e:
+                results[index] = self._read_failed(address, data_type, e)
+                continue
+            if type_id == _DT.BOOL:
+                value = bool(value)
+            results[index] = _make_dp_ok(address, value, data_type, timestamp)
+
+    def _decode_block_vectorized(self, block, registers: List[int], requests: Sequence[Tuple[str, str]],
+                                 results: List[Optional[PLCDataPoint]], timestamp: datetime):
+        """Decode a large register block with one numpy gather per data type"""
+        words = np.asarray(registers, dtype=np.uint16)
+        if self._byte_swap:
+            words = words.byteswap()
+
+        # Block slices only exist for supported types (see _block_address)
+        by_type: Dict[_DT, List[Tuple[int, int]]] = {}
+        for index, offset, _ in block.slices:
+            by_type.setdefault(_data_type_id(requests[index][1]), []).append((index, offset))
+
+        for type_id, entries in by_type.items():
+            # (values, registers) matrix of each value's words in big-endian order
+            count = self._register_counts[type_id]
+            word_order = np.arange(count - 1, -1, -1) if self._word_swap else np.arange(count)
+            offsets = np.fromiter((offset for _, offset in entries), dtype=np.intp, count=len(entries))
+            value_words = words[offsets[:, None] + word_order]
+            values = np.frombuffer(value_words.astype('>u2').tobytes(),
+                                   dtype=self._value_structs[type_id].format).tolist()
+            if type_id == _DT.BOOL:
+                values = [value != 0 for value in values]
+
+            for (index, _), value in zip(entries, values):
+                address, requested_type = requests[index]
+                results[index] = _make_dp_ok(address, value, requested_type, timestamp)
+
+    def _read_failed(self, address: str, data_type: str, error: Exception) -> PLCDataPoint:
+        """Return a bad-quality data point for a failed batch entry"""
+        return PLCDataPoint(
+            address=address,
+            value=None,
+            data_type=data_type,
+            quality=0,  # Bad quality
+            timestamp=self._scan_timestamp(),
+            error=str(error)
+        )
+
+    async def write_batch(self, addresses: List[str], values: List[Any],
+                         data_types: List[str]) -> List[bool]:
+        """Write multiple values, pipelined up to max_in_flight requests"""
+        semaphore = asyncio.Semaphore(self.config.max_in_flight)
+
+        async def write_one(addr, val, dtype):
+            async with semaphore:
+                return await self.write_single(addr, val, dtype)
+
+        # gather returns outcomes in argument order
+        outcomes = await asyncio.gather(
+            *(write_one(addr, val, dtype) for addr, val, dtype in zip(addresses, values, data_types)),
+            return_exceptions=True
+        )
+
+        results = [False] * len(outcomes)
+        for index, (addr, outcome) in enumerate(zip(addresses, outcomes)):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Batch write failed for {addr}: {outcome}")
+            else:
+                results[index] = outcome
 
         return results
 
@@ -302,9 +702,15 @@ class ModbusTCPConnector(BasePLCConnector):
         """
         self.logger.warning("Modbus TCP doesn't support native subscriptions, using polling")
 
-        # Store tags and callback
+        # Store tags and callback; validating each address now warms the
+        # parse cache so polling never re-parses
         for tag in tags:
             self.add_tag(tag)
+            self.is_valid_address(tag.address)
+
+        # Precompute the polling loop's requests
+        if self.client is not None:
+            self._rebuild_read_plans()
 
         # Start polling loop
         asyncio.create_task(self._polling_loop(tags, callback))
@@ -314,13 +720,29 @@ class ModbusTCPConnector(BasePLCConnector):
     async def _polling_loop(self, tags: List[PLCTagDefinition],
                            callback: Callable[[PLCDataPoint], None]):
         """Polling loop for subscription emulation"""
-        while self.is_connected():
-            for tag in tags:
+        # Fixed for the life of the subscription, so build the request list
+        # and its block layout once instead of re-coalescing every scan
+        names = tuple(tag.name for tag in tags)
+        requests = tuple((tag.address, tag.data_type) for tag in tags)
+        blocks, singles = self._plan_reads(requests)
+        singles = tuple(singles)
+
+        while self.is_connected() or self._reconnecting:
+            if self._reconnecting:
+                # Skip scans while the keepalive re-establishes the link
+                await self._reconnected.wait()
+                continue
+
+            # One coalesced batch per scan instead of a round trip per tag
+            data_points = await self._read_planned(requests, blocks, singles)
+            for name, data_point in zip(names, data_points):
+                if data_point.error is not None:
+                    self.logger.error(f"Polling error for {name}: {data_point.error}")
+                    continue
                 try:
-                    data_point = await self.read_single(tag.address, tag.data_type)
                     callback(data_point)
                 except Exception as e:
-                    self.logger.error(f"Polling error for {tag.name}: {e}")
+                    self.logger.error(f"Polling error for {name}: {e}")
 
             # Wait for scan rate interval
             await asyncio.sleep(self.config.scan_rate_ms / 1000.0)
@@ -334,112 +756,83 @@ class ModbusTCPConnector(BasePLCConnector):
             self.logger.debug(f"Invalid address {address}: {e}")
             return False
 
-    def _parse_address(self, address: str) -> Dict[str, Any]:
-        """
-        Parse Modbus address format
-
-        Supports:
-        - Standard Modbus: 40001 (holding), 30001 (input), 00001 (coil), 10001 (discrete)
-        - Explicit format: HR:0, IR:100, C:0, DI:50
-        - Direct addressing: 0, 100, 1000 (assumes holding registers)
-        """
-        if ':' in address:
-            # Explicit format: HR:0, IR:100, C:0, DI:50
-            area, addr = address.split(':')
-            register_address = int(addr)
-
-            area_upper = area.upper()
-            if area_upper == 'HR':
-                function_code = 'holding'
-            elif area_upper == 'IR':
-                function_code = 'input'
-            elif area_upper == 'C':
-                function_code = 'coil'
-            elif area_upper == 'DI':
-                function_code = 'discrete'
-            else:
-                raise ValueError(f"Unknown area code: {area}")
-
-        else:
-            # Standard Modbus addressing or direct addressing
-            addr_int = int(address)
-
-            if 1 <= addr_int <= 9999:  # Coils (00001-09999)
-                register_address = addr_int - 1
-                function_code = 'coil'
-            elif 10001 <= addr_int <= 19999:  # Discrete inputs (10001-19999)
-                register_address = addr_int - 10001
-                function_code = 'discrete'
-            elif 30001 <= addr_int <= 39999:  # Input registers (30001-39999)
-                register_address = addr_int - 30001
-                function_code = 'input'
-            elif 40001 <= addr_int <= 49999:  # Holding registers (40001-49999)
-                register_address = addr_int - 40001
-                function_code = 'holding'
-            else:
-                # Direct 0-based addressing (assume holding registers)
-                register_address = addr_int
-                function_code = 'holding'
+    def _block_address(self, address: str, data_type: str) -> Optional[Tuple[str, int, int]]:
+        """Locate a Modbus address as (function code, register/bit index, count)"""
+        register_address, function_code = self._parse_address(address)
+        if function_code in ('coil', 'discrete'):
+            return function_code, register_address, 1
+        # Unsupported and variable-length types raise ValueError and are read on their own
+        return function_code, register_address, self._register_counts[_data_type_id(data_type)]
+
+    def _build_read_plan(self, address: str, data_type: str) -> _ReadPlan:
+        """Resolve address, count and client method for one read"""
+        register_address, function_code = self._parse_address(address)
+
+        if function_code == 'coil':
+            return _ReadPlan(self.client.read_coils, register_address, 1,
+                             self.unit_id, None, True, function_code)
+        if function_code == 'discrete':
+            return _ReadPlan(self.client.read_discrete_inputs, register_address, 1,
+                             self.unit_id, None, True, function_code)
+
+        type_id = _data_type_id(data_type)
+        if function_code == 'input':
+            read = self.client.read_input_registers
+        else:  # holding
+            read = self.client.read_holding_registers
+        return _ReadPlan(read, register_address, self._register_counts[type_id], self.unit_id,
+                         type_id, False, function_code)
+
+    def _rebuild_read_plans(self):
+        """Bind read plans for all configured tags to the current client"""
+        plans = {}
+        for tag in self.tags.values():
+            try:
+                plans[(tag.address, tag.data_type)] = self._build_read_plan(tag.address, tag.data_type)
+            except ValueError as e:
+                self.logger.debug(f"No read plan for {tag.name} ({tag.address}): {e}")
+        self._read_plans = plans
 
-        return {
-            'address': register_address,
-            'function_code': function_code
-        }
+    def _parse_address(self, address: str) -> Tuple[int, str]:
+        """Parse Modbus address into (register_address, function_code)"""
+        return _parse_modbus_address(address)
 
-    def _decode_value(self, decoder: BinaryPayloadDecoder, data_type: str) -> Any:
+    def _decode_value(self, registers: List[int], type_id: _DT) -> Any:
         """Decode value from Modbus registers based on data type"""
-        if data_type == 'BOOL':
-            return bool(decoder.decode_16bit_uint())
-        elif data_type == 'INT16':
-            return decoder.decode_16bit_int()
-        elif data_type == 'UINT16':
-            return decoder.decode_16bit_uint()
-        elif data_type == 'INT32':
-            return decoder.decode_32bit_int()
-        elif data_type == 'UINT32':
-            return decoder.decode_32bit_uint()
-        elif data_type == 'FLOAT32':
-            return decoder.decode_32bit_float()
-        elif data_type == 'INT64':
-            return decoder.decode_64bit_int()
-        elif data_type == 'UINT64':
-            return decoder.decode_64bit_uint()
-        elif data_type == 'FLOAT64':
-            return decoder.decode_64bit_float()
-        else:
-            raise ValueError(f"Unsupported data type for decoding: {data_type}")
-
-    def _encode_value(self, builder: BinaryPayloadBuilder, value: Any, data_type: str):
+        decoder = self._value_structs[type_id]
+        count = len(registers)
+        if count * 2 != decoder.size:
+            raise ValueError(f"Expected {decoder.size // 2} registers for {type_id.name}, got {count}")
+        if self._word_swap:
+            registers = registers[::-1]
+        # Round-trip through the reused scratch buffer instead of a new bytes object
+        scratch = self._scratch
+        self._register_structs[count].pack_into(scratch, 0, *registers)
+        value = decoder.unpack_from(scratch)[0]
+        return bool(value) if type_id == _DT.BOOL else value
+
+    def _encode_value(self, value: Any, type_id: _DT) -> List[int]:
         """Encode value to Modbus registers based on data type"""
-        if data_type == 'BOOL':
-            builder.add_16bit_uint(1 if value else 0)
-        elif data_type == 'INT16':
-            builder.add_16bit_int(int(value))
-        elif data_type == 'UINT16':
-            builder.add_16bit_uint(int(value))
-        elif data_type == 'INT32':
-            builder.add_32bit_int(int(value))
-        elif data_type == 'UINT32':
-            builder.add_32bit_uint(int(value))
-        elif data_type == 'FLOAT32':
-            builder.add_32bit_float(float(value))
-        elif data_type == 'INT64':
-            builder.add_64bit_int(int(value))
-        elif data_type == 'UINT64':
-            builder.add_64bit_uint(int(value))
-        elif data_type == 'FLOAT64':
-            builder.add_64bit_float(float(value))
+        encoder = self._value_structs[type_id]
+        if type_id == _DT.BOOL:
+            value = 1 if value else 0
+        elif type_id in _FLOAT_TYPES:
+            value = float(value)
         else:
-            raise ValueError(f"Unsupported data type for encoding: {data_type}")
+            value = int(value)
+        scratch = self._scratch
+        encoder.pack_into(scratch, 0, value)
+        registers = list(self._register_structs[encoder.size // 2].unpack_from(scratch))
+        if self._word_swap:
+            registers.reverse()
+        return registers
 
     async def read_multiple(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
         """
         Read multiple values (required by BasePLCConnector)
-        Wrapper for read_batch with different signature
+        Same coalesced path as read_batch; the pairs (list or tuple) are used as given
         """
-        addrs = [addr for addr, _ in addresses]
-        types = [dtype for _, dtype in addresses]
-        return await self.read_batch(addrs, types)
+        return await self._read_coalesced(addresses)
 
     async def write_multiple(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
         """
@@ -6,7 +6,9 @@ Supports certificate-based authentication and automatic reconnection
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Union, Callable, Set
+import random
+from time import time as _time
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, Set
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -29,10 +31,76 @@ from .base import (
 OPCUA_CONNECTIONS = Gauge('opcua_connections_active', 'Active OPC-UA connections', ['server'])
 OPCUA_SUBSCRIPTIONS = Gauge('opcua_subscriptions_active', 'Active OPC-UA subscriptions', ['server'])
 OPCUA_MONITORED_ITEMS = Gauge('opcua_monitored_items_total', 'Total monitored items', ['server'])
-OPCUA_DATA_CHANGES = Counter('opcua_data_changes_total', 'Total data change notifications', ['server', 'node'])
+# Per-server only: a per-node label would create one time series per monitored item
+OPCUA_DATA_CHANGES = Counter('opcua_data_changes_total', 'Total data change notifications', ['server'])
 OPCUA_QUALITY_ERRORS = Counter('opcua_quality_errors_total', 'Quality errors received', ['server', 'quality'])
 OPCUA_RECONNECTS = Counter('opcua_reconnects_total', 'OPC-UA reconnection attempts', ['server'])
-OPCUA_READ_TIME = Histogram('opcua_read_duration_seconds', 'Time to read OPC-UA values')
+OPCUA_DROPPED_NOTIFICATIONS = Counter('opcua_dropped_notifications_total', 'Data changes dropped on a full notification queue', ['server'])
+# Buckets: sub-tick, one sampling tick, one publishing interval, degraded, timeout
+OPCUA_READ_TIME = Histogram('opcua_read_duration_seconds', 'Time to read OPC-UA values',
+                            buckets=(0.01, 0.05, 0.25, 1.0, 5.0))
+
+# Monitored items created per CreateMonitoredItems request
+MONITORED_ITEM_BATCH_SIZE = 100
+
+# Attributes read for every browsed node, in this order
+_BROWSE_ATTRIBUTES = (
+    ua.AttributeIds.BrowseName,
+    ua.AttributeIds.NodeClass,
+    ua.AttributeIds.Value,
+    ua.AttributeIds.DataType,
+)
+# Children followed per browsed node
+_BROWSE_CHILDREN_PER_NODE = 10
+
+# ServerStatus variables reported by get_server_info
+_SERVER_INFO_NODEIDS = {
+    'product_name': ua.NodeId(ua.ObjectIds.Server_ServerStatus_BuildInfo_ProductName),
+    'manufacturer': ua.NodeId(ua.ObjectIds.Server_ServerStatus_BuildInfo_ManufacturerName),
+    'software_version': ua.NodeId(ua.ObjectIds.Server_ServerStatus_BuildInfo_SoftwareVersion),
+    'current_time': ua.NodeId(ua.ObjectIds.Server_ServerStatus_CurrentTime),
+    'start_time': ua.NodeId(ua.ObjectIds.Server_ServerStatus_StartTime),
+    'state': ua.NodeId(ua.ObjectIds.Server_ServerStatus_State),
+}
+
+# Data changes buffered for data_callback before new ones are dropped
+NOTIFICATION_QUEUE_SIZE = 10000
+# Data changes taken off the queue per consumer wakeup
+NOTIFICATION_BATCH_SIZE = 100
+
+
+_UTC = timezone.utc
+
+# Indexed by the StatusCode severity bits (code >> 30): Good, Uncertain, Bad, Bad
+_QUALITY_BY_SEVERITY = (100, 50, 0, 0)
+_QUALITY_STRING_BY_SEVERITY = ("Good", "Uncertain", "Bad", "Bad")
+
+
+def _map_quality(status_code) -> int:
+    """Map OPC-UA status to quality score (0-100)"""
+    if status_code is None:
+        return 100
+    code = getattr(status_code, 'value', status_code)
+    return _QUALITY_BY_SEVERITY[(code >> 30) & 0x3]
+
+
+def _get_quality_string(status_code: int) -> str:
+    """Map OPC-UA status code to quality string"""
+    return _QUALITY_STRING_BY_SEVERITY[(status_code >> 30) & 0x3]
+
+
+def _to_data_point(address: str, data_value: ua.DataValue, fallback_timestamp: datetime) -> PLCDataPoint:
+    """PLCDataPoint for an OPC-UA DataValue; bad status codes become the point's error"""
+    variant = data_value.Value
+    status = data_value.StatusCode
+    return PLCDataPoint(
+        address=address,
+        value=variant.Value if variant else None,
+        data_type=variant.VariantType.name if variant else 'Null',
+        quality=_map_quality(status),
+        timestamp=data_value.SourceTimestamp or fallback_timestamp,
+        error=status.name if status is not None and status.is_bad() else None
+    )
 
 
 class OPCUASecurityMode(Enum):
@@ -49,7 +117,7 @@ class OPCUAAuthMode(Enum):
     CERTIFICATE = "Certificate"
 
 
-@dataclass
+@dataclass(slots=True)
 class OPCUAConfig(PLCConnectionConfig):
     """Extended configuration for OPC-UA connections"""
     # Server settings (required fields must come before optional ones)
@@ -99,7 +167,7 @@ class OPCUAConfig(PLCConnectionConfig):
     read_timeout: int = 10000  # ms
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoredItemConfig:
     """Configuration for a monitored item"""
     node_id: str
@@ -113,6 +181,14 @@ class MonitoredItemConfig:
     callback: Optional[Callable] = None
 
 
+@dataclass(slots=True)
+class _MonitoredItemEntry:
+    """Bookkeeping for one created monitored item"""
+    handle: int
+    node: Node
+    config: MonitoredItemConfig
+
+
 class OPCUASubscriptionHandler:
     """Handler for OPC-UA subscription data changes"""
 
@@ -120,44 +196,49 @@ class OPCUASubscriptionHandler:
         self.client = client
         self.logger = logging.getLogger(__name__)
 
+        # Bind metric children once; labels() is a dict lookup per call
+        server = client.config.endpoint_url
+        self._data_change_counter = OPCUA_DATA_CHANGES.labels(server=server)
+        self._dropped_counter = OPCUA_DROPPED_NOTIFICATIONS.labels(server=server)
+        self._quality_error_counters = {
+            quality: OPCUA_QUALITY_ERRORS.labels(server=server, quality=quality)
+            for quality in ("Good", "Uncertain", "Bad")
+        }
+
     def datachange_notification(self, node: Node, val, data: DataChangeNotif):
         """Handle data change notifications"""
         try:
-            node_id = node.nodeid.to_string()
+            nodeid = node.nodeid
+            node_id = self.client._nodeid_cache.get(id(nodeid)) or nodeid.to_string()
+
+            data_value = data.monitored_item.Value
+            status = data_value.StatusCode
+            source_timestamp = data_value.SourceTimestamp
+            status_code = status.value if status else 0
 
             # Update metrics
-            OPCUA_DATA_CHANGES.labels(
-                server=self.client.config.endpoint_url,
-                node=node_id
-            ).inc()
+            self._data_change_counter.inc()
 
             # Check quality
-            if data.monitored_item.Value.StatusCode:
-                status_code = data.monitored_item.Value.StatusCode.value
-                if status_code != 0:  # Not Good
-                    quality = self._get_quality_string(status_code)
-                    OPCUA_QUALITY_ERRORS.labels(
-                        server=self.client.config.endpoint_url,
-                        quality=quality
-                    ).inc()
-                    self.logger.warning(f"Bad quality for {node_id}: {quality}")
+            if status_code != 0:  # Not Good
+                quality = _get_quality_string(status_code)
+                self._quality_error_counters[quality].inc()
+                self.logger.warning(f"Bad quality for {node_id}: {quality}")
+
+            # Metrics-only mode: nothing consumes the data point
+            if self.client.data_callback is None:
+                return
 
             # Create data point
-            data_point = PLCDataPoint(
-                tag_name=node_id,
-                value=val,
-                timestamp=data.monitored_item.Value.SourceTimestamp or datetime.now(timezone.utc),
-                quality=self._map_quality(data.monitored_item.Value.StatusCode),
-                metadata={
-                    'server_timestamp': data.monitored_item.Value.ServerTimestamp,
-                    'source_timestamp': data.monitored_item.Value.SourceTimestamp,
-                    'status_code': data.monitored_item.Value.StatusCode.value if data.monitored_item.Value.StatusCode else 0
-                }
+            data_point = _to_data_point(
+                node_id, data_value, source_timestamp or datetime.fromtimestamp(_time(), _UTC)
             )
 
-            # Process through client callback
-            if self.client.data_callback:
-                asyncio.create_task(self.client.data_callback(data_point))
+            # Hand off to the client's consumer task
+            try:
+                self.client._notification_queue.put_nowait(data_point)
+            except asyncio.QueueFull:
+                self._dropped_counter.inc()
 
         except Exception as e:
             self.logger.error(f"Error processing data change: {e}")
@@ -170,28 +251,6 @@ class OPCUASubscriptionHandler:
         """Handle status change notifications"""
         self.logger.info(f"Subscription status change: {status}")
 
-    def _get_quality_string(self, status_code: int) -> str:
-        """Map OPC-UA status code to quality string"""
-        if status_code & 0x40000000:
-            return "Uncertain"
-        elif status_code & 0x80000000:
-            return "Bad"
-        return "Good"
-
-    def _map_quality(self, status_code) -> int:
-        """Map OPC-UA status to quality score (0-100)"""
-        if not status_code:
-            return 100
-
-        code = status_code.value if hasattr(status_code, 'value') else status_code
-
-        if code == 0:
-            return 100  # Good
-        elif code & 0x40000000:
-            return 50   # Uncertain
-        else:
-            return 0    # Bad
-
 
 class OPCUAClient(BasePLCConnector):
     """
@@ -204,19 +263,42 @@ class OPCUAClient(BasePLCConnector):
         self.config: OPCUAConfig = config
         self.client: Optional[Client] = None
         self.subscription: Optional[Subscription] = None
-        self.monitored_items: Dict[str, Any] = {}
+        self.monitored_items: Dict[str, _MonitoredItemEntry] = {}
+        # id(NodeId) -> node id string for monitored nodes; the NodeId objects
+        # stay alive in monitored_items, so their ids are stable
+        self._nodeid_cache: Dict[int, str] = {}
+        # address -> Node for the current client session
+        self._node_cache: Dict[str, Node] = {}
+        # Monotonic so handles are never reused after removals
+        self._next_client_handle = 0
         self.handler = OPCUASubscriptionHandler(self)
         self._reconnect_task: Optional[asyncio.Task] = None
         self._reconnect_attempts = 0
+        # Set while _reconnect_loop runs, so its own connect() calls and the
+        # keep-alive never start a second loop
+        self._reconnecting = False
         self.data_callback: Optional[Callable] = None
 
+        # Bind metric children once; labels() is a dict lookup per call
+        server = config.endpoint_url
+        self._connections_gauge = OPCUA_CONNECTIONS.labels(server=server)
+        self._subscriptions_gauge = OPCUA_SUBSCRIPTIONS.labels(server=server)
+        self._monitored_items_gauge = OPCUA_MONITORED_ITEMS.labels(server=server)
+        self._reconnects_counter = OPCUA_RECONNECTS.labels(server=server)
+
+        # Data changes waiting for data_callback; bounded so a slow callback
+        # drops notifications instead of growing memory without limit
+        self._notification_queue: asyncio.Queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        self._consumer_task: Optional[asyncio.Task] = None
+
     async def connect(self) -> bool:
         """Establish OPC-UA connection with security"""
         try:
             self.logger.info(f"Connecting to OPC-UA server: {self.config.endpoint_url}")
 
-            # Create client
+            # Create client; cached nodes belong to the previous one
             self.client = Client(url=self.config.endpoint_url)
+            self._node_cache.clear()
 
             # Configure security
             await self._configure_security()
@@ -229,7 +311,7 @@ class OPCUAClient(BasePLCConnector):
             await self.client.connect()
 
             # Update metrics
-            OPCUA_CONNECTIONS.labels(server=self.config.endpoint_url).set(1)
+            self._connections_gauge.set(1)
 
             # Create subscription
             await self._create_subscription()
@@ -237,6 +319,10 @@ class OPCUAClient(BasePLCConnector):
             self.status = PLCStatus.CONNECTED
             self.logger.info(f"Connected to OPC-UA server: {self.config.endpoint_url}")
 
+            # Start notification consumer (kept across reconnects)
+            if not self._consumer_task or self._consumer_task.done():
+                self._consumer_task = asyncio.create_task(self._consume_notifications())
+
             # Start keep-alive
             asyncio.create_task(self._keep_alive())
 
@@ -246,10 +332,10 @@ class OPCUAClient(BasePLCConnector):
             self.logger.error(f"Failed to connect to OPC-UA server: {e}")
             self.status = PLCStatus.ERROR
             self.last_error = str(e)
-            OPCUA_CONNECTIONS.labels(server=self.config.endpoint_url).set(0)
+            self._connections_gauge.set(0)
 
-            # Start reconnection task
-            if not self._reconnect_task:
+            # Start reconnection task, unless this is the loop's own attempt
+            if not self._reconnecting and not self._reconnect_task:
                 self._reconnect_task = asyncio.create_task(self._reconnect_loop())
 
             return False
@@ -294,7 +380,7 @@ class OPCUAClient(BasePLCConnector):
                 self.handler
             )
 
-            OPCUA_SUBSCRIPTIONS.labels(server=self.config.endpoint_url).set(1)
+            self._subscriptions_gauge.set(1)
             self.logger.info(f"Created subscription with ID: {self.subscription.subscription_id}")
 
         except Exception as e:
@@ -303,57 +389,105 @@ class OPCUAClient(BasePLCConnector):
 
     async def add_monitored_item(self, config: MonitoredItemConfig) -> bool:
         """Add a monitored item to the subscription"""
+        results = await self.add_monitored_items([config])
+        return bool(results and results[0])
+
+    async def add_monitored_items(self, configs: List[MonitoredItemConfig]) -> List[bool]:
+        """
+        Add monitored items to the subscription
+
+        Items are created MONITORED_ITEM_BATCH_SIZE at a time, one request per
+        batch. Returns one success flag per config, in order.
+        """
         if not self.subscription:
             self.logger.error("No active subscription")
-            return False
+            return [False] * len(configs)
 
-        try:
-            # Get node
-            node = self.client.get_node(config.node_id)
-
-            # Create monitoring parameters
-            params = ua.MonitoredItemCreateRequest()
-            params.ItemToMonitor.NodeId = node.nodeid
-            params.ItemToMonitor.AttributeId = ua.AttributeIds.Value
-            params.MonitoringMode = ua.MonitoringMode.Reporting
-
-            # Configure sampling
-            params.RequestedParameters.ClientHandle = len(self.monitored_items)
-            params.RequestedParameters.SamplingInterval = config.sampling_interval
-            params.RequestedParameters.QueueSize = config.queue_size
-            params.RequestedParameters.DiscardOldest = config.discard_oldest
-
-            # Configure deadband filter
-            if config.deadband_value > 0:
-                data_filter = ua.DataChangeFilter()
-                data_filter.Trigger = ua.DataChangeTrigger.StatusValue
-                data_filter.DeadbandType = config.deadband_type
-                data_filter.DeadbandValue = config.deadband_value
-                params.RequestedParameters.Filter = data_filter
-
-            # Create monitored item
-            items = await self.subscription.create_monitored_items([params])
-
-            if items and items[0].StatusCode.is_good():
-                self.monitored_items[config.node_id] = {
-                    'handle': items[0].MonitoredItemId,
-                    'node': node,
-                    'config': config
-                }
+        results = []
+        for i in range(0, len(configs), MONITORED_ITEM_BATCH_SIZE):
+            batch = configs[i:i + MONITORED_ITEM_BATCH_SIZE]
 
-                OPCUA_MONITORED_ITEMS.labels(server=self.config.endpoint_url).set(
-                    len(self.monitored_items)
-                )
+            try:
+                nodes = []
+                requests = []
+                for config in batch:
+                    node = self._node(config.node_id)
+                    nodes.append(node)
+                    requests.append(self._monitored_item_request(node, config, self._next_client_handle))
+                    self._next_client_handle = (self._next_client_handle + 1) & 0xFFFFFFFF
+
+                # Create monitored items
+                items = await self.subscription.create_monitored_items(requests)
 
+            except Exception as e:
+                self.logger.error(f"Error adding {len(batch)} monitored items: {e}")
+                results.extend([False] * len(batch))
+                continue
+
+            # One entry per request: the MonitoredItemId, or the StatusCode
+            # the server rejected the item with
+            for config, node, item in zip(batch, nodes, items):
+                if isinstance(item, ua.StatusCode):
+                    self.logger.error(f"Failed to add monitored item {config.node_id}: {item}")
+                    results.append(False)
+                    continue
+
+                self._forget_nodeid(config.node_id)
+                self._nodeid_cache[id(node.nodeid)] = node.nodeid.to_string()
+                self.monitored_items[config.node_id] = _MonitoredItemEntry(
+                    handle=item,
+                    node=node,
+                    config=config
+                )
                 self.logger.info(f"Added monitored item: {config.node_id}")
-                return True
-            else:
-                self.logger.error(f"Failed to add monitored item {config.node_id}: {items[0].StatusCode}")
-                return False
+                results.append(True)
 
-        except Exception as e:
-            self.logger.error(f"Error adding monitored item {config.node_id}: {e}")
-            return False
+        self._monitored_items_gauge.set(len(self.monitored_items))
+
+        return results
+
+    def _monitored_item_request(self, node: Node, config: MonitoredItemConfig,
+                                client_handle: int) -> ua.MonitoredItemCreateRequest:
+        """Build the create request for one monitored item"""
+        params = ua.MonitoredItemCreateRequest()
+        params.ItemToMonitor.NodeId = node.nodeid
+        params.ItemToMonitor.AttributeId = ua.AttributeIds.Value
+        params.MonitoringMode = ua.MonitoringMode.Reporting
+
+        # Configure sampling
+        params.RequestedParameters.ClientHandle = client_handle
+        params.RequestedParameters.SamplingInterval = config.sampling_interval
+        params.RequestedParameters.QueueSize = config.queue_size
+        params.RequestedParameters.DiscardOldest = config.discard_oldest
+
+        # Always filter server-side so unchanged samples are never published;
+        # a deadband is only requested when configured, since servers reject
+        # deadbands on non-numeric nodes and a zero deadband adds nothing
+        data_filter = ua.DataChangeFilter()
+        data_filter.Trigger = ua.DataChangeTrigger.StatusValue
+        if config.deadband_value > 0:
+            data_filter.DeadbandType = config.deadband_type
+            data_filter.DeadbandValue = config.deadband_value
+        else:
+            data_filter.DeadbandType = 0  # None
+            data_filter.DeadbandValue = 0.0
+        params.RequestedParameters.Filter = data_filter
+
+        return params
+
+    def _node(self, address: str) -> Node:
+        """Get the node for an address, parsing each address once per session"""
+        node = self._node_cache.get(address)
+        if node is None:
+            node = self.client.get_node(address)
+            self._node_cache[address] = node
+        return node
+
+    def _forget_nodeid(self, node_id: str):
+        """Drop the cached node id string of a monitored item being replaced or removed"""
+        entry = self.monitored_items.get(node_id)
+        if entry:
+            self._nodeid_cache.pop(id(entry.node.nodeid), None)
 
     async def remove_monitored_item(self, node_id: str) -> bool:
         """Remove a monitored item from the subscription"""
@@ -361,13 +495,12 @@ class OPCUAClient(BasePLCConnector):
             return False
 
         try:
-            handle = self.monitored_items[node_id]['handle']
+            handle = self.monitored_items[node_id].handle
             await self.subscription.delete_monitored_items([handle])
+            self._forget_nodeid(node_id)
             del self.monitored_items[node_id]
 
-            OPCUA_MONITORED_ITEMS.labels(server=self.config.endpoint_url).set(
-                len(self.monitored_items)
-            )
+            self._monitored_items_gauge.set(len(self.monitored_items))
 
             self.logger.info(f"Removed monitored item: {node_id}")
             return True
@@ -383,22 +516,10 @@ class OPCUAClient(BasePLCConnector):
 
         try:
             with OPCUA_READ_TIME.time():
-                node = self.client.get_node(tag.address)
-                value = await node.read_value()
-
-                # Get additional attributes
+                node = self._node(tag.address)
                 data_value = await node.read_data_value()
 
-                return PLCDataPoint(
-                    tag_name=tag.name,
-                    value=value,
-                    timestamp=data_value.SourceTimestamp or datetime.now(timezone.utc),
-                    quality=self._map_quality(data_value.StatusCode),
-                    metadata={
-                        'server_timestamp': data_value.ServerTimestamp,
-                        'status_code': data_value.StatusCode.value if data_value.StatusCode else 0
-                    }
-                )
+                return _to_data_point(tag.name, data_value, datetime.fromtimestamp(_time(), _UTC))
 
         except Exception as e:
             self.logger.error(f"Error reading tag {tag.name}: {e}")
@@ -411,41 +532,30 @@ class OPCUAClient(BasePLCConnector):
 
         results = []
 
-        # Process in batches
+        # Process in batches, one Read request per batch
         for i in range(0, len(tags), self.config.batch_read_size):
             batch = tags[i:i + self.config.batch_read_size]
 
             try:
-                nodes = [self.client.get_node(tag.address) for tag in batch]
-                values = await asyncio.gather(
-                    *[node.read_data_value() for node in nodes],
-                    return_exceptions=True
-                )
+                nodeids = [self._node(tag.address).nodeid for tag in batch]
+                values = await self.client.uaclient.read_attributes(nodeids, ua.AttributeIds.Value)
 
-                for tag, value in zip(batch, values):
-                    if isinstance(value, Exception):
-                        self.logger.error(f"Error reading {tag.name}: {value}")
-                        results.append(PLCDataPoint(
-                            tag_name=tag.name,
-                            value=None,
-                            timestamp=datetime.now(timezone.utc),
-                            quality=0,
-                            metadata={'error': str(value)}
-                        ))
-                    else:
-                        results.append(PLCDataPoint(
-                            tag_name=tag.name,
-                            value=value.Value.Value,
-                            timestamp=value.SourceTimestamp or datetime.now(timezone.utc),
-                            quality=self._map_quality(value.StatusCode),
-                            metadata={
-                                'server_timestamp': value.ServerTimestamp,
-                                'status_code': value.StatusCode.value if value.StatusCode else 0
-                            }
-                        ))
+                # One fallback timestamp for the whole batch, like a scan timestamp
+                read_time = datetime.fromtimestamp(_time(), _UTC)
+                batch_points = [
+                    _to_data_point(tag.name, value, read_time)
+                    for tag, value in zip(batch, values)
+                ]
 
             except Exception as e:
                 self.logger.error(f"Error in batch read: {e}")
+                timestamp = datetime.fromtimestamp(_time(), _UTC)
+                batch_points = [
+                    PLCDataPoint(tag.name, None, tag.data_type, 0, timestamp, str(e))
+                    for tag in batch
+                ]
+
+            results.extend(batch_points)
 
         return results
 
@@ -455,13 +565,51 @@ class OPCUAClient(BasePLCConnector):
             raise PLCConnectionError("Not connected to OPC-UA server")
 
         try:
-            node = self.client.get_node(tag.address)
+            node = self._node(tag.address)
             await node.write_value(value)
             return True
         except Exception as e:
             self.logger.error(f"Error writing tag {tag.name}: {e}")
             return False
 
+    # BasePLCConnector interface, on top of the tag methods above
+
+    async def read_single(self, address: str, data_type: str) -> PLCDataPoint:
+        """Read a single node value"""
+        return await self.read_tag(PLCTagDefinition(address, address, data_type))
+
+    async def read_multiple(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
+        """Read several node values, batch_read_size per Read request"""
+        return await self.read_tags_batch([
+            PLCTagDefinition(address, address, data_type) for address, data_type in addresses
+        ])
+
+    async def write_single(self, address: str, value: Any, data_type: str) -> bool:
+        """Write a single node value"""
+        return await self.write_tag(PLCTagDefinition(address, address, data_type), value)
+
+    async def write_multiple(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
+        """Write several node values"""
+        return list(await asyncio.gather(*[
+            self.write_single(address, value, data_type) for address, value, data_type in writes
+        ]))
+
+    async def discover_tags(self) -> List[PLCTagDefinition]:
+        """Browsed variables as tag definitions"""
+        return [
+            PLCTagDefinition(node_info['browse_name'], node_info['node_id'], node_info['data_type'])
+            for node_info in await self.browse_nodes()
+            if 'data_type' in node_info
+        ]
+
+    def validate_address(self, address: str) -> bool:
+        """Check that an address parses as an OPC-UA NodeId string"""
+        try:
+            ua.NodeId.from_string(address)
+            return True
+        except (UaError, ValueError):
+            return False
+
     async def browse_nodes(self, start_node: Optional[str] = None, max_depth: int = 3) -> List[Dict[str, Any]]:
         """Browse OPC-UA address space for available nodes"""
         if not self.client:
@@ -475,49 +623,80 @@ class OPCUAClient(BasePLCConnector):
             else:
                 root = self.client.nodes.objects
 
-            await self._browse_recursive(root, nodes, 0, max_depth)
+            await self._browse_iterative(root, nodes, max_depth)
 
         except Exception as e:
             self.logger.error(f"Error browsing nodes: {e}")
 
         return nodes
 
-    async def _browse_recursive(self, node: Node, nodes: List, depth: int, max_depth: int):
-        """Recursively browse nodes"""
-        if depth >= max_depth or len(nodes) >= self.config.max_browse_nodes:
-            return
+    async def _browse_iterative(self, root: Node, nodes: List, max_depth: int):
+        """Browse breadth-first, one Read and one Browse request per level"""
+        uaclient = self.client.uaclient
+        attribute_count = len(_BROWSE_ATTRIBUTES)
+        level = [root.nodeid]
+        depth = 0
+
+        while level and depth < max_depth and len(nodes) < self.config.max_browse_nodes:
+            level = level[:self.config.max_browse_nodes - len(nodes)]
+
+            # Get node info for the whole level
+            read_params = ua.ReadParameters()
+            read_params.NodesToRead = [
+                ua.ReadValueId(NodeId=nodeid, AttributeId=attribute)
+                for nodeid in level
+                for attribute in _BROWSE_ATTRIBUTES
+            ]
+            data_values = await uaclient.read(read_params)
+
+            parents = []
+            for i, nodeid in enumerate(level):
+                browse_name, node_class, value, data_type = data_values[i * attribute_count:(i + 1) * attribute_count]
+                if not (browse_name.StatusCode.is_good() and node_class.StatusCode.is_good()):
+                    self.logger.debug(f"Error browsing node {nodeid.to_string()}: {browse_name.StatusCode}")
+                    continue
+
+                node_class = ua.NodeClass(node_class.Value.Value)
+                node_info = {
+                    'node_id': nodeid.to_string(),
+                    'browse_name': browse_name.Value.Value.to_string(),
+                    'node_class': node_class.name,
+                    'depth': depth
+                }
 
-        try:
-            # Get node info
-            browse_name = await node.read_browse_name()
-            node_class = await node.read_node_class()
-
-            node_info = {
-                'node_id': node.nodeid.to_string(),
-                'browse_name': browse_name.to_string(),
-                'node_class': node_class.name,
-                'depth': depth
-            }
+                # If it's a variable, add value and data type
+                if (node_class == ua.NodeClass.Variable and
+                        value.StatusCode.is_good() and data_type.StatusCode.is_good()):
+                    node_info['value'] = str(value.Value.Value)
+                    node_info['data_type'] = str(data_type.Value.Value)
 
-            # If it's a variable, get additional info
-            if node_class == ua.NodeClass.Variable:
-                try:
-                    value = await node.read_value()
-                    data_type = await node.read_data_type()
-                    node_info['value'] = str(value)
-                    node_info['data_type'] = str(data_type)
-                except:
-                    pass
+                nodes.append(node_info)
+                parents.append(nodeid)
 
-            nodes.append(node_info)
+            depth += 1
+            if depth >= max_depth or not parents:
+                break
 
-            # Browse children
-            children = await node.get_children()
-            for child in children[:10]:  # Limit children per node
-                await self._browse_recursive(child, nodes, depth + 1, max_depth)
+            # Browse children of the whole level
+            browse_params = ua.BrowseParameters()
+            browse_params.NodesToBrowse = [
+                ua.BrowseDescription(
+                    NodeId=nodeid,
+                    BrowseDirection=ua.BrowseDirection.Forward,
+                    ReferenceTypeId=ua.NodeId(ua.ObjectIds.HierarchicalReferences),
+                    IncludeSubtypes=True,
+                    NodeClassMask=0,
+                    ResultMask=ua.BrowseResultMask.All,
+                )
+                for nodeid in parents
+            ]
+            browse_results = await uaclient.browse(browse_params)
 
-        except Exception as e:
-            self.logger.debug(f"Error browsing node: {e}")
+            level = [
+                reference.NodeId
+                for result in browse_results
+                for reference in result.References[:_BROWSE_CHILDREN_PER_NODE]
+            ]
 
     async def disconnect(self):
         """Disconnect from OPC-UA server"""
@@ -527,35 +706,60 @@ class OPCUAClient(BasePLCConnector):
                 self._reconnect_task.cancel()
                 self._reconnect_task = None
 
+            # Stop notification consumer
+            if self._consumer_task:
+                self._consumer_task.cancel()
+                self._consumer_task = None
+
             # Delete subscription
             if self.subscription:
                 await self.subscription.delete()
                 self.subscription = None
-                OPCUA_SUBSCRIPTIONS.labels(server=self.config.endpoint_url).set(0)
+                self._subscriptions_gauge.set(0)
 
             # Disconnect client
             if self.client:
                 await self.client.disconnect()
                 self.client = None
-                OPCUA_CONNECTIONS.labels(server=self.config.endpoint_url).set(0)
+                self._connections_gauge.set(0)
 
             self.status = PLCStatus.DISCONNECTED
             self.monitored_items.clear()
-            OPCUA_MONITORED_ITEMS.labels(server=self.config.endpoint_url).set(0)
+            self._nodeid_cache.clear()
+            self._node_cache.clear()
+            self._monitored_items_gauge.set(0)
 
             self.logger.info(f"Disconnected from OPC-UA server: {self.config.endpoint_url}")
 
         except Exception as e:
             self.logger.error(f"Error during disconnect: {e}")
 
+    async def _consume_notifications(self):
+        """Deliver queued data changes to data_callback in batches"""
+        queue = self._notification_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < NOTIFICATION_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            callback = self.data_callback
+            if not callback:
+                continue
+
+            for data_point in batch:
+                try:
+                    await callback(data_point)
+                except Exception as e:
+                    self.logger.error(f"Error in data callback for {data_point.address}: {e}")
+
     async def _keep_alive(self):
-        """Keep connection alive with periodic reads"""
+        """Watch the session and trigger reconnection when it fails"""
         while self.status == PLCStatus.CONNECTED:
             try:
                 if self.client:
-                    # Read server status
-                    server_node = self.client.nodes.server
-                    status = await server_node.read_value()
+                    # Local check of the client's channel renewal, server
+                    # watchdog and publish tasks; no extra request on the wire
+                    await self.client.check_connection()
 
                 await asyncio.sleep(self.config.keep_alive_interval / 1000)
 
@@ -564,59 +768,63 @@ class OPCUAClient(BasePLCConnector):
                 self.status = PLCStatus.ERROR
 
                 # Trigger reconnection
-                if not self._reconnect_task:
+                if not self._reconnecting and not self._reconnect_task:
                     self._reconnect_task = asyncio.create_task(self._reconnect_loop())
                 break
 
     async def _reconnect_loop(self):
         """Automatic reconnection with exponential backoff"""
-        while (self.config.max_reconnect_attempts < 0 or
-               self._reconnect_attempts < self.config.max_reconnect_attempts):
-
-            self._reconnect_attempts += 1
-            wait_time = min(60, self.config.reconnect_interval * (2 ** min(self._reconnect_attempts - 1, 5)))
-
-            self.logger.info(f"Reconnection attempt {self._reconnect_attempts} in {wait_time} seconds...")
-            await asyncio.sleep(wait_time)
-
-            try:
-                # Disconnect if still connected
-                if self.client:
-                    try:
-                        await self.client.disconnect()
-                    except:
-                        pass
-
-                # Reconnect
-                if await self.connect():
-                    self.logger.info("Reconnection successful")
-                    self._reconnect_attempts = 0
-                    OPCUA_RECONNECTS.labels(server=self.config.endpoint_url).inc()
-
-                    # Restore monitored items
-                    for node_id, item_info in list(self.monitored_items.items()):
-                        await self.add_monitored_item(item_info['config'])
-
-                    break
-
-            except Exception as e:
-                self.logger.error(f"Reconnection failed: {e}")
+        if self._reconnecting:
+            self.logger.warning("Reconnection loop already running, not starting another")
+            return
 
-        self._reconnect_task = None
+        self._reconnecting = True
+        try:
+            while (self.config.max_reconnect_attempts < 0 or
+                   self._reconnect_attempts < self.config.max_reconnect_attempts):
 
-    def _map_quality(self, status_code) -> int:
-        """Map OPC-UA status to quality score (0-100)"""
-        if not status_code:
-            return 100
+                self._reconnect_attempts += 1
+                exp_delay = min(60, self.config.reconnect_interval * (2 ** min(self._reconnect_attempts - 1, 5)))
+                # Full jitter so clients of a recovering server don't retry in lockstep
+                wait_time = random.uniform(0, exp_delay)
 
-        code = status_code.value if hasattr(status_code, 'value') else status_code
+                self.logger.info(
+                    f"Reconnection attempt {self._reconnect_attempts} in {wait_time:.2f} seconds "
+                    f"(backoff {exp_delay} seconds)..."
+                )
+                await asyncio.sleep(wait_time)
 
-        if code == 0:
-            return 100  # Good
-        elif code & 0x40000000:
-            return 50   # Uncertain
-        else:
-            return 0    # Bad
+                try:
+                    # Disconnect if still connected
+                    if self.client:
+                        try:
+                            await self.client.disconnect()
+                        except:
+                            pass
+
+                    # Reconnect
+                    if await self.connect():
+                        self.logger.info("Reconnection successful")
+                        self._reconnect_attempts = 0
+                        self._reconnects_counter.inc()
+
+                        # Restore monitored items
+                        await self.add_monitored_items(
+                            [entry.config for entry in self.monitored_items.values()]
+                        )
+
+                        # The keep-alive defers to this loop while it runs,
+                        # so a drop during the restore is retried here
+                        if self.status == PLCStatus.CONNECTED:
+                            break
+                        self.logger.warning("Connection lost while restoring monitored items")
+
+                except Exception as e:
+                    self.logger.error(f"Reconnection failed: {e}")
+
+        finally:
+            self._reconnecting = False
+            self._reconnect_task = None
 
     async def get_server_info(self) -> Dict[str, Any]:
         """Get OPC-UA server information"""
@@ -624,15 +832,14 @@ class OPCUAClient(BasePLCConnector):
             return {}
 
         try:
-            server = self.client.nodes.server
+            # Well-known NodeIds, read in a single request
+            data_values = await self.client.uaclient.read_attributes(
+                list(_SERVER_INFO_NODEIDS.values()), ua.AttributeIds.Value
+            )
 
             info = {
-                'product_name': await server.get_child(["0:ServerStatus", "0:BuildInfo", "0:ProductName"]).read_value(),
-                'manufacturer': await server.get_child(["0:ServerStatus", "0:BuildInfo", "0:ManufacturerName"]).read_value(),
-                'software_version': await server.get_child(["0:ServerStatus", "0:BuildInfo", "0:SoftwareVersion"]).read_value(),
-                'current_time': await server.get_child(["0:ServerStatus", "0:CurrentTime"]).read_value(),
-                'start_time': await server.get_child(["0:ServerStatus", "0:StartTime"]).read_value(),
-                'state': await server.get_child(["0:ServerStatus", "0:State"]).read_value(),
+                key: data_value.Value.Value
+                for key, data_value in zip(_SERVER_INFO_NODEIDS, data_values)
             }
 
             return info
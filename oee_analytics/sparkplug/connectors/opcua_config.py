@@ -23,6 +23,10 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class OPCUATagMapping(BaseModel):
     """Mapping between OPC-UA nodes and Sparkplug metrics"""
@@ -112,7 +116,7 @@ class OPCUAConfigManager:
         try:
             with open(config_path, 'r') as f:
                 if config_path.suffix in ['.yml', '.yaml']:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=_YAML_LOADER)
                 else:
                     config_data = json.load(f)
 
@@ -149,7 +153,7 @@ class OPCUAConfigManager:
 
             with open(config_path, 'w') as f:
                 if config_path.suffix in ['.yml', '.yaml']:
-                    yaml.dump(config_data, f, default_flow_style=False)
+                    yaml.dump(config_data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
                 else:
                     json.dump(config_data, f, indent=2)
 
@@ -430,7 +434,7 @@ if __name__ == "__main__":
     if not config_mgr.load_config():
         default_config = create_default_config()
         with open("config/opcua_config.yaml", "w") as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            yaml.dump(default_config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
         config_mgr.load_config()
 
     # Certificate management
@@ -7,14 +7,14 @@ Supports: S7-300, S7-400, S7-1200, S7-1500, LOGO!, ET200SP
 import asyncio
 import snap7
 from typing import Dict, Any, List, Optional, Tuple, Union
-from datetime import datetime
 import struct
 import logging
 from dataclasses import dataclass
 
 from .base import (
     BasePLCConnector, PLCConnectionConfig, PLCTagDefinition, 
-    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError
+    PLCDataPoint, PLCStatus, PLCConnectionError, PLCDataError, _make_dp_ok,
+    _BASE_CONFIG_FIELDS
 )
 
 
@@ -37,6 +37,11 @@ class SiemensS7Config(PLCConnectionConfig):
     # Performance tuning
     pdu_size: int = 480  # PDU size for bulk reads
     word_len: int = 2    # Word length for data alignment
+    
+    @classmethod
+    def from_base(cls, base: PLCConnectionConfig) -> 'SiemensS7Config':
+        """Upcast a generic connection config, keeping S7-specific defaults"""
+        return cls(**{name: getattr(base, name) for name in _BASE_CONFIG_FIELDS})
 
 
 class SiemensS7Connector(BasePLCConnector):
@@ -71,7 +76,7 @@ class SiemensS7Connector(BasePLCConnector):
                  logger: Optional[logging.Logger] = None):
         # Convert to Siemens-specific config if needed
         if isinstance(config, PLCConnectionConfig) and not isinstance(config, SiemensS7Config):
-            config = SiemensS7Config(**config.__dict__)
+            config = SiemensS7Config.from_base(config)
         
         super().__init__(config, logger)
         self.s7_client: Optional[snap7.client.Client] = None
@@ -198,7 +203,7 @@ class SiemensS7Connector(BasePLCConnector):
                 value=value,
                 data_type=data_type,
                 quality=192,  # Good quality
-                timestamp=datetime.now()
+                timestamp=self._scan_timestamp()
             )
             
         except Exception as e:
@@ -211,7 +216,7 @@ class SiemensS7Connector(BasePLCConnector):
                 value=None,
                 data_type=data_type,
                 quality=0,  # Bad quality
-                timestamp=datetime.now(),
+                timestamp=self._scan_timestamp(),
                 error=error_msg
             )
     
@@ -220,23 +225,22 @@ class SiemensS7Connector(BasePLCConnector):
         if not self.s7_client or not self.s7_client.get_connected():
             raise PLCConnectionError("Not connected to PLC")
         
-        results = []
+        results: List[Optional[PLCDataPoint]] = [None] * len(addresses)
         
-        # Group addresses by memory area for optimization
-        grouped_reads = self._group_addresses_for_batch_read(addresses)
+        # Merge neighbouring addresses of the same area into block reads
+        blocks, singles = self._coalesce_reads(addresses)
         
-        for group in grouped_reads:
+        for block in blocks:
             try:
-                # Perform batch read for this group
-                group_results = await self._read_address_group(group)
-                results.extend(group_results)
-                
+                await self._read_block(block, addresses, results)
             except Exception as e:
-                # If batch read fails, fall back to individual reads
-                self.logger.warning(f"Batch read failed, falling back to individual reads: {e}")
-                for address, data_type in group['addresses']:
-                    result = await self.read_single(address, data_type)
-                    results.append(result)
+                # If block read fails, fall back to individual reads
+                self.logger.warning(f"Block read failed, falling back to individual reads: {e}")
+                for index, _, _ in block.slices:
+                    results[index] = await self.read_single(*addresses[index])
+        
+        for index in singles:
+            results[index] = await self.read_single(*addresses[index])
         
         return results
     
@@ -335,6 +339,36 @@ class SiemensS7Connector(BasePLCConnector):
     
     # Helper methods
     
+    def _address_key(self, address: str) -> Tuple[int, int, int, int]:
+        """Order S7 addresses by (area, DB number, byte, bit)"""
+        return self._parse_s7_address(address)
+    
+    def _block_address(self, address: str, data_type: str) -> Optional[Tuple[Tuple[int, int], int, int]]:
+        """Locate an S7 address as ((area, db_number), byte offset, byte size)"""
+        area, db_number, start_address, _ = self._parse_s7_address(address)
+        return (area, db_number), start_address, self._get_data_type_size(data_type)
+    
+    async def _read_block(self, block, addresses: List[Tuple[str, str]],
+                          results: List[Optional[PLCDataPoint]]):
+        """Read one coalesced block and slice it into the requested data points"""
+        area, db_number = block.area
+        raw_data = await asyncio.get_event_loop().run_in_executor(
+            None,
+            self.s7_client.read_area,
+            area,
+            db_number,
+            block.start,
+            block.length
+        )
+        self._increment_read_stats(len(raw_data))
+        timestamp = self._scan_timestamp()
+        
+        for index, offset, size in block.slices:
+            address, data_type = addresses[index]
+            _, _, _, bit_offset = self._parse_s7_address(address)
+            value = self._convert_raw_data(raw_data[offset:offset + size], data_type, bit_offset)
+            results[index] = _make_dp_ok(address, value, data_type, timestamp)
+    
     def _parse_s7_address(self, address: str) -> Tuple[int, int, int, int]:
         """
         Parse S7 address string into components
@@ -592,42 +626,6 @@ class SiemensS7Connector(BasePLCConnector):
                 units="ms"
             ),
         ]
-    
-    def _group_addresses_for_batch_read(self, addresses: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
-        """Group addresses for optimized batch reading"""
-        # Simplified grouping - group by memory area
-        groups = {}
-        
-        for address, data_type in addresses:
-            try:
-                area, db_number, start_address, bit_offset = self._parse_s7_address(address)
-                area_key = f"{area}_{db_number}"
-                
-                if area_key not in groups:
-                    groups[area_key] = {
-                        'area': area,
-                        'db_number': db_number,
-                        'addresses': []
-                    }
-                
-                groups[area_key]['addresses'].append((address, data_type))
-                
-            except Exception as e:
-                self.logger.warning(f"Could not group address {address}: {e}")
-        
-        return list(groups.values())
-    
-    async def _read_address_group(self, group: Dict[str, Any]) -> List[PLCDataPoint]:
-        """Read a group of addresses from the same memory area"""
-        results = []
-        
-        # For now, fall back to individual reads
-        # TODO: Implement true batch reading with optimized memory access
-        for address, data_type in group['addresses']:
-            result = await self.read_single(address, data_type)
-            results.append(result)
-        
-        return results
 
 
 # Register the connector
@@ -154,7 +154,7 @@ class EdgeGateway:
 
             # Convert to Sparkplug metric
             # This is a simplified conversion - in production you'd use proper metric mapping
-            metric_name = data_point.tag_name
+            metric_name = data_point.address
             metric_value = data_point.value
             timestamp = int(data_point.timestamp.timestamp() * 1000)  # Convert to ms
 
@@ -322,4 +322,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from .event_loop import install_event_loop_policy
+
+    install_event_loop_policy()
     asyncio.run(main())
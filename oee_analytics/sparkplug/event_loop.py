@@ -0,0 +1,36 @@
+"""
+Event Loop Bootstrap
+Installs uvloop as the asyncio event loop policy when it is available
+"""
+
+import asyncio
+import logging
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def install_event_loop_policy() -> bool:
+    """
+    Use uvloop for every loop created afterwards (e.g. by asyncio.run)
+
+    Must be called before the loop is created. Falls back to the default
+    asyncio loop when uvloop is not installed (e.g. on Windows).
+
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    if not UVLOOP_AVAILABLE:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop event loop policy installed")
+    return True
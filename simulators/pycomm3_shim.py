@@ -169,6 +169,18 @@ class SimulatorLogixDriver:
 
     def write(self, tag: str, value: Any) -> Tag:
         """Write a value to a tag (synchronous)"""
+        # Same as read(): a running loop in this thread can't nest another
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._sync_write(tag, value)
+
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return executor.submit(self._sync_write, tag, value).result()
+
+    def _sync_write(self, tag: str, value: Any) -> Tag:
+        """Synchronous write implementation"""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
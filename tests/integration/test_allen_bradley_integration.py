@@ -6,6 +6,7 @@ Tests the pycomm3-based connector against simulated and real PLCs.
 
 import pytest
 import asyncio
+import threading
 from datetime import datetime
 from typing import List, Dict, Any
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -14,7 +15,7 @@ from oee_analytics.sparkplug.connectors.allen_bradley import (
     AllenBradleyConnector,
     AllenBradleyConfig,
 )
-from oee_analytics.sparkplug.connectors.base import PLCDataPoint
+from oee_analytics.sparkplug.connectors.base import PLCConnectionError, PLCDataPoint, PLCTagDefinition
 
 
 class TestAllenBradleyConnectorBasics:
@@ -500,3 +501,219 @@ class TestAllenBradleyRealPLC:
         assert any("Program" in tag for tag in tags)
 
         await connector.disconnect()
+
+
+class TestAllenBradleyLegacyProbe:
+    """Shared status-file probe cache for SLC-500/PLC-5."""
+
+    @pytest.fixture
+    def slc_config(self):
+        """SLC-500 configuration with the background probe disabled."""
+        return AllenBradleyConfig(
+            host="192.168.1.120",
+            plc_family="SLC500",
+            legacy_pool_size=1,
+            verify_on_connect=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_probe_result_dropped_on_connect_failure(self, slc_config):
+        """A verified PLC is probed again after a failed connect."""
+        plc_key = ("SLC500", slc_config.host, slc_config.port)
+        AllenBradleyConnector._verified_legacy_plcs.discard(plc_key)
+
+        with patch('oee_analytics.sparkplug.connectors.allen_bradley.PLC') as mock_plc_class:
+            mock_plc = MagicMock()
+            mock_plc.Read.return_value = Mock(Status='Success')
+            mock_plc_class.return_value = mock_plc
+
+            first = AllenBradleyConnector(slc_config)
+            await first.connect()
+            await first._test_connection()
+            assert plc_key in AllenBradleyConnector._verified_legacy_plcs
+
+            # Reconnects skip the probe round trip
+            second = AllenBradleyConnector(slc_config)
+            await second.connect()
+            await second._test_connection()
+            assert mock_plc.Read.call_count == 1
+
+            mock_plc_class.side_effect = OSError("unreachable")
+            third = AllenBradleyConnector(slc_config)
+            with pytest.raises(PLCConnectionError):
+                await third.connect()
+            assert plc_key not in AllenBradleyConnector._verified_legacy_plcs
+
+            for connector in (first, second, third):
+                await connector.disconnect()
+
+
+class TestAllenBradleyReadManyPLCs:
+    """Concurrent reads across several PLCs."""
+
+    @pytest.mark.asyncio
+    async def test_results_yielded_in_completion_order(self):
+        """The fastest PLC comes first; a failed read yields an empty list."""
+        connectors = [
+            AllenBradleyConnector(AllenBradleyConfig(host=f"192.168.1.{100 + i}", plc_family="ControlLogix"))
+            for i in range(3)
+        ]
+        slow, failing, fast = connectors
+
+        def reply(delay, error=None):
+            async def read_multiple(addresses):
+                await asyncio.sleep(delay)
+                if error:
+                    raise error
+                return [PLCDataPoint(address, 1, data_type) for address, data_type in addresses]
+            return read_multiple
+
+        slow.read_multiple = reply(0.05)
+        failing.read_multiple = reply(0.02, PLCConnectionError("Not connected to PLC"))
+        fast.read_multiple = reply(0)
+        address_map = {connector: [("Counter", "DINT")] for connector in connectors}
+
+        results = [
+            (connector, data_points)
+            async for connector, data_points in AllenBradleyConnector.read_many_plcs(connectors, address_map)
+        ]
+
+        assert [connector for connector, _ in results] == [fast, failing, slow]
+        assert [len(data_points) for _, data_points in results] == [1, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending_reads(self):
+        """Reads still running when the consumer stops are cancelled."""
+        fast, stuck = (
+            AllenBradleyConnector(AllenBradleyConfig(host=f"192.168.1.{100 + i}", plc_family="ControlLogix"))
+            for i in range(2)
+        )
+        fast.read_multiple = AsyncMock(return_value=[])
+        cancelled = asyncio.Event()
+
+        async def never_answers(addresses):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stuck.read_multiple = never_answers
+        reads = AllenBradleyConnector.read_many_plcs([fast, stuck], {fast: [], stuck: []})
+
+        connector, _ = await reads.__anext__()
+        assert connector is fast
+        await reads.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+
+class TestAllenBradleySimulatorFastPath:
+    """Inline driver calls for the simulator."""
+
+    @pytest.fixture
+    def connector(self):
+        """Logix connector wired to a mock driver on the fast path."""
+        connector = AllenBradleyConnector(AllenBradleyConfig(host="127.0.0.1", plc_family="ControlLogix"))
+        connector._sync_fast_path = True
+        connector.driver = MagicMock(connected=True)
+        connector.driver.write.return_value = Mock(error=None)
+        connector._cache_driver_capabilities()
+        connector._run_blocking = AsyncMock(side_effect=AssertionError("executor used"))
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_read_and_write_skip_executor(self, connector):
+        """Driver calls run on the loop thread and stats are still counted."""
+        loop_thread = threading.get_ident()
+        call_threads = []
+
+        def read(tag):
+            call_threads.append(threading.get_ident())
+            return Mock(value=7, error=None)
+
+        connector.driver.read.side_effect = read
+
+        data_point = await connector.read_single("Counter", "DINT")
+        assert await connector.write_single("Counter", 8, "DINT") is True
+
+        assert data_point.value == 7 and data_point.error is None
+        assert call_threads == [loop_thread]
+        connector.driver.write.assert_called_once_with("Counter", 8)
+        connector._run_blocking.assert_not_awaited()
+        assert (connector.read_count, connector.write_count) == (1, 1)
+
+
+class TestAllenBradleyAddressValidation:
+    """Address patterns and memoized validation."""
+
+    def test_logix_and_legacy_patterns(self):
+        """Each family accepts its own address format only."""
+        logix = AllenBradleyConnector(AllenBradleyConfig(host="192.168.1.100", plc_family="ControlLogix"))
+        legacy = AllenBradleyConnector(AllenBradleyConfig(host="192.168.1.120", plc_family="SLC500"))
+
+        assert logix.validate_address("1Counter") is False
+        assert logix.validate_address("Line1.Counts[3]") is True
+        assert legacy.validate_address("n7:0") is True
+        assert legacy.validate_address("T4:0.PRE") is True
+        assert legacy.validate_address("Line1.Counts[3]") is False
+
+    def test_is_valid_address_memoizes_result(self):
+        """validate_address runs once per distinct address."""
+        connector = AllenBradleyConnector(AllenBradleyConfig(host="192.168.1.120", plc_family="SLC500"))
+
+        with patch.object(connector, 'validate_address', wraps=connector.validate_address) as validate:
+            assert connector.is_valid_address("N7:0") is True
+            assert connector.is_valid_address("N7:0") is True
+            assert connector.is_valid_address("X9") is False
+            assert connector.is_valid_address("X9") is False
+
+        assert validate.call_count == 2
+
+
+class TestAllenBradleyScanTimestamps:
+    """Data point timestamps during a read_all_tags scan."""
+
+    @pytest.mark.asyncio
+    async def test_scan_points_share_one_timestamp(self):
+        """Single reads in a scan reuse its timestamp; later reads get their own."""
+        connector = AllenBradleyConnector(AllenBradleyConfig(host="192.168.1.100", plc_family="ControlLogix"))
+        connector.driver = MagicMock(connected=True)
+        connector.driver.read.return_value = Mock(value=1, error=None)
+        connector._cache_driver_capabilities()
+        connector._run_blocking = AsyncMock(side_effect=lambda func, *args: func(*args))
+
+        async def read_one_by_one(addresses):
+            return [await connector.read_single(address, data_type) for address, data_type in addresses]
+
+        connector.read_multiple = read_one_by_one
+        connector.set_tags([
+            PLCTagDefinition(name=f"Tag{i}", address=f"Tag{i}", data_type="DINT") for i in range(3)
+        ])
+
+        data_points = await connector.read_all_tags()
+        await asyncio.sleep(0.001)
+        later = await connector.read_single("Tag0", "DINT")
+
+        assert len({dp.timestamp for dp in data_points}) == 1
+        assert later.timestamp > data_points[0].timestamp
+
+    @pytest.mark.asyncio
+    async def test_legacy_batch_shares_one_timestamp(self):
+        """Concurrent legacy reads of one read_multiple carry the same timestamp."""
+        connector = AllenBradleyConnector(AllenBradleyConfig(host="192.168.1.120", plc_family="SLC500"))
+        connector._legacy_pool = asyncio.Queue()
+        for _ in range(2):
+            connector._legacy_pool.put_nowait(MagicMock())
+        connector._cache_driver_capabilities()
+
+        async def slow_read(func, address):
+            await asyncio.sleep(0.002 * int(address[3:]))
+            return Mock(Status='Success', Value=1)
+
+        connector._run_blocking = slow_read
+
+        data_points = await connector.read_multiple([(f"N7:{i}", "INT") for i in range(4)])
+
+        assert [dp.value for dp in data_points] == [1, 1, 1, 1]
+        assert len({dp.timestamp for dp in data_points}) == 1
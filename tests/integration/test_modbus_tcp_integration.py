@@ -0,0 +1,160 @@
+"""
+Integration tests for Modbus TCP connector.
+
+Tests the pymodbus based connector against a mocked Modbus TCP client.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+pytest.importorskip("pymodbus")
+
+from oee_analytics.sparkplug.connectors.base import PLCConnectionConfig
+from oee_analytics.sparkplug.connectors.modbus_tcp import (
+    ModbusTCPConnector,
+    ModbusTCPConfig,
+)
+
+
+def register_response(registers):
+    """Successful register read response."""
+    response = MagicMock()
+    response.isError.return_value = False
+    response.registers = list(registers)
+    return response
+
+
+def write_response():
+    """Successful write response."""
+    response = MagicMock()
+    response.isError.return_value = False
+    return response
+
+
+@pytest.fixture
+def mock_modbus_client():
+    """Connected AsyncModbusTcpClient mock holding register values."""
+    with patch('oee_analytics.sparkplug.connectors.modbus_tcp.AsyncModbusTcpClient') as client_class:
+        client = MagicMock()
+        client.connect = AsyncMock(return_value=True)
+        client.connected = True
+        client.transport = None
+        client.read_holding_registers = AsyncMock(return_value=register_response([42]))
+        client.write_register = AsyncMock(return_value=write_response())
+        client_class.return_value = client
+        yield client
+
+
+def modbus_config(**overrides):
+    """Test configuration; keepalive disabled so no background task runs."""
+    settings = dict(host="192.168.0.10", port=502, unit_id=1, keepalive_interval=0)
+    settings.update(overrides)
+    return ModbusTCPConfig(**settings)
+
+
+class TestModbusReadCache:
+    """read_single result cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, mock_modbus_client):
+        """Every read goes to the device unless cache_ttl_ms is set."""
+        assert ModbusTCPConfig(host="192.168.0.10").cache_ttl_ms == 0
+
+        connector = ModbusTCPConnector(modbus_config())
+        await connector.connect()
+
+        await connector.read_single("40001", "INT16")
+        await connector.read_single("40001", "INT16")
+
+        assert mock_modbus_client.read_holding_registers.await_count == 2
+        await connector.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_cached_value_expires_after_ttl(self, mock_modbus_client):
+        """Reads within the TTL reuse the value; later reads hit the device."""
+        connector = ModbusTCPConnector(modbus_config(cache_ttl_ms=50))
+        await connector.connect()
+
+        first = await connector.read_single("40001", "INT16")
+        mock_modbus_client.read_holding_registers.return_value = register_response([43])
+        cached = await connector.read_single("40001", "INT16")
+
+        assert first.value == cached.value == 42
+        assert cached is not first
+        assert mock_modbus_client.read_holding_registers.await_count == 1
+
+        await asyncio.sleep(0.06)
+        fresh = await connector.read_single("40001", "INT16")
+
+        assert fresh.value == 43
+        assert mock_modbus_client.read_holding_registers.await_count == 2
+        await connector.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_overlapping_reads(self, mock_modbus_client):
+        """A write drops cached reads of the registers it touched only."""
+        connector = ModbusTCPConnector(modbus_config(cache_ttl_ms=60000))
+        await connector.connect()
+
+        await connector.read_single("40001", "INT16")
+        await connector.read_single("40002", "INT16")
+        assert mock_modbus_client.read_holding_registers.await_count == 2
+
+        assert await connector.write_single("40001", 7, "INT16") is True
+        mock_modbus_client.read_holding_registers.return_value = register_response([7])
+
+        written = await connector.read_single("40001", "INT16")
+        untouched = await connector.read_single("40002", "INT16")
+
+        assert written.value == 7
+        assert untouched.value == 42
+        assert mock_modbus_client.read_holding_registers.await_count == 3
+        await connector.disconnect()
+
+
+class TestModbusBlockReads:
+    """Coalesced register reads."""
+
+    @pytest.mark.asyncio
+    async def test_neighbouring_registers_read_in_one_request(self, mock_modbus_client):
+        """Adjacent tags share one request; distant ones get their own."""
+        memory = {0: 10, 1: 65535, 2: 0x3FC0, 3: 0x0000, 49: 500}
+
+        async def read_holding_registers(start, count, slave=None):
+            return register_response([memory.get(start + i, 0) for i in range(count)])
+
+        mock_modbus_client.read_holding_registers = AsyncMock(side_effect=read_holding_registers)
+        connector = ModbusTCPConnector(modbus_config())
+        await connector.connect()
+
+        data_points = await connector.read_multiple([
+            ("40001", "INT16"),
+            ("40050", "INT16"),
+            ("40002", "UINT16"),
+            ("40003", "FLOAT32"),
+        ])
+
+        assert [dp.value for dp in data_points] == [10, 500, 65535, 1.5]
+        assert [dp.address for dp in data_points] == ["40001", "40050", "40002", "40003"]
+        assert all(dp.error is None for dp in data_points)
+
+        requested = sorted(call.args[:2] for call in mock_modbus_client.read_holding_registers.await_args_list)
+        assert requested == [(0, 4), (49, 1)]
+        await connector.disconnect()
+
+
+class TestModbusConfig:
+    """ModbusTCPConfig construction."""
+
+    def test_from_base_keeps_connection_fields(self):
+        """A generic config upcasts with its fields and Modbus defaults."""
+        base = PLCConnectionConfig(host="192.168.0.10", port=1502, timeout=2.5, max_connections=3)
+
+        config = ModbusTCPConfig.from_base(base)
+
+        assert isinstance(config, ModbusTCPConfig)
+        assert (config.host, config.port, config.timeout, config.max_connections) == \
+            ("192.168.0.10", 1502, 2.5, 3)
+        assert config.unit_id == 1
+        assert config.cache_ttl_ms == 0
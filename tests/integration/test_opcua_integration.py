@@ -583,5 +583,75 @@ async def test_opcua_tag_configuration(
     await gateway.stop()
 
 
+
+@pytest.mark.asyncio
+async def test_opcua_batched_monitored_items(
+    opcua_simulator
+):
+    """
+    Test batched monitored item creation against the test server
+    """
+
+    from oee_analytics.sparkplug.connectors.opcua_client import (
+        OPCUAClient, OPCUAConfig, OPCUASecurityMode, OPCUAAuthMode, MonitoredItemConfig
+    )
+
+    config = OPCUAConfig(
+        host='localhost',
+        endpoint_url='opc.tcp://localhost:4840/oeetest/',
+        security_mode=OPCUASecurityMode.NONE,
+        auth_mode=OPCUAAuthMode.ANONYMOUS,
+        publishing_interval=100,
+    )
+
+    client = OPCUAClient(config)
+
+    # Track data changes
+    received = []
+
+    async def data_callback(data_point):
+        received.append(data_point)
+
+    client.data_callback = data_callback
+
+    assert await client.connect(), "Failed to connect to OPC-UA server"
+
+    # All test variables in one batch, plus a node the server must reject
+    variables = opcua_simulator['variables']
+    missing_node = f"ns={opcua_simulator['namespace']};s=DoesNotExist"
+    configs = [
+        MonitoredItemConfig(node_id=var.nodeid.to_string(), display_name=name, sampling_interval=100)
+        for name, var in variables.items()
+    ]
+    configs.append(MonitoredItemConfig(node_id=missing_node, display_name='missing'))
+
+    results = await client.add_monitored_items(configs)
+    assert results == [True] * len(variables) + [False]
+    assert missing_node not in client.monitored_items
+
+    # Server-assigned MonitoredItemIds are recorded as handles
+    handles = [client.monitored_items[c.node_id].handle for c in configs[:-1]]
+    assert all(isinstance(handle, int) for handle in handles)
+    assert len(set(handles)) == len(handles)
+    print(f"✅ Created {len(handles)} monitored items in one batch")
+
+    # The single-item wrapper reports rejections the same way
+    assert not await client.add_monitored_item(
+        MonitoredItemConfig(node_id=missing_node, display_name='missing')
+    )
+
+    # Data changes of batch-created items reach the callback
+    temp_var = variables['temperature']
+    await temp_var.write_value(81.5)
+    await asyncio.sleep(0.5)
+
+    temp_node_id = temp_var.nodeid.to_string()
+    assert any(dp.address == temp_node_id and dp.value == 81.5 for dp in received), \
+        f"No data change for {temp_node_id} in {received}"
+    print(f"✅ Received {len(received)} data change notifications")
+
+    await client.disconnect()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
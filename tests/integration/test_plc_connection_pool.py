@@ -0,0 +1,334 @@
+"""
+Integration tests for the shared PLC connection pool and connector helpers.
+
+Uses an in-memory connector registered with PLCConnectorFactory so the pool
+logic is exercised without a PLC or driver library.
+"""
+
+import pytest
+import asyncio
+from typing import Any, List, Tuple
+from unittest.mock import AsyncMock
+
+from oee_analytics.sparkplug.connectors.base import (
+    BasePLCConnector,
+    PLCConnectionConfig,
+    PLCConnectionError,
+    PLCConnectionPool,
+    PLCConnectorFactory,
+    PLCDataError,
+    PLCDataPoint,
+    PLCStatus,
+    PLCTagDefinition,
+    gather_health_checks,
+)
+
+
+class FakeConnector(BasePLCConnector):
+    """Connector that keeps its state in memory."""
+
+    instances: List['FakeConnector'] = []
+    fail_connect = False
+
+    def __init__(self, config, logger=None):
+        super().__init__(config, logger)
+        self.disconnect_calls = 0
+        FakeConnector.instances.append(self)
+
+    async def connect(self) -> bool:
+        if FakeConnector.fail_connect:
+            return False
+        self._update_status(PLCStatus.CONNECTED)
+        return True
+
+    async def disconnect(self) -> bool:
+        self.disconnect_calls += 1
+        self._update_status(PLCStatus.DISCONNECTED)
+        return True
+
+    async def read_single(self, address: str, data_type: str) -> PLCDataPoint:
+        if address == 'BROKEN':
+            raise PLCConnectionError("session lost")
+        await asyncio.sleep(0)
+        return PLCDataPoint(address, 1, data_type)
+
+    async def read_multiple(self, addresses: List[Tuple[str, str]]) -> List[PLCDataPoint]:
+        return [await self.read_single(a, t) for a, t in addresses]
+
+    async def write_single(self, address: str, value: Any, data_type: str) -> bool:
+        return True
+
+    async def write_multiple(self, writes: List[Tuple[str, Any, str]]) -> List[bool]:
+        return [True for _ in writes]
+
+    async def discover_tags(self) -> List[PLCTagDefinition]:
+        return []
+
+    def validate_address(self, address: str) -> bool:
+        return True
+
+
+@pytest.fixture
+def pool_config():
+    """Two-connection config for the fake PLC."""
+    return PLCConnectionConfig(host="10.0.0.5", max_connections=2)
+
+
+@pytest.fixture(autouse=True)
+def fake_connector_type():
+    """Register the fake connector and reset its bookkeeping."""
+    PLCConnectorFactory.register_connector('FAKE_POOL', FakeConnector)
+    FakeConnector.instances = []
+    FakeConnector.fail_connect = False
+    yield
+    PLCConnectorFactory._connector_types.pop('FAKE_POOL', None)
+    PLCConnectorFactory._pools.clear()
+
+
+class TestPLCConnectionPool:
+    """PLCConnectionPool behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_get_pool_reuses_pool_per_endpoint(self, pool_config):
+        """Same endpoint on the same loop shares one pool."""
+        pool = PLCConnectorFactory.get_pool('fake_pool', pool_config)
+        assert PLCConnectorFactory.get_pool('FAKE_POOL', pool_config) is pool
+
+        other = PLCConnectionConfig(host="10.0.0.6", max_connections=2)
+        assert PLCConnectorFactory.get_pool('FAKE_POOL', other) is not pool
+
+        await pool.close()
+        assert PLCConnectorFactory.get_pool('FAKE_POOL', pool_config) is not pool
+
+    def test_get_pool_is_per_event_loop(self, pool_config):
+        """Pools are not shared across event loops and dead loops are pruned."""
+        async def get():
+            return PLCConnectorFactory.get_pool('FAKE_POOL', pool_config)
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
+        assert first not in PLCConnectorFactory._pools.values()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_and_bounded(self, pool_config):
+        """Concurrent readers never open more than max_connections sessions."""
+        pool = PLCConnectorFactory.get_pool('FAKE_POOL', pool_config)
+
+        results = await asyncio.gather(*(pool.read_single(f"T{i}", 'INT') for i in range(20)))
+
+        assert [dp.address for dp in results] == [f"T{i}" for i in range(20)]
+        assert len(FakeConnector.instances) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_after_broken_connection(self):
+        """A discarded session frees its slot for a waiting caller."""
+        pool = PLCConnectionPool('FAKE_POOL', PLCConnectionConfig(host="10.0.0.5", max_connections=1))
+
+        async def broken_read():
+            async with pool.acquire() as connector:
+                await asyncio.sleep(0.01)
+                await connector.read_single('BROKEN', 'INT')
+
+        broken = asyncio.create_task(broken_read())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(pool.read_single('T1', 'INT'))
+
+        with pytest.raises(PLCConnectionError):
+            await broken
+        data_point = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert data_point.value == 1
+        assert FakeConnector.instances[0].disconnect_calls == 1
+        assert len(FakeConnector.instances) == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_releases_slot(self):
+        """A connector that fails to connect does not consume a slot."""
+        pool = PLCConnectionPool('FAKE_POOL', PLCConnectionConfig(host="10.0.0.5", max_connections=1))
+
+        FakeConnector.fail_connect = True
+        with pytest.raises(PLCConnectionError):
+            await pool.read_single('T1', 'INT')
+
+        FakeConnector.fail_connect = False
+        data_point = await asyncio.wait_for(pool.read_single('T1', 'INT'), timeout=1.0)
+        assert data_point.value == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_disconnects_borrowed_connections(self, pool_config):
+        """Closing the pool also disconnects connectors that are checked out."""
+        pool = PLCConnectorFactory.get_pool('FAKE_POOL', pool_config)
+        await pool.read_single('T1', 'INT')
+
+        async with pool.acquire() as borrowed:
+            async with pool.acquire() as idle_reused:
+                assert idle_reused is not borrowed
+            await pool.close()
+            assert borrowed.disconnect_calls == 1
+            assert not borrowed.is_connected()
+
+        # Returned after close: not pooled again or disconnected twice
+        assert borrowed.disconnect_calls == 1
+        assert all(c.disconnect_calls == 1 for c in FakeConnector.instances)
+
+        with pytest.raises(PLCConnectionError):
+            await pool.read_single('T1', 'INT')
+
+
+class TestGatherHealthChecks:
+    """gather_health_checks behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_failing_check_does_not_cancel_others(self):
+        """A check that raises or times out is reported, the rest still complete."""
+        healthy = FakeConnector(PLCConnectionConfig(host="10.0.0.5"))
+        await healthy.connect()
+
+        failing = FakeConnector(PLCConnectionConfig(host="10.0.0.6"))
+        failing.health_check = AsyncMock(side_effect=RuntimeError("probe crashed"))
+
+        async def never_answers():
+            await asyncio.sleep(10)
+
+        slow = FakeConnector(PLCConnectionConfig(host="10.0.0.7", timeout=0.01))
+        slow.health_check = never_answers
+
+        results = await gather_health_checks([healthy, failing, slow])
+
+        assert results[0]['connected'] is True
+        assert 'last_read_error' not in results[0]
+        assert results[1]['last_read_success'] is False
+        assert "probe crashed" in results[1]['last_read_error']
+        assert results[2]['last_read_success'] is False
+        assert "timed out" in results[2]['last_read_error']
+
+
+class TestTagDefinitions:
+    """Bulk tag loading."""
+
+    @pytest.mark.asyncio
+    async def test_discovered_tags_replace_existing(self):
+        """load_discovered_tags swaps in the discovered set in one pass."""
+        connector = FakeConnector(PLCConnectionConfig(host="10.0.0.5"))
+        connector.add_tag(PLCTagDefinition(name="old", address="OLD", data_type="INT"))
+        connector.remove_tag("old")
+        connector.add_tag(PLCTagDefinition(name="stale", address="STALE", data_type="INT"))
+
+        discovered = [
+            PLCTagDefinition(name=f"tag{i}", address=f"T{i}", data_type="REAL", scaling_factor=2.0)
+            for i in range(3)
+        ]
+        connector.discover_tags = AsyncMock(return_value=discovered)
+
+        assert await connector.load_discovered_tags() is discovered
+        assert list(connector.tags) == ["tag0", "tag1", "tag2"]
+        assert connector._tag_deletions == 0
+
+        data_points = await connector.read_all_tags()
+        assert [dp.value for dp in data_points] == [2.0, 2.0, 2.0]
+
+
+class TestTagScaling:
+    """Scaling and range clamping of tag reads."""
+
+    @pytest.fixture
+    def connector(self):
+        """Fake connector whose reads return the values in .raw by address."""
+        connector = FakeConnector(PLCConnectionConfig(host="10.0.0.5"))
+        connector.raw = {}
+
+        async def read_multiple(addresses):
+            return [PLCDataPoint(address, connector.raw[address], data_type) for address, data_type in addresses]
+
+        async def read_single(address, data_type):
+            return PLCDataPoint(address, connector.raw[address], data_type)
+
+        connector.read_multiple = read_multiple
+        connector.read_single = read_single
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_values_clamped_to_tag_range(self, connector):
+        """Scaled and unscaled values are clipped; open sides are not bounded."""
+        connector.set_tags([
+            PLCTagDefinition(name="scaled", address="A", data_type="REAL", scaling_factor=10.0, max_value=50.0),
+            PLCTagDefinition(name="low", address="B", data_type="INT", min_value=0),
+            PLCTagDefinition(name="in_range", address="C", data_type="INT", min_value=0, max_value=10),
+            PLCTagDefinition(name="open", address="D", data_type="REAL", scaling_offset=-100.0, max_value=0.0),
+            PLCTagDefinition(name="text", address="E", data_type="STRING"),
+        ])
+        connector.raw = {"A": 7, "B": -3, "C": 4, "D": 1, "E": "ok"}
+
+        data_points = await connector.read_all_tags()
+
+        assert [dp.value for dp in data_points] == [50.0, 0.0, 4, -99.0, "ok"]
+        assert type(data_points[2].value) is int
+
+        for tag_name, expected in zip(["scaled", "low", "in_range", "open"], [50.0, 0.0, 4, -99.0]):
+            assert (await connector.read_tag(tag_name)).value == expected
+
+    @pytest.mark.asyncio
+    async def test_non_numeric_reply_marks_point(self, connector):
+        """A string from a scaled numeric tag is flagged instead of raising."""
+        connector.set_tags([
+            PLCTagDefinition(name="scaled", address="A", data_type="INT", scaling_factor=2.0),
+            PLCTagDefinition(name="ok", address="B", data_type="INT", scaling_factor=2.0),
+        ])
+        connector.raw = {"A": "12", "B": 3}
+
+        single = await connector.read_tag("scaled")
+        scan = await connector.read_all_tags()
+
+        for data_point in (single, scan[0]):
+            assert data_point.value == "12"
+            assert data_point.quality == 0
+            assert "Non-numeric" in data_point.error
+        assert (scan[1].value, scan[1].quality, scan[1].error) == (6.0, 192, None)
+
+    @pytest.mark.asyncio
+    async def test_write_values_coerced_before_reverse_scaling(self, connector):
+        """Numeric strings are written scaled; anything else raises PLCDataError."""
+        connector.set_tags([
+            PLCTagDefinition(name="speed", address="A", data_type="REAL", scaling_factor=2.0, scaling_offset=4.0),
+            PLCTagDefinition(name="count", address="B", data_type="INT"),
+        ])
+        connector.write_single = AsyncMock(return_value=True)
+        connector.write_multiple = AsyncMock(return_value=[True, True])
+
+        assert await connector.write_tag("speed", "12") is True
+        connector.write_single.assert_awaited_once_with("A", 4.0, "REAL")
+
+        assert await connector.write_multiple_tags({"speed": "12", "count": 5}) == {"speed": True, "count": True}
+        connector.write_multiple.assert_awaited_once_with([("A", 4.0, "REAL"), ("B", 5, "INT")])
+
+        with pytest.raises(PLCDataError, match="speed"):
+            await connector.write_tag("speed", "fast")
+        with pytest.raises(PLCDataError, match="speed"):
+            await connector.write_multiple_tags({"speed": [1, 2]})
+
+
+class TestHealthCheck:
+    """BasePLCConnector.health_check probe read."""
+
+    @pytest.mark.asyncio
+    async def test_partial_probe_failure_is_not_success(self):
+        """One bad tag in the probe fails last_read_success; the ratio shows how many read."""
+        connector = FakeConnector(PLCConnectionConfig(host="10.0.0.5"))
+        await connector.connect()
+        connector.set_tags([
+            PLCTagDefinition(name=f"tag{i}", address=f"T{i}", data_type="INT") for i in range(4)
+        ])
+
+        health = await connector.health_check()
+        assert (health['last_read_success'], health['probe_ok_ratio']) == (True, 1.0)
+
+        connector.read_multiple = AsyncMock(return_value=[
+            PLCDataPoint(f"T{i}", None if i == 3 else 1, "INT", error="timeout" if i == 3 else None)
+            for i in range(4)
+        ])
+        health = await connector.health_check()
+        assert (health['last_read_success'], health['probe_ok_ratio']) == (False, 0.75)
@@ -603,3 +603,57 @@ class TestSiemensS7RealPLC:
         assert value.quality == "GOOD"
 
         await connector.disconnect()
+
+
+class TestSiemensS7BlockReads:
+    """Coalesced data block reads."""
+
+    @pytest.mark.asyncio
+    async def test_neighbouring_addresses_read_in_one_request(self):
+        """Addresses close together in one DB share a single read_area call."""
+        db1 = struct.pack('>h', -5) + struct.pack('>f', 2.5) + bytes([0b10])
+        db2 = struct.pack('>h', 300)
+
+        def read_area(area, db_number, start, length):
+            data = db1 if db_number == 1 else db2
+            return bytearray(data[start:start + length])
+
+        mock_client = MagicMock()
+        mock_client.get_connected.return_value = True
+        mock_client.read_area.side_effect = read_area
+
+        connector = SiemensS7Connector(SiemensS7Config(host="192.168.0.1"))
+        # Attach the mocked client directly; only the read path is under test
+        connector.s7_client = mock_client
+
+        data_points = await connector.read_multiple([
+            ("DB1,0", "INT"),
+            ("DB2,0", "INT"),
+            ("DB1,2", "REAL"),
+            ("DB1,X6.1", "BOOL"),
+        ])
+
+        assert [dp.value for dp in data_points] == [-5, 300, 2.5, True]
+        assert all(dp.error is None for dp in data_points)
+
+        requested = sorted(call.args[1:] for call in mock_client.read_area.call_args_list)
+        assert requested == [(1, 0, 7), (2, 0, 2)]
+
+    @pytest.mark.asyncio
+    async def test_scan_points_share_one_timestamp(self):
+        """Points from separate block reads of one scan share its timestamp."""
+        connector = SiemensS7Connector(SiemensS7Config(host="192.168.1.100"))
+        client = MagicMock()
+        client.get_connected.return_value = True
+        client.read_area.side_effect = lambda area, db_number, start, size: bytearray(size)
+        connector.s7_client = client
+        connector.set_tags([
+            PLCTagDefinition(name="a", address="DB1,0", data_type="INT"),
+            PLCTagDefinition(name="b", address="DB1,2", data_type="INT"),
+            PLCTagDefinition(name="c", address="DB9,500", data_type="INT"),
+        ])
+
+        data_points = await connector.read_all_tags()
+
+        assert len(data_points) == 3
+        assert len({dp.timestamp for dp in data_points}) == 1
@@ -0,0 +1,117 @@
+"""
+Integration tests for Sparkplug agent configuration validation.
+
+Covers the pydantic model constraints and ConfigurationManager's issue checks.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from oee_analytics.sparkplug.config import (
+    ConfigurationManager,
+    MetricMappingConfig,
+    MQTTConfig,
+    PLCConnectionConfig,
+    SparkplugAgentConfig,
+    TagConfig,
+    validate_tag_config,
+)
+
+
+def plc_connection(**overrides):
+    """Valid PLC connection settings with one tag."""
+    settings = dict(
+        id="plc_1",
+        type="siemens_s7",
+        host="192.168.1.100",
+        tags=[{"name": "count", "address": "DB1,2", "data_type": "INT"}],
+    )
+    settings.update(overrides)
+    return PLCConnectionConfig(**settings)
+
+
+class TestConfigModels:
+    """Field and model validators."""
+
+    def test_plc_type_is_normalized_and_checked(self):
+        """PLC types are upper-cased; unknown ones are rejected."""
+        assert plc_connection().type == "SIEMENS_S7"
+
+        with pytest.raises(ValidationError, match="Invalid PLC type"):
+            plc_connection(type="MODBUS_RTU")
+
+    def test_connection_ranges_are_enforced(self):
+        """Port and timeout outside their ranges are rejected."""
+        with pytest.raises(ValidationError):
+            plc_connection(port=70000)
+        with pytest.raises(ValidationError):
+            plc_connection(timeout=0)
+
+    def test_tag_scaling_and_range_validation(self):
+        """Zero scaling factors and inverted value ranges are rejected."""
+        with pytest.raises(ValidationError, match="Scaling factor cannot be zero"):
+            TagConfig(name="t", address="DB1,0", data_type="INT", scaling_factor=0)
+        with pytest.raises(ValidationError, match="Minimum value must be less than maximum value"):
+            TagConfig(name="t", address="DB1,0", data_type="INT", min_value=10, max_value=10)
+
+        tag = TagConfig(name="t", address="DB1,0", data_type="INT", min_value=0, max_value=10)
+        assert validate_tag_config(tag) == []
+
+    def test_agent_config_rejects_unknown_fields(self):
+        """The top-level config forbids fields it does not define."""
+        with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+            SparkplugAgentConfig(mqtt=MQTTConfig(broker_host="localhost"), plc_conections=[])
+
+
+class TestConfigurationManagerValidation:
+    """ConfigurationManager.validate_config and is_valid."""
+
+    def test_no_config_loaded(self):
+        """A manager without a configuration reports it."""
+        manager = ConfigurationManager()
+
+        assert manager.validate_config() == ["No configuration loaded"]
+        assert manager.is_valid() is False
+
+    def test_reports_every_issue(self):
+        """validate_config lists all issues; is_valid only needs the first."""
+        manager = ConfigurationManager()
+        manager.config = SparkplugAgentConfig(
+            mqtt=MQTTConfig(broker_host=""),
+            plc_connections=[plc_connection(), plc_connection(id="plc_2", tags=[])],
+            metric_mappings=[
+                MetricMappingConfig(machine_id="", sparkplug_metric_name="count", oee_metric_type="PART_COUNT")
+            ],
+        )
+
+        assert manager.validate_config() == [
+            "MQTT broker host not specified",
+            "PLC connection 1: no tags configured",
+            "Metric mapping 0: machine_id not specified",
+        ]
+        assert manager.is_valid() is False
+
+    def test_valid_config(self):
+        """A complete configuration has no issues."""
+        manager = ConfigurationManager()
+        manager.config = SparkplugAgentConfig(
+            mqtt=MQTTConfig(broker_host="localhost"),
+            plc_connections=[plc_connection()],
+        )
+
+        assert manager.validate_config() == []
+        assert manager.is_valid() is True
+
+
+class TestConfigurationFiles:
+    """Default config creation and save/load round trips."""
+
+    @pytest.mark.parametrize("suffix", [".json", ".yaml"])
+    def test_default_config_round_trip(self, tmp_path, suffix):
+        """The default config and a saved copy load back unchanged."""
+        manager = ConfigurationManager()
+        default_config = manager.create_default_config(str(tmp_path / f"default{suffix}"))
+        manager.save_config(str(tmp_path / f"saved{suffix}"))
+
+        assert ConfigurationManager(str(tmp_path / f"default{suffix}")).config == default_config
+        assert ConfigurationManager(str(tmp_path / f"saved{suffix}")).config == default_config